@@ -0,0 +1,171 @@
+import asyncio
+import bisect
+import itertools
+import math
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+# Priority classes (lower runs first)
+INTERACTIVE = 0
+BULK = 1
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BULK: "bulk"}
+
+
+class Overloaded(RuntimeError):
+    """Admission refused: the wait queue is full. `retry_after` is a hint in seconds."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounded, priority-ordered admission in front of the compute pool.
+
+    At most `capacity` jobs run at once (default: the compute pool's max_in_flight), and each
+    endpoint at most `limits[endpoint]` of them.
+    Requests that cannot start wait in a queue ordered by (priority, arrival); a freed slot is
+    handed straight to the first waiter whose endpoint is under its limit, so interactive
+    requests overtake bulk ones. A full queue rejects immediately with Overloaded instead
+    of letting work pile up until clients time out. Bulk requests may only fill
+    `bulk_queue_share` of the queue, keeping room for interactive traffic.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        limits: Optional[Dict[str, int]] = None,
+        bulk_queue_share: float = 0.5,
+    ):
+        if capacity is None:
+            from phoenix_engine.api.compute import get_compute_pool
+
+            capacity = get_compute_pool().max_in_flight
+        self.capacity = capacity
+        self.max_queue = max_queue if max_queue is not None else 4 * capacity
+        # Bulk batches may hold at most half the slots unless configured otherwise
+        self.limits = dict(limits) if limits is not None else {"batch": max(1, capacity // 2)}
+        self.bulk_queue_share = bulk_queue_share
+
+        self.active = 0
+        self.active_by_endpoint: Dict[str, int] = defaultdict(int)
+        # Sorted [priority, seq, endpoint, future] entries
+        self._waiters: list = []
+        self._seq = itertools.count()
+
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_last = 0.0
+        self.service_ewma = 0.1  # seconds per job, drives the Retry-After hint
+
+    def _can_run(self, endpoint: str) -> bool:
+        return (
+            self.active < self.capacity
+            and self.active_by_endpoint[endpoint] < self.limits.get(endpoint, self.capacity)
+        )
+
+    def _queue_limit(self, priority: int) -> int:
+        if priority == INTERACTIVE:
+            return self.max_queue
+        return int(self.max_queue * self.bulk_queue_share)
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue should have drained (at least 1)."""
+        return max(1, math.ceil(self.service_ewma * (len(self._waiters) + 1) / max(self.capacity, 1)))
+
+    def _start(self, endpoint: str):
+        self.active += 1
+        self.active_by_endpoint[endpoint] += 1
+
+    def _release(self, endpoint: str):
+        self.active -= 1
+        self.active_by_endpoint[endpoint] -= 1
+        for entry in list(self._waiters):
+            if not self._can_run(entry[2]):
+                continue
+            self._waiters.remove(entry)
+            if not entry[3].done():
+                self._start(entry[2])
+                entry[3].set_result(None)
+
+    def _record_wait(self, waited: float):
+        self.admitted += 1
+        self.wait_total += waited
+        self.wait_last = waited
+        self.wait_max = max(self.wait_max, waited)
+
+    @asynccontextmanager
+    async def admit(self, endpoint: str, priority: int = INTERACTIVE):
+        """Holds one slot for `endpoint` for the duration of the block; raises Overloaded."""
+        queued_at = time.perf_counter()
+        if self._can_run(endpoint):
+            self._start(endpoint)
+        else:
+            waiting = sum(1 for entry in self._waiters if entry[0] <= priority)
+            if waiting >= self._queue_limit(priority) or len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                raise Overloaded(f"Server busy: {len(self._waiters)} requests queued", self.retry_after())
+
+            future = asyncio.get_running_loop().create_future()
+            entry = [priority, next(self._seq), endpoint, future]
+            bisect.insort(self._waiters, entry)  # seq is unique, so the future is never compared
+            try:
+                await future
+            except BaseException:
+                if future.done() and not future.cancelled():
+                    self._release(endpoint)  # slot was handed over just before cancellation
+                elif entry in self._waiters:
+                    self._waiters.remove(entry)
+                raise
+
+        started = time.perf_counter()
+        self._record_wait(started - queued_at)
+        try:
+            yield
+        finally:
+            self.service_ewma += 0.2 * ((time.perf_counter() - started) - self.service_ewma)
+            self._release(endpoint)
+
+    def stats(self) -> Dict[str, Any]:
+        depth = defaultdict(int)
+        for entry in self._waiters:
+            depth[PRIORITY_NAMES.get(entry[0], str(entry[0]))] += 1
+        return {
+            "capacity": self.capacity,
+            "active": self.active,
+            "active_by_endpoint": dict(self.active_by_endpoint),
+            "queue_depth": len(self._waiters),
+            "queue_depth_by_priority": {name: depth[name] for name in PRIORITY_NAMES.values()},
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_seconds": {
+                "mean": self.wait_total / self.admitted if self.admitted else 0.0,
+                "max": self.wait_max,
+                "last": self.wait_last,
+            },
+            "service_seconds_ewma": self.service_ewma,
+        }
+
+
+_default_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _default_controller
+    if _default_controller is None:
+        _default_controller = AdmissionController()
+    return _default_controller
+
+
+def set_admission_controller(controller: AdmissionController):
+    """Replace the process-wide controller (e.g. with other limits or queue size)."""
+    global _default_controller
+    _default_controller = controller
+
@@ -1,19 +1,48 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from datetime import datetime
+from itertools import islice
+from typing import Optional
 import uvicorn
 
 # Import Core Engines & Models
 from phoenix_engine.engines.birth import BirthChartEngine as VedicChart
 from phoenix_engine.engines.match import MatchingEngine
-from phoenix_engine.core.models import ChartRequest, ChartOutput
+from phoenix_engine.core.models import ChartConfig, ChartRequest, ChartOutput, OutputOptions
 from phoenix_engine.domain.match import MatchRequest, MatchResult
+from phoenix_engine.api.admission import BULK, INTERACTIVE, Overloaded, get_admission_controller
+from phoenix_engine.api.coalesce import chart_etag, chart_key, etag_matches, get_single_flight, with_name
+from phoenix_engine.api.serialization import dumps, encoder_name
+from phoenix_engine.api.compute import ComputeUnavailable, get_compute_pool, match_report, natal_output, natal_report
+from phoenix_engine.core.result_cache import get_result_cache
+from phoenix_engine.infrastructure.astronomy.sky_cache import get_sky_cache
+from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
 from phoenix_engine.infrastructure.time.manager import localize_strict, AmbiguousTimeError, NonExistentTimeError
 
-app = FastAPI(title="Phoenix Engine V13 (Cosmic)", version="13.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-compute the rolling transit window so the first requests skip the ephemeris
+    get_sky_cache().warm(days=30)
+    # Build the TimezoneFinder once, before traffic, instead of per request
+    get_timezone_resolver().warm()
+    # Start the chart workers now so the first requests don't pay for process start-up
+    get_compute_pool().warm()
+    yield
+    get_compute_pool().shutdown()
+
+
+app = FastAPI(title="Phoenix Engine V13 (Cosmic)", version="13.0.0", lifespan=lifespan)
 
 # --- [Kai/Fix]: Added Health Check Endpoint ---
 @app.get("/")
-def read_root():
+async def read_root():
     """
     System Status Check.
     Used by 'test_smoke.py' to verify API availability.
@@ -26,41 +55,221 @@ def read_root():
 # ----------------------------------------------
 
 
-@app.post("/calculate", response_model=ChartOutput)
-def calculate_chart(req: ChartRequest):
+@app.get("/metrics")
+async def read_metrics():
+    """Admission queue depth, wait times and compute pool usage."""
+    return {
+        "admission": get_admission_controller().stats(),
+        "compute_pool": get_compute_pool().stats(),
+        "single_flight": get_single_flight().stats(),
+        "result_cache": get_result_cache().stats(),
+    }
+
+
+def _busy(e: Overloaded) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
+# Browser/CDN lifetime of GET /calculate responses (revalidated through the ETag afterwards)
+CHART_CACHE_MAX_AGE = 86400
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Opt-in (PHOENIX_FAST_RESPONSES=1 at startup): encode chart reports once (orjson when installed)
+# and return the bytes as-is, skipping the per-request ChartOutput revalidation. Schema
+# conformance is covered by tests.
+FAST_RESPONSES = _env_flag("PHOENIX_FAST_RESPONSES")
+
+# Optional ChartOutput sections with their defaults, so fast responses carry every key
+_OUTPUT_DEFAULTS = {name: field.default for name, field in ChartOutput.model_fields.items() if not field.is_required()}
+
+
+async def _calculate(req: ChartRequest, response: Response, if_none_match: Optional[str]):
+    # CPU-bound work runs in the compute pool; the event loop stays free for cheap endpoints
+    async def compute():
+        async with get_admission_controller().admit("calculate", INTERACTIVE):
+            return await get_compute_pool().run(natal_report, req)
+
     try:
-        bd = req.birth_data
-
-        # Use orchestrator to ensure full UTC/Upagraha/Panchanga logic
-        from phoenix_engine.core.orchestrator import ChartOrchestrator
-        orchestrator = ChartOrchestrator(req.config)
-
-        result = orchestrator.run_birth_chart(
-            name=req.name or "User",
-            year=bd.year,
-            month=bd.month,
-            day=bd.day,
-            hour=bd.hour,
-            minute=bd.minute,
-            second=bd.second if hasattr(bd, 'second') else 0,
-            lat=bd.lat,
-            lon=bd.lon,
-            tz=bd.timezone  # Orchestrator will resolve via TimezoneFinder
-        )
+        # A client holding the current representation gets 304 before any ephemeris work
+        etag = chart_etag(req, f"fast-{encoder_name()}" if FAST_RESPONSES else "validated")
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers={"ETag": etag, **_cache_headers(response)})
+        response.headers["ETag"] = etag
 
-        return result
+        # Identical concurrent requests (same instant, place and config) share one computation
+        report = with_name(await get_single_flight().do(chart_key(req), compute), req.name or "User")
+        if FAST_RESPONSES:
+            return Response(content=dumps({**_OUTPUT_DEFAULTS, **report}), media_type="application/json",
+                            headers=dict(response.headers))
+        return report
 
+    except Overloaded as e:
+        raise _busy(e)
+    except ComputeUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _cache_headers(response: Response) -> dict:
+    return {"Cache-Control": response.headers["Cache-Control"]} if "Cache-Control" in response.headers else {}
+
+
+@app.post("/calculate", response_model=ChartOutput)
+async def calculate_chart(req: ChartRequest, response: Response, if_none_match: Optional[str] = Header(None)):
+    return await _calculate(req, response, if_none_match)
+
+
+@app.get("/calculate", response_model=ChartOutput)
+async def calculate_chart_get(
+    response: Response,
+    year: int = Query(...),
+    month: int = Query(...),
+    day: int = Query(...),
+    hour: int = Query(...),
+    minute: int = Query(...),
+    lat: float = Query(...),
+    lon: float = Query(...),
+    timezone: str = Query("UTC", description="Ignored: the coordinates decide the timezone"),
+    name: str = Query("User"),
+    ayanamsa: Optional[str] = Query(None),
+    house_system: Optional[str] = Query(None),
+    node_type: Optional[str] = Query(None),
+    sections: Optional[str] = Query(None, description="Comma-separated output sections, e.g. 'vargas,dashas'"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Cacheable twin of POST /calculate: the chart is addressed by its query string, so browser
+    and CDN caches can store it, and revalidation through If-None-Match costs no computation.
+    """
+    config = {k: v for k, v in {"ayanamsa": ayanamsa, "house_system": house_system, "node_type": node_type}.items() if v}
+    if sections is not None:
+        wanted = {s.strip() for s in sections.split(",") if s.strip()}
+        unknown = wanted - {f[len("include_"):] for f in OutputOptions.model_fields if f.startswith("include_")}
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown sections: {', '.join(sorted(unknown))}")
+        config["output"] = {
+            f: f[len("include_"):] in wanted for f in OutputOptions.model_fields if f.startswith("include_")
+        }
+    try:
+        req = ChartRequest(
+            birth_data={"year": year, "month": month, "day": day, "hour": hour, "minute": minute,
+                        "timezone": timezone, "lat": lat, "lon": lon},
+            config=ChartConfig(**config),
+            name=name,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+    response.headers["Cache-Control"] = f"public, max-age={CHART_CACHE_MAX_AGE}"
+    return await _calculate(req, response, if_none_match)
+
+
+# --- Batch endpoint limits ---
+BATCH_MAX_ITEMS = 1000     # larger bodies are rejected with 413
+BATCH_MAX_BYTES = 4 << 20  # ~4 KB per item; larger bodies are rejected with 413 before parsing
+BATCH_MAX_IN_FLIGHT = 8    # charts computed concurrently per batch request
+
+
+async def _read_batch_body(request: Request) -> bytes:
+    """Request body, refused with 413 once it exceeds BATCH_MAX_BYTES (declared or streamed)."""
+    too_large = HTTPException(status_code=413, detail=f"Batch body larger than {BATCH_MAX_BYTES} bytes")
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > BATCH_MAX_BYTES:
+        raise too_large
+    chunks, size = [], 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > BATCH_MAX_BYTES:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _parse_batch_body(body: bytes, content_type: str) -> list:
+    """
+    JSON array of ChartRequest objects, or NDJSON (one object per line). NDJSON parsing stops
+    at item BATCH_MAX_ITEMS + 1, which is enough for the caller to reject the batch.
+    """
+    text = body.decode("utf-8")
+    if "ndjson" not in content_type and text.lstrip().startswith("["):
+        items = json.loads(text)
+    else:
+        lines = (line for line in text.splitlines() if line.strip())
+        items = [json.loads(line) for line in islice(lines, BATCH_MAX_ITEMS + 1)]
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array or NDJSON lines of chart requests")
+    return items
+
+
+async def _batch_item(index: int, raw) -> dict:
+    """One NDJSON result line: {"index", "result"} or {"index", "error"}."""
+    try:
+        req = ChartRequest.model_validate(raw)
+    except ValidationError as e:
+        return {"index": index, "status": 422, "error": e.errors(include_url=False, include_context=False)}
+    async def compute():
+        async with get_admission_controller().admit("batch", BULK):
+            return await get_compute_pool().run(natal_report if FAST_RESPONSES else natal_output, req)
+
+    try:
+        result = await get_single_flight().do("batch:" + chart_key(req), compute)
+        return {"index": index, "status": 200, "result": with_name(result, req.name or "User")}
+    except Overloaded as e:
+        return {"index": index, "status": 503, "error": str(e), "retry_after": e.retry_after}
+    except ComputeUnavailable as e:
+        return {"index": index, "status": 503, "error": str(e)}
+    except Exception as e:
+        return {"index": index, "status": 500, "error": str(e)}
+
+
+@app.post("/calculate/batch")
+async def calculate_chart_batch(request: Request):
+    """
+    Many charts in one request. The body is a JSON array or NDJSON of ChartRequest objects;
+    the response streams one NDJSON line per item, in completion order, tagged with the
+    item's index. A failing item produces an error line and never aborts the batch.
+    """
+    try:
+        items = _parse_batch_body(await _read_batch_body(request), request.headers.get("content-type", ""))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {e}")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch too large: {len(items)} > {BATCH_MAX_ITEMS} items")
+
+    async def stream():
+        pending = set()
+        for index, raw in enumerate(items):
+            if len(pending) >= BATCH_MAX_IN_FLIGHT:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield dumps(task.result()) + b"\n"
+            pending.add(asyncio.ensure_future(_batch_item(index, raw)))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield dumps(task.result()) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @app.post("/match", response_model=MatchResult)
-def calculate_match(req: MatchRequest):
+async def calculate_match(req: MatchRequest):
     try:
-        engine = MatchingEngine()
-        return engine.process(req)
+        async with get_admission_controller().admit("match", INTERACTIVE):
+            return await get_compute_pool().run(match_report, req)
+    except Overloaded as e:
+        raise _busy(e)
+    except ComputeUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         import traceback
         traceback.print_exc()
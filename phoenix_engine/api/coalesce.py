@@ -0,0 +1,99 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import swisseph as swe
+
+from phoenix_engine import __version__
+from phoenix_engine.core.models import ChartRequest
+from phoenix_engine.infrastructure.time.offsets import get_offset_table
+from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
+
+
+def chart_key(req: ChartRequest) -> str:
+    """
+    Canonical identity of the chart a request asks for: UTC Julian Day, location and the full
+    config (ayanamsa, house system, nodes, dashas and the requested output sections). The
+    display name and the ignored timezone string are left out, so they never split a key.
+    """
+    bd = req.birth_data
+    zone = get_timezone_resolver().timezone_at(bd.lat, bd.lon) or "UTC"
+    dt_utc = get_offset_table(zone).to_utc(
+        datetime(bd.year, bd.month, bd.day, bd.hour, bd.minute, getattr(bd, "second", 0) or 0)
+    )
+    hour = dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0
+    canonical = {
+        "jd_ut": f"{swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, hour):.8f}",
+        "lat": f"{bd.lat:.6f}",
+        "lon": f"{bd.lon:.6f}",
+        "chart_type": req.chart_type,
+        "config": req.config.model_dump(mode="json") if req.config is not None else None,
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def chart_etag(req: ChartRequest, representation: str = "validated") -> str:
+    """
+    Strong ETag of the /calculate response: chart identity, display name, engine version and
+    the encoding that produced the body, since each encoder writes its own bytes.
+    """
+    identity = f"{__version__}:{chart_key(req)}:{req.name or 'User'}:{representation}"
+    return '"' + hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 prescribes for this header)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def with_name(report: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Shallow copy of a shared report carrying this caller's display name."""
+    return {**report, "meta": {**report.get("meta", {}), "name": name}}
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent computations.
+
+    The first caller for a key starts the computation as its own task; callers arriving while
+    it runs await that same task instead of starting another. The task is shielded, so a
+    disconnecting caller never cancels the work the others are waiting on. Nothing is kept
+    once the task finishes (caching results is a separate concern).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._inflight), "leaders": self.leaders, "coalesced": self.coalesced}
+
+
+_default_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _default_flight
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+import swisseph as swe
+
+from phoenix_engine.core.models import ChartOutput, ChartRequest
+from phoenix_engine.domain.match import MatchRequest, MatchResult
+
+
+class ComputeUnavailable(RuntimeError):
+    """The compute pool cannot take the job (workers crashed or the pool is shut down)."""
+
+
+def natal_report(req: ChartRequest) -> Dict[str, Any]:
+    """Natal report in the ChartOutput layout (run inside a compute worker)."""
+    from phoenix_engine.core.orchestrator import ChartOrchestrator
+
+    bd = req.birth_data
+    # Only the plugins needed for req.config.output are executed
+    orchestrator = ChartOrchestrator(req.config)
+    return orchestrator.run_natal_analysis(
+        name=req.name or "User",
+        year=bd.year,
+        month=bd.month,
+        day=bd.day,
+        hour=bd.hour,
+        minute=bd.minute,
+        second=bd.second if hasattr(bd, 'second') else 0,
+        lat=bd.lat,
+        lon=bd.lon,
+        tz=bd.timezone,  # Orchestrator resolves the zone from the coordinates
+    )
+
+
+def natal_output(req: ChartRequest) -> Dict[str, Any]:
+    """natal_report validated against ChartOutput and dumped to JSON-ready data."""
+    return ChartOutput.model_validate(natal_report(req)).model_dump(mode="json")
+
+
+def match_report(req: MatchRequest) -> MatchResult:
+    from phoenix_engine.engines.match import MatchingEngine
+
+    return MatchingEngine().process(req)
+
+
+def _warm_worker():
+    """Process initializer: Swiss Ephemeris state and the timezone finder are built once."""
+    from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
+
+    swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
+    get_timezone_resolver().warm()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class ComputePool:
+    """
+    Runs CPU-bound chart work off the event loop.
+
+    Jobs go to a process pool of warm workers (workers=0 runs them on the event loop's
+    default thread executor instead, e.g. for tests). At most `max_in_flight` jobs are
+    submitted at once; later callers wait on a semaphore instead of piling up inside the
+    executor queue. A crashed pool is rebuilt on the next job.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_in_flight = max_in_flight or max(self.workers, 1) * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        self.in_flight = 0
+
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+            return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # One semaphore per event loop (TestClient and uvicorn reloads run fresh loops)
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Awaitable result of fn(*args) computed in the pool."""
+        async with self._semaphore():
+            loop = asyncio.get_running_loop()
+            self.in_flight += 1
+            try:
+                return await loop.run_in_executor(self.executor, fn, *args)
+            except BrokenProcessPool:
+                self._reset()
+                raise ComputeUnavailable("Compute worker crashed; the pool has been restarted")
+            finally:
+                self.in_flight -= 1
+
+    def warm(self):
+        """Starts every worker now (running its initializer) instead of on the first requests."""
+        if self.executor is not None:
+            for future in [self.executor.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+
+    def _reset(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        self._reset()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+        }
+
+
+_default_pool = ComputePool()
+
+
+def get_compute_pool() -> ComputePool:
+    return _default_pool
+
+
+def set_compute_pool(pool: ComputePool):
+    """Replace the process-wide compute pool (e.g. with a different worker count)."""
+    global _default_pool
+    _default_pool.shutdown()
+    _default_pool = pool
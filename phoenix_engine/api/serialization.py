@@ -0,0 +1,58 @@
+import json
+import math
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+try:  # optional: pip install phoenix_engine[fast]
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Types the pipeline leaves in reports (models, enums, numpy scalars, dates)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):  # numpy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def encoder_name() -> str:
+    """Which encoder dumps() uses; its output bytes differ between the two."""
+    return "orjson" if orjson is not None else "json"
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of `obj` as plain JSON types, with NaN and infinities replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (str, int)):
+        return obj
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return _finite(_default(obj))
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    One-pass JSON encoding of a pipeline report, straight to bytes. Uses orjson when it is
+    installed and the standard library otherwise; both write int dict keys as strings and
+    NaN/infinities as null.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    try:
+        return json.dumps(obj, default=_default, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    except ValueError:
+        # Rare non-finite value: a second pass maps it to null, as orjson does
+        return json.dumps(_finite(obj), separators=(",", ":"), allow_nan=False).encode("utf-8")
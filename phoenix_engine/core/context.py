@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional, Union
 from phoenix_engine.core.config import ChartConfig
 from phoenix_engine.domain.celestial import PlanetPosition
 from phoenix_engine.domain.input import BirthData
+from phoenix_engine.infrastructure.astronomy.cache import EphemerisCache
+from phoenix_engine.infrastructure.astronomy.swiss import sidereal_mode_for
 
 
 class ChartContext:
@@ -27,10 +29,17 @@ class ChartContext:
         self._houses: Union[List[float], Dict[int, Any]] = []  # Cusp longitudes (1-12)
         self._ascendant: float = 0.0
 
+        # Request-scoped Swiss Ephemeris memo shared by every engine of this chart
+        self.ephemeris = EphemerisCache(sidereal_mode_for(getattr(config, "ayanamsa", None)))
+
         # Analysis Containers (Plugins will populate these)
         self.analysis: Dict[str, Any] = {}
         self.meta: Dict[str, Any] = {}
 
+        # Lazy period trees and interval indexes by dasha system (kept off `analysis`, never serialized)
+        self.dasha_trees: Dict[str, Any] = {}
+        self.dasha_indexes: Dict[str, Any] = {}
+
     @property
     def birth_data(self) -> BirthData:
         return self._birth_data
@@ -33,18 +33,41 @@ class ChartFactory:
         """
         Build processing pipeline based on type.
         Imports are inside to avoid import cycles.
+        Order is informational only; PluginScheduler orders plugins by provides/requires.
         """
         from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
         from phoenix_engine.plugins.transit_plugin import TransitAnalysisPlugin
         from phoenix_engine.plugins.tajaka_plugin import TajakaPlugin
+        from phoenix_engine.plugins.ashtakavarga_plugin import AshtakavargaPlugin
 
         pipeline = []
 
         if pipeline_type == "BIRTH":
             pipeline.append(BirthChartPlugin(config))
 
+        elif pipeline_type == "NATAL":
+            from phoenix_engine.plugins.vargas import VargaPlugin
+            from phoenix_engine.plugins.strength import StrengthPlugin
+            from phoenix_engine.plugins.jaimini_plugin import JaiminiIndicatorsPlugin
+            from phoenix_engine.plugins.timing import PanchangaPlugin, TimingPlugin
+            from phoenix_engine.plugins.advanced_dashas import AdvancedDashasPlugin
+            from phoenix_engine.plugins.doshas.kuja import KujaDoshaPlugin
+            from phoenix_engine.plugins.doshas.sarpa import KalaSarpaPlugin
+
+            pipeline.append(BirthChartPlugin(config))
+            pipeline.append(VargaPlugin(config))
+            pipeline.append(StrengthPlugin(config))
+            pipeline.append(AshtakavargaPlugin(config))
+            pipeline.append(JaiminiIndicatorsPlugin(config))
+            pipeline.append(PanchangaPlugin(config))
+            pipeline.append(TimingPlugin(config))
+            pipeline.append(AdvancedDashasPlugin(config))
+            pipeline.append(KujaDoshaPlugin(config))
+            pipeline.append(KalaSarpaPlugin(config))
+
         elif pipeline_type == "TRANSIT":
             pipeline.append(BirthChartPlugin(config))
+            pipeline.append(AshtakavargaPlugin(config))
             pipeline.append(TransitAnalysisPlugin(config))
 
         elif pipeline_type == "ANNUAL":
@@ -52,3 +75,10 @@ class ChartFactory:
             pipeline.append(TajakaPlugin(config))
 
         return pipeline
+
+    @staticmethod
+    def create_scheduler(pipeline_type: str, config: ChartConfig, max_workers: int = 4):
+        """Pipeline wrapped in a dependency-aware PluginScheduler."""
+        from phoenix_engine.core.scheduler import PluginScheduler
+
+        return PluginScheduler(ChartFactory.create_pipeline(pipeline_type, config), max_workers=max_workers)
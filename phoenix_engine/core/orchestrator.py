@@ -1,15 +1,48 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 import pytz
-from timezonefinder import TimezoneFinder
+import swisseph as swe
 
 from phoenix_engine.core.config import ChartConfig
 from phoenix_engine.core.context import ChartContext
 from phoenix_engine.core.factory import ChartFactory
+from phoenix_engine.core.result_cache import get_result_cache
+from phoenix_engine.core.scheduler import output_targets, requested_targets
 from phoenix_engine.domain.input import BirthData
 from phoenix_engine.engines.birth import BirthChartEngine
+from phoenix_engine.infrastructure.astronomy.swiss import sidereal_mode_for
 from phoenix_engine.infrastructure.time.manager import TimeEngine
+from phoenix_engine.infrastructure.time.offsets import get_offset_table, local_to_utc
+from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
+
+
+def _naive_datetime(record: Mapping[str, Any]) -> datetime:
+    return datetime(
+        record["year"], record["month"], record["day"],
+        record["hour"], record["minute"], record.get("second") or 0,
+    )
+
+
+def _init_batch_worker(ephe_path: Optional[str], sidereal_mode: int):
+    """Per-process Swiss Ephemeris setup for run_birth_charts_batch workers."""
+    if ephe_path:
+        swe.set_ephe_path(str(ephe_path))
+    swe.set_sid_mode(sidereal_mode, 0, 0)
+
+
+def _run_batch_chunk(config: ChartConfig, chunk: List[tuple]) -> List[Tuple[int, Any]]:
+    orchestrator = ChartOrchestrator(config)
+    results = []
+    for index, name, dt_utc, zone, lat, lon, original_input in chunk:
+        try:
+            results.append((index, orchestrator._birth_chart_report(name, dt_utc, zone, lat, lon, original_input)))
+        except Exception as e:
+            results.append((index, e))
+    return results
 
 
 class ChartOrchestrator:
@@ -18,9 +51,34 @@ class ChartOrchestrator:
     Authority: Enforces Timezone Truth via Coordinates (Lat/Lon).
     """
 
-    def __init__(self, config: ChartConfig):
+    def __init__(self, config: ChartConfig, use_result_cache: bool = True):
         self.config = config
-        self.tf = TimezoneFinder()  # The oracle of timezones
+        self.tz_resolver = get_timezone_resolver()  # The oracle of timezones (shared, cached)
+        # Finished reports keyed by (UTC instant, location, config); None recomputes every call
+        self.result_cache = get_result_cache() if use_result_cache else None
+
+    def _cached(
+        self, kind: str, dt_utc: datetime, lat: float, lon: float, compute, complete=None, **extra
+    ) -> Dict[str, Any]:
+        """
+        compute() through the result cache (a hit returns a private copy). Reports failing
+        `complete(report)` are returned but never stored, so a plugin error is not replayed.
+        """
+        if self.result_cache is None:
+            return compute()
+        key = self.result_cache.key(kind, dt_utc, lat, lon, self.config, **extra)
+        report = self.result_cache.get(key)
+        if report is None:
+            report = compute()
+            if complete is None or complete(report):
+                self.result_cache.put(key, report)
+        return report
+
+    @staticmethod
+    def _with_identity(report: Dict[str, Any], name: str, original_input: str) -> Dict[str, Any]:
+        # Cached reports are shared across profiles with the same instant and place
+        report.setdefault("meta", {}).update({"name": name, "original_input": original_input})
+        return report
 
     def _resolve_utc_datetime(
         self,
@@ -39,24 +97,16 @@ class ChartOrchestrator:
         Returns (dt_utc, resolved_timezone_str).
         """
         # 1. Determine Timezone from Geometry (The only truth)
-        timezone_str = self.tf.timezone_at(lng=lon, lat=lat)
+        timezone_str = self.tz_resolver.timezone_at(lat, lon)
         if not timezone_str:
             # Fallback only if coordinates are in the middle of the ocean/unknown
             # Ideally raise error, but for stability we default to UTC
             timezone_str = "UTC"
 
-        # 2. Localize the naive input
-        local_tz = pytz.timezone(timezone_str)
+        # 2. Localize the naive input and convert to absolute UTC
+        # (compiled offset table; DST gaps/overlaps resolve like pytz's localize(is_dst=False))
         dt_naive = datetime(year, month, day, hour, minute, second)
-
-        try:
-            dt_aware = local_tz.localize(dt_naive)
-        except Exception:
-            # Handle non-existent times (DST gaps) strictly
-            dt_aware = local_tz.localize(dt_naive, is_dst=None)
-
-        # 3. Convert to Absolute UTC
-        dt_utc = dt_aware.astimezone(pytz.UTC)
+        dt_utc = get_offset_table(timezone_str).to_utc(dt_naive)
 
         return dt_utc, timezone_str
 
@@ -82,7 +132,22 @@ class ChartOrchestrator:
         dt_utc, resolved_tz = self._resolve_utc_datetime(
             year, month, day, hour, minute, second, lat, lon
         )
+        original_input = f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
+        return self._birth_chart_report(name, dt_utc, resolved_tz, lat, lon, original_input)
+
+    def _birth_chart_report(
+        self, name: str, dt_utc: datetime, resolved_tz: str, lat: float, lon: float, original_input: str
+    ) -> Dict[str, Any]:
+        """Steps 2-3 of run_birth_chart, from an already resolved UTC instant."""
+        report = self._cached(
+            "birth", dt_utc, lat, lon,
+            lambda: self._compute_birth_chart(name, dt_utc, resolved_tz, lat, lon, original_input),
+        )
+        return self._with_identity(report, name, original_input)
 
+    def _compute_birth_chart(
+        self, name: str, dt_utc: datetime, resolved_tz: str, lat: float, lon: float, original_input: str
+    ) -> Dict[str, Any]:
         # Step 2: Inject UTC components into the Engine
         # NOTE: We pass the converted UTC year/month/day/time to the engine.
         # The engine must treat this as UTC (tz_offset=0).
@@ -105,7 +170,7 @@ class ChartOrchestrator:
         report["meta"].update(
             {
                 "name": name,
-                "original_input": f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}",
+                "original_input": original_input,
                 "calculated_utc": dt_utc.isoformat(),
                 "geo_timezone": resolved_tz,  # The resolved truth
                 "location": {"lat": lat, "lon": lon},
@@ -115,30 +180,84 @@ class ChartOrchestrator:
 
         return report
 
-    def run_annual_forecast(
+    def _resolve_utc_batch(self, records: List[Mapping[str, Any]]) -> List[Any]:
+        """
+        Bulk _resolve_utc_datetime: zones come from the shared resolver, then every zone's
+        records are localized together through its compiled offset table. Each entry is
+        (dt_utc, zone, naive local datetime), or the exception raised by an invalid record.
+        """
+        resolved: List[Any] = [None] * len(records)
+        by_zone: Dict[str, List[Tuple[int, datetime]]] = defaultdict(list)
+        for index, record in enumerate(records):
+            try:
+                naive = _naive_datetime(record)
+                zone = self.tz_resolver.timezone_at(record["lat"], record["lon"]) or "UTC"
+            except (KeyError, TypeError, ValueError) as e:
+                resolved[index] = e  # invalid record, reported instead of a report
+                continue
+            by_zone[zone].append((index, naive))
+
+        for zone, entries in by_zone.items():
+            utc, _, _ = local_to_utc(zone, [naive for _, naive in entries])
+            for (index, naive), dt in zip(entries, utc.astype(datetime)):
+                resolved[index] = (dt.replace(tzinfo=pytz.UTC), zone, naive)
+        return resolved
+
+    def run_birth_charts_batch(
         self,
-        name: str,
-        year: int,
-        month: int,
-        day: int,
-        hour: int,
-        minute: int,
-        second: int,
-        lat: float,
-        lon: float,
-        target_year: int,
-        tz: str | None = None,
-    ) -> Dict[str, Any]:
+        records: Iterable[Mapping[str, Any]],
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+        ephe_path: Optional[str] = None,
+    ) -> Iterator[Tuple[int, Any]]:
         """
-        Execute the annual (Varshaphal) pipeline.
-        Refactored to use the new ChartContext class.
+        run_birth_chart over many subjects. Each record is a mapping with the run_birth_chart
+        arguments (name and second optional). Yields (record index, report) as chunks finish,
+        so results arrive out of order; a record that fails yields its exception instead of a
+        report and the batch carries on.
+
+        Records are sorted by zone, place and date before chunking so that each worker's
+        rise/set and sky caches see neighbouring subjects. workers <= 1 runs in-process.
+        chunk_size must be at least 1 (ValueError otherwise, before any record is processed).
         """
-        # Step 1: Resolve True UTC Time
-        dt_utc, resolved_tz = self._resolve_utc_datetime(
-            year, month, day, hour, minute, second, lat, lon
-        )
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        records = list(records)
+        resolved = self._resolve_utc_batch(records)
+
+        items = []
+        for index, (record, entry) in enumerate(zip(records, resolved)):
+            if isinstance(entry, Exception):
+                yield index, entry
+                continue
+            dt_utc, zone, local = entry
+            items.append((
+                index, record.get("name") or "User", dt_utc, zone, record["lat"], record["lon"],
+                f"{local.year:04d}-{local.month:02d}-{local.day:02d} "
+                f"{local.hour:02d}:{local.minute:02d}:{local.second:02d}",
+            ))
+        items.sort(key=lambda item: (item[3], round(item[4], 1), round(item[5], 1), item[2]))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
 
-        # Step 2: Prepare Strict Context
+        workers = os.cpu_count() if workers is None else workers
+        sidereal_mode = sidereal_mode_for(getattr(self.config, "ayanamsa", None))
+        if workers <= 1 or len(chunks) <= 1:
+            _init_batch_worker(ephe_path, sidereal_mode)
+            for chunk in chunks:
+                yield from _run_batch_chunk(self.config, chunk)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_batch_worker,
+            initargs=(ephe_path, sidereal_mode),
+        ) as pool:
+            futures = [pool.submit(_run_batch_chunk, self.config, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def _build_context(self, name: str, dt_utc: datetime, resolved_tz: str, lat: float, lon: float) -> ChartContext:
+        """Strict UTC ChartContext with jd_ut set by the TimeEngine."""
         # Create BirthData using the CALCULATED UTC time
         birth_data = BirthData(
             year=dt_utc.year,
@@ -163,21 +282,125 @@ class ChartOrchestrator:
         ctx.second = dt_utc.second
         ctx.latitude = lat
         ctx.longitude = lon
-        ctx.target_year = target_year
 
-        # Step 3: Initialize Time via TimeEngine
+        # Initialize Time via TimeEngine
         time_engine = TimeEngine()
         # Ensure TimeEngine accepts the UTC datetime correctly
         ctx.jd_ut = time_engine.get_julian_day(dt_utc)
+        return ctx
 
-        # Inject Target Context
-        # Note: target_year logic remains, assuming Tajaka calculates exact return
-        ctx.analysis["target_year"] = target_year
+    def run_natal_analysis(
+        self,
+        name: str,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        lat: float,
+        lon: float,
+        tz: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Full natal report (ChartOutput layout) through the plugin pipeline.
+        Only the plugins needed for the sections enabled in config.output are executed.
+        """
+        dt_utc, resolved_tz = self._resolve_utc_datetime(
+            year, month, day, hour, minute, second, lat, lon
+        )
+        original_input = f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
 
-        # Step 4: Execute Pipeline
-        pipeline = ChartFactory.create_pipeline("ANNUAL", self.config)
-        for plugin in pipeline:
-            # Plugins now interact with a Class, not a Dict
-            plugin.execute(ctx)
+        def compute() -> Dict[str, Any]:
+            ctx = self._build_context(name, dt_utc, resolved_tz, lat, lon)
 
-        return ctx.analysis
+            output = getattr(self.config, "output", None)
+            # Sections left at their defaults are only recorded in meta; explicit ones also warn
+            ChartFactory.create_scheduler("NATAL", self.config).run(
+                ctx, targets=output_targets(output), strict=False, requested=requested_targets(output)
+            )
+
+            return self._chart_output(ctx, {
+                "name": name,
+                "original_input": original_input,
+                "calculated_utc": dt_utc.isoformat(),
+                "geo_timezone": resolved_tz,
+                "location": {"lat": lat, "lon": lon},
+                "jd_ut": ctx.jd_ut,
+                "pipeline": ctx.meta.get("pipeline", {}).get("stages", []),
+            })
+
+        return self._with_identity(self._cached("natal", dt_utc, lat, lon, compute), name, original_input)
+
+    # ChartOutput sections filled straight from ctx.analysis when present
+    OUTPUT_SECTIONS = (
+        "vargas", "shadbala", "ashtakavarga", "jaimini", "yogas", "parasari_yogas",
+        "panchanga", "dashas", "current_dasha_chain", "transits",
+    )
+
+    @staticmethod
+    def _chart_output(ctx: ChartContext, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Maps a finished ChartContext onto the ChartOutput response layout."""
+        report: Dict[str, Any] = {
+            "meta": meta,
+            "ascendant": ctx.ascendant,
+            "ayanamsha": ctx.analysis.get("meta", {}).get("ayanamsa") or 0.0,
+            "houses": list(ctx.houses),
+            "planets": ctx.planets,
+        }
+        for section in ChartOrchestrator.OUTPUT_SECTIONS:
+            if section in ctx.analysis:
+                report[section] = ctx.analysis[section]
+        dosha = ctx.analysis.get("dosha", {})
+        if "manglik" in dosha and "kala_sarpa" in dosha:
+            report["dosha"] = dosha
+        return report
+
+    def run_annual_forecast(
+        self,
+        name: str,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        second: int,
+        lat: float,
+        lon: float,
+        target_year: int,
+        tz: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute the annual (Varshaphal) pipeline.
+        Refactored to use the new ChartContext class.
+        """
+        # Step 1: Resolve True UTC Time
+        dt_utc, resolved_tz = self._resolve_utc_datetime(
+            year, month, day, hour, minute, second, lat, lon
+        )
+        original_input = f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}"
+
+        def compute() -> Dict[str, Any]:
+            # Step 2: Prepare Strict Context (UTC BirthData + JD)
+            ctx = self._build_context(name, dt_utc, resolved_tz, lat, lon)
+            ctx.target_year = target_year
+
+            # Inject Target Context
+            # Note: target_year logic remains, assuming Tajaka calculates exact return
+            ctx.analysis["target_year"] = target_year
+
+            # Step 3: Execute Pipeline (dependency-ordered, independent plugins in parallel)
+            ChartFactory.create_scheduler("ANNUAL", self.config).run(ctx)
+
+            # Duplicate Swiss Ephemeris work avoided by the request-scoped cache
+            ctx.meta["ephemeris_cache"] = ctx.ephemeris.stats()
+
+            return ctx.analysis
+
+        # Step 4: Same natal instant, place, config and year -> same forecast.
+        # TajakaChartPlugin logs and swallows its errors, so only finished forecasts are stored.
+        report = self._cached(
+            "annual", dt_utc, lat, lon, compute,
+            complete=lambda report: "tajaka" in report, target_year=target_year,
+        )
+        return self._with_identity(report, name, original_input)
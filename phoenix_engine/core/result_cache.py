@@ -0,0 +1,149 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from phoenix_engine import __version__
+
+# Bump when report layouts change without a version bump
+RESULT_SCHEMA = 1
+
+
+def _config_fields(config: Any) -> Any:
+    if config is None:
+        return None
+    if hasattr(config, "model_dump"):
+        return config.model_dump(mode="json")
+    return {k: v for k, v in sorted(vars(config).items()) if not k.startswith("_")}
+
+
+class ChartResultCache:
+    """
+    Content-addressed cache of finished chart reports.
+
+    A report is a pure function of (UTC instant, location, config, chart kind), so the key is
+    a SHA-256 over exactly those plus a salt of engine version, RESULT_SCHEMA and the pickle
+    protocol: a deploy that changes any of them never reads stale entries. Payloads are pickled
+    (an exact round trip of int-keyed dicts and PlanetPosition models, which JSON would not
+    give), so the SQLite file must only be writable by the service itself. An in-memory LRU
+    bounded by `max_bytes` sits in front of an optional SQLite file of zlib-compressed payloads.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, db_path: Optional[str] = None, salt: str = ""):
+        self.max_bytes = max_bytes
+        self.salt = f"{__version__}:{RESULT_SCHEMA}:{pickle.HIGHEST_PROTOCOL}:{salt}"
+        self._lru: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS chart_results ("
+                "key TEXT PRIMARY KEY, payload BLOB, created REAL)"
+            )
+            self._db.commit()
+
+    def key(self, kind: str, dt_utc: datetime, lat: float, lon: float, config: Any, **extra) -> str:
+        canonical = {
+            "salt": self.salt,
+            "kind": kind,
+            "utc": dt_utc.strftime("%Y-%m-%dT%H:%M:%S"),
+            "lat": f"{lat:.6f}",
+            "lon": f"{lon:.6f}",
+            "config": _config_fields(config),
+            "extra": extra,
+        }
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """A fresh copy of the cached report, or None."""
+        with self._lock:
+            payload = self._lru.get(key)
+            if payload is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(payload)
+
+            if self._db is not None:
+                row = self._db.execute("SELECT payload FROM chart_results WHERE key=?", (key,)).fetchone()
+                if row is not None:
+                    payload = zlib.decompress(row[0])
+                    self.disk_hits += 1
+                    self._remember(key, payload)
+                    return pickle.loads(payload)
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, report: Any):
+        """Stores `report`; reports that cannot be pickled are skipped."""
+        try:
+            payload = pickle.dumps(report, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            self._remember(key, payload)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO chart_results VALUES (?, ?, ?)",
+                    (key, zlib.compress(payload), time.time()),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, payload: bytes):
+        old = self._lru.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        if len(payload) > self.max_bytes:
+            return
+        self._lru[key] = payload
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._lru.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM chart_results")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._lru),
+                "bytes": self._bytes,
+            }
+
+
+_default_cache = ChartResultCache()
+
+
+def get_result_cache() -> ChartResultCache:
+    return _default_cache
+
+
+def set_result_cache(cache: ChartResultCache):
+    """Replace the process-wide cache (e.g. with an SQLite-backed one at startup)."""
+    global _default_cache
+    _default_cache = cache
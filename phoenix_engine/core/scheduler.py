@@ -0,0 +1,179 @@
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from phoenix_engine.core.context import ChartContext
+
+
+# OutputOptions flag -> plugin resources that feed that output section. Every include_* flag
+# is listed; sections no plugin of a pipeline provides are reported by PluginScheduler.run.
+OUTPUT_TARGETS = {
+    "include_vargas": ("vargas",),
+    "include_shadbala": ("shadbala",),
+    "include_ashtakavarga": ("ashtakavarga",),
+    "include_yogas": ("yogas", "parasari_yogas"),
+    "include_jaimini": ("jaimini",),
+    "include_maitri": ("maitri",),
+    "include_aspects": ("aspects",),
+    "include_avasthas": ("avasthas",),
+    "include_bhavabala": ("bhava_bala",),
+    "include_phala": ("phala",),
+    "include_doshas": ("dosha.manglik", "dosha.kala_sarpa"),
+    "include_dashas": ("dashas.vimshottari", "dashas.advanced", "current_dasha_chain"),
+    "include_panchanga": ("panchanga",),
+    "include_semantics": ("semantics",),
+}
+
+
+def output_targets(output: Any = None) -> Optional[List[str]]:
+    """
+    Resources required by the requested output sections (planets/houses always).
+    None (no OutputOptions) means "everything in the pipeline".
+    """
+    if output is None:
+        return None
+    targets = ["positions"]
+    for flag, resources in OUTPUT_TARGETS.items():
+        if getattr(output, flag, False):
+            targets.extend(resources)
+    return targets
+
+
+def requested_targets(output: Any = None) -> List[str]:
+    """
+    Resources of the sections the caller switched on explicitly (set on the model rather
+    than left at their defaults). Only these are worth a warning when nothing provides them.
+    """
+    if output is None:
+        return []
+    explicit = getattr(output, "model_fields_set", set())
+    targets: List[str] = []
+    for flag, resources in OUTPUT_TARGETS.items():
+        if flag in explicit and getattr(output, flag, False):
+            targets.extend(resources)
+    return targets
+
+
+class PluginScheduler:
+    """
+    Dependency-aware plugin runner.
+
+    Plugins declare `provides` / `requires` (and soft `uses`). The scheduler keeps only the
+    plugins needed for the requested targets (transitively), orders them into topological
+    stages and runs the plugins of one stage concurrently on a thread pool.
+
+    The installed pyswisseph never releases the GIL, so those threads interleave rather than
+    run in parallel. Plugins of one stage must still treat shared ctx containers as
+    concurrent: create them with setdefault, never with check-then-assign. Swiss Ephemeris
+    calls that depend on the process-global sidereal mode go through SWE_LOCK
+    (infrastructure/astronomy/cache.py), which sets the mode and computes as one unit.
+    """
+
+    def __init__(self, plugins: Iterable, max_workers: int = 4):
+        self.plugins = list(plugins)
+        self.max_workers = max_workers
+
+        self.providers: Dict[str, object] = {}
+        for plugin in self.plugins:
+            for resource in plugin.provides:
+                if resource in self.providers:
+                    raise ValueError(
+                        f"'{resource}' is provided by both {self.providers[resource].name} and {plugin.name}"
+                    )
+                self.providers[resource] = plugin
+
+    def select(self, targets: Optional[Iterable[str]] = None, strict: bool = True) -> List:
+        """
+        Plugins needed for `targets` (all plugins when None), in declaration order,
+        including the transitive closure of their requires. With strict=False, targets
+        that no plugin of this pipeline provides are ignored.
+        """
+        if targets is None:
+            return list(self.plugins)
+
+        needed: Set[int] = set()
+        pending = [t for t in targets if strict or t in self.providers]
+        while pending:
+            resource = pending.pop()
+            plugin = self.providers.get(resource)
+            if plugin is None:
+                raise ValueError(f"No plugin provides '{resource}'")
+            if id(plugin) not in needed:
+                needed.add(id(plugin))
+                pending.extend(plugin.requires)
+        return [p for p in self.plugins if id(p) in needed]
+
+    def plan(self, targets: Optional[Iterable[str]] = None, strict: bool = True) -> List[List]:
+        """Topological stages: every plugin runs after the providers of its requires/uses."""
+        selected = self.select(targets, strict)
+        selected_ids = {id(p) for p in selected}
+
+        deps: Dict[int, Set[int]] = {}
+        for plugin in selected:
+            deps[id(plugin)] = set()
+            for resource in plugin.requires:
+                provider = self.providers.get(resource)
+                if provider is None or id(provider) not in selected_ids:
+                    raise ValueError(f"{plugin.name} requires '{resource}', which no scheduled plugin provides")
+                deps[id(plugin)].add(id(provider))
+            for resource in plugin.uses:
+                provider = self.providers.get(resource)
+                if provider is not None and id(provider) in selected_ids:
+                    deps[id(plugin)].add(id(provider))
+            deps[id(plugin)].discard(id(plugin))
+
+        stages: List[List] = []
+        done: Set[int] = set()
+        remaining = list(selected)
+        while remaining:
+            stage = [p for p in remaining if deps[id(p)] <= done]
+            if not stage:
+                raise ValueError(f"Plugin dependency cycle among: {[p.name for p in remaining]}")
+            stages.append(stage)
+            done.update(id(p) for p in stage)
+            remaining = [p for p in remaining if id(p) not in done]
+        return stages
+
+    def run(self, ctx: ChartContext, targets: Optional[Iterable[str]] = None, strict: bool = True,
+            requested: Optional[Iterable[str]] = None) -> List[List]:
+        """
+        Plans first, then executes stage by stage: nothing outside the minimal plugin set
+        for `targets` ever runs. Timings land in ctx.meta['pipeline'], along with the targets
+        strict=False skipped because no plugin provides them. Skipped targets also raise a
+        warning; pass `requested` to warn only for those (e.g. explicitly enabled sections).
+        """
+        targets = list(targets) if targets is not None else None
+        stages = self.plan(targets, strict)
+        unprovided = sorted({t for t in targets if t not in self.providers}) if targets is not None else []
+        noisy = unprovided if requested is None else sorted(set(unprovided) & set(requested))
+        if noisy:
+            warnings.warn(f"No plugin of this pipeline provides {noisy}; those sections stay empty", stacklevel=2)
+        timings: Dict[str, float] = {}
+
+        def execute(plugin):
+            started = time.perf_counter()
+            plugin.execute(ctx)
+            timings[plugin.name] = round(time.perf_counter() - started, 6)
+
+        executor = None
+        try:
+            for stage in stages:
+                if len(stage) == 1 or self.max_workers <= 1:
+                    for plugin in stage:
+                        execute(plugin)
+                    continue
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="phoenix-plugin")
+                # list() re-raises the first plugin error, as the serial pipeline did
+                list(executor.map(execute, stage))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        ctx.meta["pipeline"] = {
+            "stages": [[p.name for p in stage] for stage in stages],
+            "timings": timings,
+            "unprovided": unprovided,
+        }
+        return stages
@@ -15,7 +15,10 @@ class OutputOptions(BaseModel):
     include_bhavabala: bool = True
     include_phala: bool = True
     include_doshas: bool = True      # Added for Dosha Plugin
+    include_dashas: bool = True
+    include_panchanga: bool = True
     include_semantics: bool = False
+    columnar_transits: bool = False  # Gochar timeline as (days x planets) columns
 
 class ChartConfig(BaseModel):
     ayanamsa: AyanamsaSystem = AyanamsaSystem.LAHIRI
@@ -1,6 +1,7 @@
 import swisseph as swe
 
 from phoenix_engine.core.config import ChartConfig
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 
 
 class BirthChartEngine:
@@ -29,9 +30,9 @@ class BirthChartEngine:
         jd = swe.julday(year, month, day, hour_decimal)
 
         # 2) Sidereal mode (default Lahiri)
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        ephemeris = SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
 
-        # 3) Planets
+        # 3) Planets (one batched ephemeris call, dicts built from the array)
         planets = {}
         planet_ids = {
             "Sun": swe.SUN,
@@ -43,12 +44,11 @@ class BirthChartEngine:
             "Saturn": swe.SATURN,
             "Rahu": swe.MEAN_NODE,
         }
+        positions = ephemeris.calculate_planets_batch([jd], bodies=planet_ids.values())[0]
 
-        for p_name, p_id in planet_ids.items():
-            flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
-            res = swe.calc_ut(jd, p_id, flags)
-            lon_val = res[0][0]
-            speed_val = res[0][3]
+        for p_name, pos in zip(planet_ids, positions):
+            lon_val = float(pos[SwissEphemeris.LONGITUDE])
+            speed_val = float(pos[SwissEphemeris.SPEED_LONGITUDE])
 
             planets[p_name] = {
                 "name": p_name,
@@ -2,24 +2,29 @@
 from phoenix_engine.domain.match import MatchRequest, MatchResult
 from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 from phoenix_engine.infrastructure.time.manager import TimeEngine
+from phoenix_engine.infrastructure.time.offsets import get_offset_table
+from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
 from phoenix_engine.plugins.match.ashta_kuta import AshtaKutaPlugin
 from datetime import datetime
 
 class MatchingEngine:
+    def _local_datetime(self, person) -> datetime:
+        # Same rule as the orchestrator: the coordinates decide the timezone
+        tz_name = get_timezone_resolver().timezone_at(person.lat, person.lon) or "UTC"
+        dt = datetime(person.year, person.month, person.day, person.hour, person.minute)
+        return get_offset_table(tz_name).to_utc(dt)
+
     def process(self, req: MatchRequest) -> MatchResult:
         # 1. Calculate Moons for both
         swe = SwissEphemeris()
         time_eng = TimeEngine()
         
         # P1
-        dt1 = datetime(req.p1.year, req.p1.month, req.p1.day, req.p1.hour, req.p1.minute)
-        # In real app, apply timezone!
-        jd1 = time_eng.get_julian_day(dt1) # Simplified call
+        jd1 = time_eng.get_julian_day(self._local_datetime(req.p1))
         p1_planets = swe.calculate_planets(jd1)
         
         # P2
-        dt2 = datetime(req.p2.year, req.p2.month, req.p2.day, req.p2.hour, req.p2.minute)
-        jd2 = time_eng.get_julian_day(dt2)
+        jd2 = time_eng.get_julian_day(self._local_datetime(req.p2))
         p2_planets = swe.calculate_planets(jd2)
         
         # 2. Run Plugin
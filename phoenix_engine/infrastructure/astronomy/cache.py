@@ -0,0 +1,74 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import swisseph as swe
+
+# pyswisseph keeps the sidereal mode process-global: a set_sid_mode and the calls that depend
+# on it must run as one unit, or a concurrent thread can switch the mode in between
+SWE_LOCK = threading.RLock()
+
+
+def sidereal_calc_ut(jd_ut: float, body: int, flags: int, sidereal_mode: Optional[int] = swe.SIDM_LAHIRI):
+    """swe.calc_ut in `sidereal_mode` (when flags ask for sidereal positions), atomically."""
+    with SWE_LOCK:
+        if flags & swe.FLG_SIDEREAL and sidereal_mode is not None:
+            swe.set_sid_mode(sidereal_mode, 0, 0)
+        return swe.calc_ut(jd_ut, body, flags)
+
+
+def sidereal_ayanamsa(jd_ut: float, sidereal_mode: int = swe.SIDM_LAHIRI) -> float:
+    """swe.get_ayanamsa_ut for `sidereal_mode`, atomically."""
+    with SWE_LOCK:
+        swe.set_sid_mode(sidereal_mode, 0, 0)
+        return swe.get_ayanamsa_ut(jd_ut)
+
+
+class EphemerisCache:
+    """
+    Request-scoped memo of swe.calc_ut results.
+    Keyed by (jd, body, flags, sidereal_mode); one instance lives on each ChartContext
+    so every engine working on the same chart shares the Swiss Ephemeris work.
+    Hit/miss counters make the duplicate work measurable.
+    """
+
+    def __init__(self, sidereal_mode: int = swe.SIDM_LAHIRI):
+        self.sidereal_mode = sidereal_mode
+        self._store: Dict[Tuple[float, int, int, Optional[int]], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def calc_ut(self, jd_ut: float, body: int, flags: int, sidereal_mode: Optional[int] = None):
+        """Drop-in for swe.calc_ut. Errors raised by Swiss Ephemeris are not cached."""
+        mode = None
+        if flags & swe.FLG_SIDEREAL:
+            mode = self.sidereal_mode if sidereal_mode is None else sidereal_mode
+
+        key = (float(jd_ut), body, flags, mode)
+        # Plugins of one scheduler stage share this cache from worker threads
+        with SWE_LOCK:
+            cached = self._store.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            self.misses += 1
+            result = sidereal_calc_ut(jd_ut, body, flags, mode)
+            self._store[key] = result
+            return result
+
+    def clear(self):
+        with SWE_LOCK:
+            self._store.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with SWE_LOCK:
+            hits, misses, entries = self.hits, self.misses, len(self._store)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "entries": entries,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,191 @@
+import math
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import swisseph as swe
+from numpy.polynomial import chebyshev as cheb
+
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+
+
+class ChebyshevEphemeris:
+    """
+    In-process ephemeris backend built from piecewise Chebyshev fits of Swiss Ephemeris.
+
+    Each body is split into fixed-length segments over [start_jd, end_jd]; longitude
+    (unwrapped), latitude and distance are interpolated at Chebyshev nodes, and speeds
+    come from the derivative series. Evaluation is fully vectorized in NumPy, so a range
+    query is a handful of array operations instead of one swe.calc_ut per body and JD.
+
+    The maximum error measured against Swiss Ephemeris between the fit nodes is stored
+    per body in `max_error`, next to the coefficients.
+    """
+
+    # Segment length in days per body (fast bodies need short segments)
+    SEGMENT_DAYS = {
+        swe.SUN: 64.0,
+        swe.MOON: 8.0,
+        swe.MARS: 32.0,
+        swe.MERCURY: 16.0,
+        swe.JUPITER: 64.0,
+        swe.VENUS: 32.0,
+        swe.SATURN: 64.0,
+        swe.TRUE_NODE: 8.0,
+        swe.MEAN_NODE: 64.0,
+    }
+    DEFAULT_SEGMENT_DAYS = 8.0
+    DEGREE = 13
+
+    def __init__(
+        self,
+        start_jd: float,
+        end_jd: float,
+        sidereal_mode: int,
+        flags: int,
+        segment_days: Dict[int, float],
+        coefficients: Dict[int, np.ndarray],
+        max_error: Optional[Dict[int, Dict[str, float]]] = None,
+    ):
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+        self.sidereal_mode = sidereal_mode
+        self.flags = flags
+        self.segment_days = dict(segment_days)
+        # body -> (segments, degree + 1, 3) for longitude, latitude, distance
+        self.coefficients = coefficients
+        self.max_error = max_error or {}
+        # body -> derivative series, already scaled to units per day
+        self._derivatives = {
+            body: cheb.chebder(c, axis=1) * (2.0 / self.segment_days[body])
+            for body, c in coefficients.items()
+        }
+
+    # --- Fitting ---
+    @classmethod
+    def fit(
+        cls,
+        start_jd: float,
+        end_jd: float,
+        bodies: Optional[Iterable[int]] = None,
+        sidereal_mode: int = swe.SIDM_LAHIRI,
+        segment_days: Optional[Dict[int, float]] = None,
+        degree: int = DEGREE,
+        validate: bool = True,
+    ) -> "ChebyshevEphemeris":
+        """
+        Fits every body over [start_jd, end_jd] from Swiss Ephemeris samples.
+        With validate=True the fit is checked halfway between nodes and the worst
+        longitude/latitude/distance/speed deviations are recorded in max_error.
+        """
+        source = SwissEphemeris(sidereal_mode=sidereal_mode)
+        body_ids = list(source.BODY_MAP) if bodies is None else list(bodies)
+        seg_days = {b: (segment_days or {}).get(b, cls.SEGMENT_DAYS.get(b, cls.DEFAULT_SEGMENT_DAYS)) for b in body_ids}
+
+        # Chebyshev nodes on [-1, 1], ascending
+        nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))[::-1]
+        vander = cheb.chebvander(nodes, degree)
+
+        coefficients = {}
+        for body in body_ids:
+            seg_len = seg_days[body]
+            n_seg = max(1, int(math.ceil((end_jd - start_jd) / seg_len)))
+            seg_start = start_jd + seg_len * np.arange(n_seg)
+            jds = seg_start[:, None] + (nodes[None, :] + 1.0) * (seg_len / 2.0)
+
+            raw = source.calculate_planets_batch(jds.ravel(), [body], source.DEFAULT_FLAGS)[:, 0, :3]
+            samples = raw.reshape(n_seg, degree + 1, 3)
+            samples[:, :, 0] = np.unwrap(samples[:, :, 0], period=360.0, axis=1)
+
+            # Same Vandermonde matrix for every segment: one solve for all of them
+            rhs = samples.transpose(1, 0, 2).reshape(degree + 1, -1)
+            coeffs = np.linalg.solve(vander, rhs).reshape(degree + 1, n_seg, 3)
+            coefficients[body] = coeffs.transpose(1, 0, 2).copy()
+
+        model = cls(start_jd, end_jd, sidereal_mode, source.DEFAULT_FLAGS, seg_days, coefficients)
+        if validate:
+            model.max_error = model._measure_error(source, nodes)
+        return model
+
+    def _measure_error(self, source: SwissEphemeris, nodes: np.ndarray) -> Dict[int, Dict[str, float]]:
+        midpoints = np.concatenate(([-1.0], (nodes[:-1] + nodes[1:]) / 2.0, [1.0]))
+        errors = {}
+        for body, seg_len in self.segment_days.items():
+            n_seg = self.coefficients[body].shape[0]
+            seg_start = self.start_jd + seg_len * np.arange(n_seg)
+            jds = (seg_start[:, None] + (midpoints[None, :] + 1.0) * (seg_len / 2.0)).ravel()
+            jds = jds[jds <= self.end_jd]
+
+            exact = source.calculate_planets_batch(jds, [body], source.DEFAULT_FLAGS)[:, 0, :]
+            approx = self.calculate_planets_batch(jds, [body])[:, 0, :]
+            lon_err = np.abs((approx[:, 0] - exact[:, 0] + 180.0) % 360.0 - 180.0)
+            errors[body] = {
+                "longitude": float(np.nanmax(lon_err)),
+                "latitude": float(np.nanmax(np.abs(approx[:, 1] - exact[:, 1]))),
+                "distance": float(np.nanmax(np.abs(approx[:, 2] - exact[:, 2]))),
+                "speed": float(np.nanmax(np.abs(approx[:, 3] - exact[:, 3]))),
+            }
+        return errors
+
+    # --- Evaluation ---
+    def covers(self, jds: np.ndarray, bodies: Iterable[int], flags: int, sidereal_mode: int) -> bool:
+        """True if the request can be answered from this fit instead of Swiss Ephemeris."""
+        if flags != self.flags or sidereal_mode != self.sidereal_mode:
+            return False
+        if any(b not in self.coefficients for b in bodies):
+            return False
+        return bool(jds.size) and jds.min() >= self.start_jd and jds.max() <= self.end_jd
+
+    def calculate_planets_batch(self, jd_array: Iterable[float], bodies: Iterable[int]) -> np.ndarray:
+        """Same layout as SwissEphemeris.calculate_planets_batch: (N, bodies, 6)."""
+        jds = np.atleast_1d(np.asarray(jd_array, dtype=float))
+        body_ids = list(bodies)
+        out = np.empty((jds.size, len(body_ids), 6))
+
+        for j, body in enumerate(body_ids):
+            seg_len = self.segment_days[body]
+            coeffs = self.coefficients[body]
+            seg = np.clip(((jds - self.start_jd) // seg_len).astype(int), 0, coeffs.shape[0] - 1)
+            x = 2.0 * (jds - self.start_jd - seg * seg_len) / seg_len - 1.0
+
+            out[:, j, :3] = self._clenshaw(coeffs[seg], x)
+            out[:, j, 3:] = self._clenshaw(self._derivatives[body][seg], x)
+
+        out[:, :, 0] %= 360.0
+        return out
+
+    @staticmethod
+    def _clenshaw(coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """Evaluates one Chebyshev series per row: coeffs (N, K, C), x (N,) -> (N, C)."""
+        b1 = np.zeros((coeffs.shape[0], coeffs.shape[2]))
+        b2 = np.zeros_like(b1)
+        x = x[:, None]
+        for k in range(coeffs.shape[1] - 1, 0, -1):
+            b1, b2 = coeffs[:, k] + 2.0 * x * b1 - b2, b1
+        return coeffs[:, 0] + x * b1 - b2
+
+    # --- Persistence ---
+    def save(self, path: str):
+        arrays = {f"coeffs_{body}": c for body, c in self.coefficients.items()}
+        bodies = sorted(self.coefficients)
+        np.savez_compressed(
+            path,
+            meta=np.array([self.start_jd, self.end_jd, self.sidereal_mode, self.flags]),
+            bodies=np.array(bodies),
+            segment_days=np.array([self.segment_days[b] for b in bodies]),
+            max_error=np.array([[self.max_error.get(b, {}).get(k, np.nan)
+                                 for k in ("longitude", "latitude", "distance", "speed")] for b in bodies]),
+            **arrays,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ChebyshevEphemeris":
+        with np.load(path) as data:
+            start_jd, end_jd, sidereal_mode, flags = data["meta"].tolist()
+            bodies = [int(b) for b in data["bodies"]]
+            segment_days = dict(zip(bodies, data["segment_days"].tolist()))
+            coefficients = {b: data[f"coeffs_{b}"] for b in bodies}
+            max_error = {
+                b: dict(zip(("longitude", "latitude", "distance", "speed"), row))
+                for b, row in zip(bodies, data["max_error"].tolist())
+            }
+        return cls(start_jd, end_jd, int(sidereal_mode), int(flags), segment_days, coefficients, max_error)
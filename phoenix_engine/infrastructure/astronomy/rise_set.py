@@ -0,0 +1,144 @@
+import math
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import swisseph as swe
+
+
+def rise_trans(start_jd: float, lat: float, lon: float, rsmi: int, body: int = swe.SUN) -> float:
+    """
+    First rise/set/transit (per rsmi) after start_jd; 0.0 when there is none (circumpolar).
+    Strategy: Tries JHora style (kwargs) first, then falls back to Unpacked args for Windows C-Builds.
+    """
+    geopos = (lon, lat, 0.0)
+
+    # 1. JHora Style: Modern Keyword Arguments (Cleanest)
+    try:
+        return swe.rise_trans(start_jd, body, rsmi=rsmi, geopos=geopos, flags=swe.FLG_SWIEPH)[1][0]
+    except (TypeError, ValueError):
+        pass
+
+    # 2. Windows C-Extension Style (Unpacked Coordinates - No Tuple)
+    # This fixes 'must be real number, not tuple'
+    try:
+        # Arg order: tjd, body, starname, epheflag, rsmi, lon, lat, height, press, temp
+        # Note: Some versions skip starname for Planets.
+        return swe.rise_trans(start_jd, body, "", swe.FLG_SWIEPH, rsmi, lon, lat, 0.0, 0.0, 0.0)[1][0]
+    except (TypeError, ValueError):
+        pass
+
+    # 3. Minimalist / Old Version
+    try:
+        return swe.rise_trans(start_jd, body, swe.FLG_SWIEPH, rsmi, lon, lat, 0.0)[1][0]
+    except (TypeError, ValueError):
+        pass
+
+    return 0.0
+
+
+class RiseSetCache:
+    """
+    Process-wide cache of Sun rise/set events.
+
+    Entries are keyed by a quantized (lat, lon) cell, the local (mean solar) day and the
+    rsmi flags (rise/set plus disc/refraction bits). Each entry holds the first event after
+    local midnight at the cell centre, so every chart born in the same city on the same day
+    shares one swe.rise_trans call. An in-memory LRU sits in front of an optional SQLite file.
+    """
+
+    def __init__(self, cell_deg: float = 0.01, maxsize: int = 65536, db_path: Optional[str] = None):
+        self.cell_deg = cell_deg
+        self.maxsize = maxsize
+        self._lru: "OrderedDict[Tuple[int, int, int, int], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rise_set ("
+                "lat_cell INTEGER, lon_cell INTEGER, day INTEGER, rsmi INTEGER, jd REAL, "
+                "PRIMARY KEY (lat_cell, lon_cell, day, rsmi))"
+            )
+            self._db.commit()
+
+    def next_event(self, start_jd: float, lat: float, lon: float, rsmi: int) -> float:
+        """
+        First event of type rsmi after start_jd, as swe.rise_trans would return it
+        (computed at the cell centre). Days without the event (polar day/night) are skipped;
+        returns 0.0 when none of the three days scanned has one.
+        """
+        lat_cell = int(round(lat / self.cell_deg))
+        lon_cell = int(round(lon / self.cell_deg))
+        lon_c = lon_cell * self.cell_deg
+
+        # Local mean solar day containing start_jd
+        day = int(math.floor(start_jd + 0.5 + lon_c / 360.0))
+        for offset in (0, 1, 2):
+            event = self._event(lat_cell, lon_cell, day + offset, rsmi)
+            if event != 0.0 and event >= start_jd:
+                return event
+        return 0.0
+
+    def _event(self, lat_cell: int, lon_cell: int, day: int, rsmi: int) -> float:
+        key = (lat_cell, lon_cell, day, rsmi)
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return self._lru[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT jd FROM rise_set WHERE lat_cell=? AND lon_cell=? AND day=? AND rsmi=?", key
+                ).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return row[0]
+
+        # Compute outside the lock; a concurrent duplicate is harmless
+        lat_c, lon_c = lat_cell * self.cell_deg, lon_cell * self.cell_deg
+        local_midnight = day - 0.5 - lon_c / 360.0
+        event = rise_trans(local_midnight, lat_c, lon_c, rsmi)
+
+        with self._lock:
+            self.misses += 1
+            self._remember(key, event)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO rise_set VALUES (?, ?, ?, ?, ?)", key + (event,))
+                self._db.commit()
+        return event
+
+    def _remember(self, key: Tuple[int, int, int, int], event: float):
+        self._lru[key] = event
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._lru),
+            }
+
+
+_default_cache = RiseSetCache()
+
+
+def get_rise_set_cache() -> RiseSetCache:
+    return _default_cache
+
+
+def set_rise_set_cache(cache: RiseSetCache):
+    """Replace the process-wide cache (e.g. with an SQLite-backed one at startup)."""
+    global _default_cache
+    _default_cache = cache
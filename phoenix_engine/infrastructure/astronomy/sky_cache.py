@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Tuple
+
+import numpy as np
+import swisseph as swe
+
+
+class DailySkyCache:
+    """
+    Process-wide cache of daily sky snapshots for transit timelines.
+
+    One row per (civil day, sampling hour, sidereal mode) holds the (bodies, 2) array of
+    sidereal longitude and speed that TransitCalculator produces for that day. Rows are
+    plain float64 arrays, evicted least-recently-used once `max_bytes` is exceeded, so every
+    "next 30 days" request after the first is served without touching the ephemeris.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._rows: "OrderedDict[Tuple[int, float, int], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_rows(
+        self,
+        day_numbers: Iterable[int],
+        hour: float,
+        sidereal_mode: int,
+        compute: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Snapshot rows for the given days (JD at 0h UT, as int(julday - 0.5) + ...). Missing
+        days are computed together with one compute(jds) call that returns (len(jds), bodies, 2).
+        """
+        days = [int(d) for d in day_numbers]
+        found: Dict[int, np.ndarray] = {}
+        with self._lock:
+            for day in days:
+                row = self._rows.get((day, hour, sidereal_mode))
+                if row is not None:
+                    self._rows.move_to_end((day, hour, sidereal_mode))
+                    found[day] = row
+            self.hits += len(found)
+
+        missing = sorted(set(days) - set(found))
+        if missing:
+            jds = np.array(missing, dtype=float) + 0.5 + hour / 24.0
+            computed = compute(jds)
+            with self._lock:
+                self.misses += len(missing)
+                for day, row in zip(missing, computed):
+                    row = np.ascontiguousarray(row)
+                    row.setflags(write=False)
+                    found[day] = row
+                    self._store((day, hour, sidereal_mode), row)
+
+        return np.stack([found[day] for day in days]) if days else np.empty((0, 0, 2))
+
+    def _store(self, key: Tuple[int, float, int], row: np.ndarray):
+        old = self._rows.pop(key, None)
+        if old is not None:
+            self._bytes -= old.nbytes
+        self._rows[key] = row
+        self._bytes += row.nbytes
+        while self._bytes > self.max_bytes and self._rows:
+            _, evicted = self._rows.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    @staticmethod
+    def day_number(year: int, month: int, day: int) -> int:
+        """Integer day key: the JD of the civil date at 0h UT, minus 0.5."""
+        return int(swe.julday(year, month, day, 0.0) - 0.5)
+
+    def warm(self, days: int = 30, start: datetime = None, **kwargs):
+        """Fills the rolling window [start, start + days) (start defaults to today, UTC)."""
+        from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+        start = start or datetime.now(timezone.utc)
+        TransitCalculator.get_daily_transit_array(start, days_count=days, sky_cache=self, **kwargs)
+
+    def clear(self):
+        with self._lock:
+            self._rows.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._rows), "bytes": self._bytes}
+
+
+_default_cache = DailySkyCache()
+
+
+def get_sky_cache() -> DailySkyCache:
+    return _default_cache
+
+
+def set_sky_cache(cache: DailySkyCache):
+    """Replace the process-wide cache (e.g. with a larger memory budget)."""
+    global _default_cache
+    _default_cache = cache
@@ -1,14 +1,50 @@
+import numpy as np
 import swisseph as swe
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from phoenix_engine.infrastructure.astronomy.cache import sidereal_ayanamsa, sidereal_calc_ut
+from phoenix_engine.infrastructure.astronomy.rise_set import get_rise_set_cache
+
+
+def sidereal_mode_for(ayanamsa: Any) -> int:
+    """
+    Map configured ayanamsa to Swiss Ephemeris sidereal modes.
+    Defaults to Lahiri.
+    """
+    if hasattr(ayanamsa, "value"):
+        ayanamsa = ayanamsa.value
+    if isinstance(ayanamsa, str):
+        key = ayanamsa.upper()
+        if "RAMAN" in key:
+            return swe.SIDM_RAMAN
+        if key.startswith("KP"):
+            return swe.SIDM_KRISHNAMURTI
+        if "FAGAN" in key:
+            return swe.SIDM_FAGAN_BRADLEY
+    return swe.SIDM_LAHIRI
 
 
 class SwissEphemeris:
-    def __init__(self, ephe_path: Optional[str] = None, sidereal_mode: int = swe.SIDM_LAHIRI):
+    # Column layout of calculate_planets_batch rows (same order as swe.calc_ut)
+    LONGITUDE, LATITUDE, DISTANCE, SPEED_LONGITUDE, SPEED_LATITUDE, SPEED_DISTANCE = range(6)
+    DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+    def __init__(
+        self,
+        ephe_path: Optional[str] = None,
+        sidereal_mode: int = swe.SIDM_LAHIRI,
+        backend: Any = None,
+        cache: Any = None,
+    ):
         if ephe_path:
             swe.set_ephe_path(str(ephe_path))
         
         self.sidereal_mode = sidereal_mode
-        swe.set_sid_mode(sidereal_mode, 0, 0)
+        # Optional fitted backend (e.g. ChebyshevEphemeris); used when it covers the request
+        self.backend = backend
+        # Optional request-scoped EphemerisCache shared with the other engines of a chart
+        self.cache = cache
+        # The process-global sidereal mode is set per call, under SWE_LOCK, never here
         
         self.BODY_MAP = {
             swe.SUN: "Sun", swe.MOON: "Moon", swe.MARS: "Mars",
@@ -19,22 +55,58 @@ class SwissEphemeris:
 
     # --- Core Astronomy ---
     def get_ayanamsa(self, jd_ut: float) -> float:
-        return swe.get_ayanamsa_ut(jd_ut)
+        return sidereal_ayanamsa(jd_ut, self.sidereal_mode)
 
-    def calculate_planets(self, jd_ut: float) -> Dict[str, Dict]:
+    def calculate_planets_batch(
+        self, jd_array: Iterable[float], bodies: Optional[Iterable[int]] = None, flags: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Evaluates many bodies at many instants into a single array.
+        Returns shape (N, len(bodies), 6): longitude, latitude, distance and their speeds.
+        Rows Swiss Ephemeris cannot compute are left as NaN.
+        """
+        jds = np.atleast_1d(np.asarray(jd_array, dtype=float))
+        body_ids = list(self.BODY_MAP) if bodies is None else list(bodies)
+        flags = self.DEFAULT_FLAGS if flags is None else flags
+
+        if self.backend is not None and self.backend.covers(jds, body_ids, flags, self.sidereal_mode):
+            return self.backend.calculate_planets_batch(jds, body_ids)
+
+        out = np.full((jds.size, len(body_ids), 6), np.nan)
+        if self.cache is not None:
+            def calc_ut(jd, body_id, flags):
+                return self.cache.calc_ut(jd, body_id, flags, self.sidereal_mode)
+        else:
+            def calc_ut(jd, body_id, flags):
+                return sidereal_calc_ut(jd, body_id, flags, self.sidereal_mode)
+
+        for i, jd in enumerate(jds.tolist()):
+            row = out[i]
+            for j, body_id in enumerate(body_ids):
+                try:
+                    row[j] = calc_ut(jd, body_id, flags)[0]
+                except swe.Error:
+                    pass
+        return out
+
+    def planet_dicts(self, positions: np.ndarray, bodies: Optional[Iterable[int]] = None) -> Dict[str, Dict]:
+        """
+        Builds the legacy per-body dict view for one row of calculate_planets_batch.
+        Ketu is derived from Rahu when the node is present.
+        """
+        body_ids = list(self.BODY_MAP) if bodies is None else list(bodies)
         results = {}
-        flags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
-        for body_id, body_name in self.BODY_MAP.items():
-            try:
-                res = swe.calc_ut(jd_ut, body_id, flags)
-                results[body_name] = {
-                    "id": body_id, "name": body_name,
-                    "longitude": res[0][0], "speed": res[0][3],
-                    "is_retrograde": res[0][3] < 0,
-                    "nakshatra": int(res[0][0] / 13.333333) + 1
-                }
-            except swe.Error:
-                pass
+        for body_id, pos in zip(body_ids, positions):
+            lon, speed = float(pos[self.LONGITUDE]), float(pos[self.SPEED_LONGITUDE])
+            if lon != lon:  # NaN: body failed in Swiss Ephemeris
+                continue
+            body_name = self.BODY_MAP.get(body_id, str(body_id))
+            results[body_name] = {
+                "id": body_id, "name": body_name,
+                "longitude": lon, "speed": speed,
+                "is_retrograde": speed < 0,
+                "nakshatra": int(lon / 13.333333) + 1
+            }
         if "Rahu" in results:
             rahu = results["Rahu"]
             ketu_long = (rahu["longitude"] + 180.0) % 360.0
@@ -45,6 +117,9 @@ class SwissEphemeris:
             }
         return results
 
+    def calculate_planets(self, jd_ut: float) -> Dict[str, Dict]:
+        return self.planet_dicts(self.calculate_planets_batch([jd_ut])[0])
+
     def calculate_houses_sidereal(self, jd_ut: float, lat: float, lon: float, system: bytes = b'P') -> Dict:
         cusps_trop, ascmc_trop = swe.houses_ex(jd_ut, lat, lon, system)
         ayanamsa = self.get_ayanamsa(jd_ut)
@@ -52,49 +127,17 @@ class SwissEphemeris:
         cusps_sidereal = [(c - ayanamsa) % 360.0 for c in cusps_trop]
         return {"ascendant": asc_sidereal, "houses": cusps_sidereal, "ayanamsa": ayanamsa}
 
-    # --- THE FINAL FIX: Inspired by JHora + Windows Compatibility ---
     def get_rise_set(self, jd_ut: float, lat: float, lon: float) -> Tuple[float, float]:
         """
-        Returns (sunrise_jd, sunset_jd).
-        Strategy: Tries JHora style (kwargs) first, then falls back to Unpacked args for Windows C-Builds.
+        Returns (sunrise_jd, sunset_jd): first events after jd_ut - 1 day (disc centre).
+        Served from the process-wide RiseSetCache.
         """
         start_jd = jd_ut - 1.0  # Search starting from previous day
-        geopos = (lon, lat, 0.0)
-        
-        def _calc(mode):
-            # 1. JHora Style: Modern Keyword Arguments (Cleanest)
-            try:
-                return swe.rise_trans(start_jd, swe.SUN, geopos=geopos, rsmi=swe.FLG_SWIEPH | mode)
-            except (TypeError, ValueError):
-                pass
-
-            # 2. Windows C-Extension Style (Unpacked Coordinates - No Tuple)
-            # This fixes 'must be real number, not tuple'
-            try:
-                # Arg order: tjd, body, starname, epheflag, rsmi, lon, lat, height, press, temp
-                # Note: Some versions skip starname for Planets.
-                return swe.rise_trans(start_jd, swe.SUN, "", swe.FLG_SWIEPH, mode, lon, lat, 0.0, 0.0, 0.0)
-            except (TypeError, ValueError):
-                pass
-
-            # 3. Minimalist / Old Version
-            try:
-                return swe.rise_trans(start_jd, swe.SUN, swe.FLG_SWIEPH, mode, lon, lat, 0.0)
-            except (TypeError, ValueError):
-                pass
-            
-            return None
-
-        # Execute
-        rise_flag = swe.CALC_RISE | swe.BIT_DISC_CENTER
-        set_flag = swe.CALC_SET | swe.BIT_DISC_CENTER
-        
-        rise_res = _calc(rise_flag)
-        set_res = _calc(set_flag)
-        
-        rise_jd = rise_res[1][0] if rise_res else 0.0
-        set_jd = set_res[1][0] if set_res else 0.0
-        
+        cache = get_rise_set_cache()
+
+        rise_jd = cache.next_event(start_jd, lat, lon, swe.CALC_RISE | swe.BIT_DISC_CENTER)
+        set_jd = cache.next_event(start_jd, lat, lon, swe.CALC_SET | swe.BIT_DISC_CENTER)
+
         return rise_jd, set_jd
 
     def get_ascendant(self, jd_ut: float, lat: float, lon: float) -> float:
@@ -129,10 +172,10 @@ class SwissEphemerisEngine:
         "Pisces",
     ]
 
-    def __init__(self, config: Any = None):
+    def __init__(self, config: Any = None, cache: Any = None):
         # Default to Lahiri sidereal mode; ChartConfig can override in future.
         self.config = config
-        self.swiss = SwissEphemeris(sidereal_mode=self._sidereal_mode())
+        self.swiss = SwissEphemeris(sidereal_mode=self._sidereal_mode(), cache=cache)
 
     def sign_name(self, sign_id: int) -> str:
         idx = (sign_id - 1) % 12
@@ -152,22 +195,8 @@ class SwissEphemerisEngine:
         return b"P"
 
     def _sidereal_mode(self) -> int:
-        """
-        Map configured ayanamsa to Swiss Ephemeris sidereal modes.
-        Defaults to Lahiri.
-        """
-        aya = getattr(self.config, "ayanamsa", None)
-        if hasattr(aya, "value"):
-            aya = aya.value
-        if isinstance(aya, str):
-            key = aya.upper()
-            if "RAMAN" in key:
-                return swe.SIDM_RAMAN
-            if key.startswith("KP"):
-                return swe.SIDM_KRISHNAMURTI
-            if "FAGAN" in key:
-                return swe.SIDM_FAGAN_BRADLEY
-        return swe.SIDM_LAHIRI
+        """Sidereal mode for the configured ayanamsa (see sidereal_mode_for)."""
+        return sidereal_mode_for(getattr(self.config, "ayanamsa", None))
 
     def calculate_planets(self, jd_ut: float, lat: float, lon: float, asc_sign: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import pytz
+
+# Julian Day of 1970-01-01T00:00 UT
+JD_UNIX_EPOCH = 2440587.5
+SECONDS_PER_DAY = 86400
+# Days from 0000-03-01 to 1970-01-01 (civil calendar arithmetic below counts from March)
+_CIVIL_EPOCH = 719468
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+def _civil_from_days(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Proleptic Gregorian (year, month, day) of day numbers since 1970-01-01, in int64 math."""
+    z = days + _CIVIL_EPOCH
+    era = np.floor_divide(z, 146097)
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    year = year - (month <= 2)
+    era = np.floor_divide(year, 400)
+    yoe = year - era * 400
+    doy = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - _CIVIL_EPOCH
+
+
+def _split_seconds(jds: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """(day number since 1970-01-01, second of day) of each JD, rounded to the second."""
+    seconds = np.rint((np.asarray(jds, dtype=float) - JD_UNIX_EPOCH) * SECONDS_PER_DAY).astype(np.int64)
+    return np.divmod(seconds, SECONDS_PER_DAY)
+
+
+def jd_to_calendar(jds: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(year, month, day, second_of_day) int arrays, rounded to the second."""
+    days, second = _split_seconds(np.atleast_1d(jds))
+    return (*_civil_from_days(days), second)
+
+
+def calendar_to_jd(year: ArrayLike, month: ArrayLike, day: ArrayLike, seconds: ArrayLike = 0.0) -> np.ndarray:
+    """Vectorized swe.julday (Gregorian) for dates plus seconds past 0h UT."""
+    days = _days_from_civil(*(np.asarray(v, dtype=np.int64) for v in (year, month, day)))
+    return days + np.asarray(seconds, dtype=float) / SECONDS_PER_DAY + JD_UNIX_EPOCH
+
+
+def jd_to_datetime64(jds: ArrayLike) -> np.ndarray:
+    """UT instants as datetime64[s], rounded to the second."""
+    days, second = _split_seconds(jds)
+    return (days * SECONDS_PER_DAY + second).astype("datetime64[s]")
+
+
+def datetime64_to_jd(values: np.ndarray) -> np.ndarray:
+    """Inverse of jd_to_datetime64, for any datetime64 unit."""
+    seconds = np.asarray(values).astype("datetime64[s]").astype(np.int64)
+    return seconds / SECONDS_PER_DAY + JD_UNIX_EPOCH
+
+
+def _format(columns: List[Tuple[np.ndarray, int]], separators: str) -> List[str]:
+    """Zero-padded ASCII fields joined by `separators`, built as one byte matrix."""
+    width = sum(w for _, w in columns) + len(separators)
+    out = np.empty((len(columns[0][0]), width), dtype=np.uint8)
+    pos = 0
+    for i, (values, digits) in enumerate(columns):
+        for k in range(digits):
+            out[:, pos + k] = values // 10 ** (digits - 1 - k) % 10 + 48
+        pos += digits
+        if i < len(separators):
+            out[:, pos] = ord(separators[i])
+            pos += 1
+    return out.view(f"S{width}").ravel().astype(f"U{width}").tolist()
+
+
+def jd_to_date_strings(jds: ArrayLike) -> List[str]:
+    """'YYYY-MM-DD' of each JD in one pass; the day is truncated, as swe.revjul's is."""
+    days = np.floor(np.atleast_1d(np.asarray(jds, dtype=float)) - JD_UNIX_EPOCH).astype(np.int64)
+    year, month, day = _civil_from_days(days)
+    if len(year) and (year.min() < 0 or year.max() > 9999):
+        return np.datetime_as_string(days.astype("datetime64[D]"), unit="D").tolist()
+    return _format([(year, 4), (month, 2), (day, 2)], "--")
+
+
+def jd_to_iso(jds: ArrayLike) -> List[str]:
+    """'YYYY-MM-DDTHH:MM:SS' (UT) of each JD, rounded to the second."""
+    year, month, day, second = jd_to_calendar(jds)
+    if len(year) and (year.min() < 0 or year.max() > 9999):
+        return np.datetime_as_string(jd_to_datetime64(np.atleast_1d(jds)), unit="s").tolist()
+    return _format([(year, 4), (month, 2), (day, 2), (second // 3600, 2), (second // 60 % 60, 2), (second % 60, 2)],
+                   "--T::")
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """Aware UTC datetime of one JD, rounded to the second."""
+    year, month, day, second = (int(v[0]) for v in jd_to_calendar(jd))
+    return datetime(year, month, day, second // 3600, second // 60 % 60, second % 60, tzinfo=pytz.utc)
@@ -0,0 +1,131 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+import pytz
+
+from phoenix_engine.infrastructure.time.manager import AmbiguousTimeError, NonExistentTimeError
+
+# Per-element status codes returned by local_to_utc
+OK = 0
+AMBIGUOUS = 1  # wall time occurs twice (DST fall-back); resolved to standard time
+NONEXISTENT = 2  # wall time skipped (DST gap); resolved with the pre-transition offset
+
+_EPOCH = datetime(1970, 1, 1)
+_END = np.iinfo(np.int64).max // 4
+
+
+class OffsetTable:
+    """
+    Compiled UTC-offset transitions of one IANA zone.
+
+    Interval k starts at UTC second `starts[k]` and uses `offsets[k]` until the next start, so
+    in wall-clock seconds it covers [starts[k] + offsets[k], starts[k + 1] + offsets[k]). A wall
+    time inside two intervals is ambiguous, one inside none is non-existent. Resolution follows
+    pytz's localize(is_dst=False): ambiguous times prefer the non-DST interval (else the later
+    instant), non-existent times take the offset in force just before the gap.
+    """
+
+    def __init__(self, zone: str, starts: Sequence[int], offsets: Sequence[int], dst: Sequence[bool]):
+        self.zone = zone
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.dst = np.asarray(dst, dtype=bool)
+        self.local_starts = self.starts + self.offsets
+        self.local_ends = np.append(self.starts[1:], _END) + self.offsets
+        # Plain lists for the scalar path; bisect beats numpy on a single value
+        self._local_starts = self.local_starts.tolist()
+        self._local_ends = self.local_ends.tolist()
+        self._offsets = self.offsets.tolist()
+        self._dst = self.dst.tolist()
+
+    @classmethod
+    def from_pytz(cls, zone: str) -> "OffsetTable":
+        try:
+            tz = pytz.timezone(zone)
+        except pytz.UnknownTimeZoneError:
+            raise ValueError(f"Unknown timezone: {zone}")
+
+        transitions = getattr(tz, "_utc_transition_times", None)
+        if not transitions:
+            # Fixed-offset zone (UTC, Etc/GMT+n, ...)
+            offset = tz.utcoffset(datetime(2000, 1, 1))
+            return cls(zone, [-_END], [int(offset.total_seconds())], [False])
+
+        starts = [int((t - _EPOCH).total_seconds()) for t in transitions]
+        starts[0] = -_END  # pytz opens the table at datetime.min
+        offsets = [int(info[0].total_seconds()) for info in tz._transition_info]
+        dst = [bool(info[1]) for info in tz._transition_info]
+        return cls(zone, starts, offsets, dst)
+
+    def _resolve(self, local: int) -> Tuple[int, int]:
+        """(offset seconds, status) for one wall time in seconds since 1970-01-01."""
+        k = max(bisect_right(self._local_starts, local) - 1, 0)
+        in_k = local < self._local_ends[k]
+        in_prev = k > 0 and local < self._local_ends[k - 1]
+        if in_k and in_prev:
+            if not self._dst[k - 1] and self._dst[k]:
+                return self._offsets[k - 1], AMBIGUOUS
+            return self._offsets[k], AMBIGUOUS
+        if in_prev:
+            return self._offsets[k - 1], OK
+        if in_k:
+            return self._offsets[k], OK
+        return self._offsets[k], NONEXISTENT
+
+    def to_utc(self, dt_naive: datetime, strict: bool = False) -> datetime:
+        """
+        UTC-aware datetime for a naive wall time. With strict=True ambiguous and non-existent
+        times raise, like localize_strict; otherwise they are resolved as described above.
+        """
+        delta = dt_naive - _EPOCH
+        local = delta.days * 86400 + delta.seconds
+        offset, status = self._resolve(local)
+        if strict and status == AMBIGUOUS:
+            raise AmbiguousTimeError(f"Ambiguous time in {self.zone} (DST transition)")
+        if strict and status == NONEXISTENT:
+            raise NonExistentTimeError(f"Time does not exist in {self.zone} (DST gap)")
+        return (dt_naive - timedelta(seconds=offset)).replace(tzinfo=pytz.UTC)
+
+    def local_to_utc(
+        self, naive_datetimes: Union[Sequence[datetime], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized to_utc. Returns (utc, offsets, status): utc as datetime64[s], the applied
+        UTC offsets in seconds and per-element OK / AMBIGUOUS / NONEXISTENT codes.
+        Sub-second parts of the input are dropped.
+        """
+        local_dt = np.asarray(naive_datetimes, dtype="datetime64[s]")
+        local = local_dt.astype(np.int64)
+
+        k = np.maximum(np.searchsorted(self.local_starts, local, side="right") - 1, 0)
+        prev = np.maximum(k - 1, 0)
+        in_k = local < self.local_ends[k]
+        in_prev = (k > 0) & (local < self.local_ends[prev])
+
+        ambiguous = in_k & in_prev
+        prefer_prev = ambiguous & ~self.dst[prev] & self.dst[k]
+        idx = np.where((in_prev & ~in_k) | prefer_prev, prev, k)
+
+        status = np.full(local.shape, OK, dtype=np.int8)
+        status[ambiguous] = AMBIGUOUS
+        status[~in_k & ~in_prev] = NONEXISTENT
+
+        offsets = self.offsets[idx]
+        utc = (local - offsets).astype("datetime64[s]")
+        return utc, offsets, status
+
+
+@lru_cache(maxsize=None)
+def get_offset_table(zone: str) -> OffsetTable:
+    """Compiled table for `zone`, built once per process."""
+    return OffsetTable.from_pytz(zone)
+
+
+def local_to_utc(
+    zone: str, naive_datetimes: Union[Sequence[datetime], np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bulk localization of naive wall times in `zone`; see OffsetTable.local_to_utc."""
+    return get_offset_table(zone).local_to_utc(naive_datetimes)
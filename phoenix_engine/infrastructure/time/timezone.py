@@ -0,0 +1,129 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from timezonefinder import TimezoneFinder
+
+
+class TimezoneResolver:
+    """
+    Process-wide, thread-safe coordinates -> IANA timezone service.
+
+    TimezoneFinder is built once (lazily, or eagerly through warm()). Lookups are cached in an
+    LRU keyed by a quantized (lat, lon) cell: when the four corners of a cell fall in the same
+    zone the cell is far from any boundary and every later point inside it is answered from
+    the cache. Cells that straddle a boundary fall back to an exact lookup per point.
+    (An enclave smaller than one cell can hide between uniform corners; keep cell_deg small.)
+    """
+
+    # Large population centres, resolved at warm-up so their cells are hot from the first request
+    WARM_POINTS = [
+        (35.6892, 51.3890), (32.6546, 51.6680), (36.2605, 59.6168), (29.5918, 52.5837),
+        (51.5074, -0.1278), (40.7128, -74.0060), (34.0522, -118.2437), (48.8566, 2.3522),
+        (52.5200, 13.4050), (55.7558, 37.6173), (41.0082, 28.9784), (25.2048, 55.2708),
+        (28.6139, 77.2090), (19.0760, 72.8777), (35.6762, 139.6503), (-33.8688, 151.2093),
+    ]
+
+    def __init__(self, cell_deg: float = 0.01, maxsize: int = 200_000):
+        self.cell_deg = cell_deg
+        self.maxsize = maxsize
+        self._finder: Optional[TimezoneFinder] = None
+        self._finder_lock = threading.RLock()
+        self._lock = threading.Lock()
+        # cell -> zone (uniform cell) or None (boundary cell: exact lookups only)
+        self._cells: "OrderedDict[Tuple[int, int], Optional[str]]" = OrderedDict()
+        self._points: "OrderedDict[Tuple[float, float], Optional[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def finder(self) -> TimezoneFinder:
+        if self._finder is None:
+            with self._finder_lock:
+                if self._finder is None:
+                    self._finder = TimezoneFinder()
+        return self._finder
+
+    def _lookup(self, lat: float, lon: float) -> Optional[str]:
+        # TimezoneFinder instances are not documented as thread-safe
+        with self._finder_lock:
+            return self.finder.timezone_at(lng=lon, lat=lat)
+
+    def timezone_at(self, lat: float, lon: float) -> Optional[str]:
+        """IANA zone name at (lat, lon), or None (e.g. open ocean without a zone)."""
+        cell = (int(lat // self.cell_deg), int(lon // self.cell_deg))
+        point = (round(lat, 6), round(lon, 6))
+
+        with self._lock:
+            if cell in self._cells:
+                zone = self._cells[cell]
+                self._cells.move_to_end(cell)
+                if zone is not None:
+                    self.hits += 1
+                    return zone
+                if point in self._points:
+                    self._points.move_to_end(point)
+                    self.hits += 1
+                    return self._points[point]
+                known_cell = True
+            else:
+                known_cell = False
+
+        if not known_cell:
+            corners = {
+                self._lookup(min(90.0, (cell[0] + dy) * self.cell_deg), (cell[1] + dx) * self.cell_deg)
+                for dy in (0, 1) for dx in (0, 1)
+            }
+            uniform = corners.pop() if len(corners) == 1 else None
+            with self._lock:
+                self._remember(self._cells, cell, uniform)
+            if uniform is not None:
+                with self._lock:
+                    self.misses += 1
+                return uniform
+
+        zone = self._lookup(lat, lon)
+        with self._lock:
+            self.misses += 1
+            self._remember(self._points, point, zone)
+        return zone
+
+    def _remember(self, store: OrderedDict, key, value):
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.maxsize:
+            store.popitem(last=False)
+
+    def warm(self, points: Optional[Iterable[Tuple[float, float]]] = None):
+        """Builds the finder and pre-resolves `points` (defaults to WARM_POINTS)."""
+        for lat, lon in (points if points is not None else self.WARM_POINTS):
+            self.timezone_at(lat, lon)
+
+    def clear(self):
+        with self._lock:
+            self._cells.clear()
+            self._points.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cells": len(self._cells),
+                "boundary_points": len(self._points),
+            }
+
+
+_default_resolver = TimezoneResolver()
+
+
+def get_timezone_resolver() -> TimezoneResolver:
+    return _default_resolver
+
+
+def set_timezone_resolver(resolver: TimezoneResolver):
+    """Replace the process-wide resolver (e.g. with a different cell size)."""
+    global _default_resolver
+    _default_resolver = resolver
@@ -1,49 +1,44 @@
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.vedic.calculations.dashas.yogini import YoginiDashaEngine
 from phoenix_engine.vedic.calculations.dashas.chara import CharaDashaEngine
 from phoenix_engine.vedic.calculations.dashas.narayana import NarayanaDashaEngine
 from phoenix_engine.vedic.calculations.dashas.sudasa import SudasaDashaEngine
+from phoenix_engine.vedic.calculations.dashas.periods import year_length
+from phoenix_engine.vedic.calculations.dashas.interval_index import DashaIntervalIndex
 
 
 class AdvancedDashasPlugin(IChartPlugin):
+    provides = ("dashas.advanced",)
+    requires = ("positions",)
+
     @property
     def name(self): return "Advanced Dasha Systems (Phase 3)"
 
     def execute(self, ctx):
         # Init container if not exists
-        if 'dashas' not in ctx.analysis:
-            ctx.analysis['dashas'] = {}
-            
-        # Build aware datetime from context input
-        try:
-            tz = ZoneInfo(ctx.input.timezone)
-            birth_dt = datetime(
-                ctx.input.year, ctx.input.month, ctx.input.day,
-                ctx.input.hour, ctx.input.minute, tzinfo=tz
-            )
-        except Exception:
-            birth_dt = datetime(
-                ctx.input.year, ctx.input.month, ctx.input.day,
-                ctx.input.hour, ctx.input.minute
-            )
-        
+        ctx.analysis.setdefault('dashas', {})
+
+        # All systems run on the same JD timeline and dasha year length
+        birth_jd = ctx.jd_ut
+        days_per_year = year_length(ctx.config)
+        asc_sign = int(ctx.ascendant / 30) + 1
+        trees = {}
+
         # 1. Yogini Dasha
         if 'Moon' in ctx.planets:
-            moon_lon = ctx.planets['Moon'].longitude
-            yogini_list = YoginiDashaEngine.calculate(moon_lon, birth_dt)
-            ctx.analysis['dashas']['yogini'] = yogini_list
-            
+            trees['yogini'] = YoginiDashaEngine.tree(ctx.planets['Moon'].longitude, birth_jd, days_per_year)
+
         # 2. Chara Dasha (K.N. Rao)
-        asc_sign = int(ctx.ascendant / 30) + 1
-        chara_list = CharaDashaEngine.calculate(asc_sign, ctx.planets, birth_dt)
-        ctx.analysis['dashas']['chara_knr'] = chara_list
+        trees['chara_knr'] = CharaDashaEngine.tree(asc_sign, ctx.planets, birth_jd, days_per_year)
 
         # 3. Narayana Dasha (General)
-        narayana_list = NarayanaDashaEngine.calculate(asc_sign, ctx.planets, birth_dt)
-        ctx.analysis['dashas']['narayana'] = narayana_list
+        trees['narayana'] = NarayanaDashaEngine.tree(asc_sign, ctx.planets, birth_jd, days_per_year)
 
         # 4. Sudasa Dasha (JHora Logic)
-        sudasa_list = SudasaDashaEngine.calculate(ctx.ascendant, ctx.planets, birth_dt)
-        ctx.analysis['dashas']['sudasa'] = sudasa_list
+        trees['sudasa'] = SudasaDashaEngine.tree(ctx.ascendant, ctx.planets, birth_jd, days_per_year)
+
+        for system, tree in trees.items():
+            ctx.dasha_trees[system] = tree
+            # Interval indexes for "active period at t" lookups (maha and antar)
+            ctx.dasha_indexes[system] = DashaIntervalIndex.from_tree(tree, depth=2)
+            ctx.analysis['dashas'][system] = tree.to_list(depth=1)
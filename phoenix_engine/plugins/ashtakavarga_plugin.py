@@ -3,6 +3,9 @@ from phoenix_engine.vedic.calculations.ashtakavarga import AshtakavargaEngine
 
 
 class AshtakavargaPlugin(IChartPlugin):
+    provides = ("ashtakavarga",)
+    requires = ("positions",)
+
     @property
     def name(self): return "Ashtakavarga System (Phase 7)"
 
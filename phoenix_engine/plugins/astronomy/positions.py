@@ -4,6 +4,8 @@ from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 from phoenix_engine.domain.celestial import PlanetPosition
 
 class PlanetaryPositionsPlugin(IChartPlugin):
+    provides = ("positions",)
+
     @property
     def name(self): return "Swiss Ephemeris Astronomy"
 
@@ -1,10 +1,19 @@
-
 from abc import ABC, abstractmethod
+from typing import Tuple
 from phoenix_engine.core.context import ChartContext
 
 class IChartPlugin(ABC):
     "قرارداد کلی تمام پلاگین‌های محاسباتی"
-    
+
+    # Data contract used by the PluginScheduler (names of ctx.analysis sections / ctx state)
+    provides: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    # Soft dependencies: ordered before this plugin when scheduled, never pulled in
+    uses: Tuple[str, ...] = ()
+
+    def __init__(self, config=None):
+        self.config = config
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -14,6 +14,8 @@ class BirthChartPlugin(IChartPlugin):
     Populates the ChartContext with high-fidelity celestial objects.
     """
 
+    provides = ("positions", "planets", "houses", "ascendant")
+
     def __init__(self, config):
         self.config = config
 
@@ -27,7 +29,7 @@ class BirthChartPlugin(IChartPlugin):
         if not getattr(ctx, "jd_ut", 0):
             raise ValueError("ChartContext.jd_ut is missing. TimeEngine must set it before BirthChartPlugin.")
 
-        astro_engine = SwissEphemerisEngine(ctx.config)
+        astro_engine = SwissEphemerisEngine(ctx.config, cache=ctx.ephemeris)
 
         # Calculate Houses & Ascendant first (needed for planet house assignment)
         houses_data = astro_engine.calculate_houses(
@@ -63,8 +65,7 @@ class BirthChartPlugin(IChartPlugin):
             "sign_name": astro_engine.sign_name(asc_sign),
         }
 
-        # Analysis payload (JSON-friendly)
-        ctx.analysis["planets"] = {p.name: p.model_dump() for p in planet_objects}
+        # Analysis payload (JSON-friendly); planets are dumped once, after the upagrahas
         ctx.analysis["houses"] = houses_struct
         ctx.analysis["ascendant"] = asc_struct
         ctx.analysis.setdefault("meta", {})["ayanamsa"] = houses_data.get("ayanamsa")
@@ -81,7 +82,7 @@ class BirthChartPlugin(IChartPlugin):
         """
         Calculates Gulika, Mandi, and Sun-based Upagrahas and injects them into ctx.planets.
         """
-        sw = SwissEphemeris(getattr(ctx.config, "ephemeris_path", None))
+        sw = SwissEphemeris(getattr(ctx.config, "ephemeris_path", None), cache=ctx.ephemeris)
 
         # Sun-based Upagrahas
         sun = ctx.get_planet("Sun")
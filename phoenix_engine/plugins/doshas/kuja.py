@@ -4,6 +4,9 @@ from phoenix_engine.core.context import ChartContext
 from phoenix_engine.domain.analysis import DoshaResult
 
 class KujaDoshaPlugin(IChartPlugin):
+    provides = ("dosha.manglik",)
+    requires = ("positions",)
+
     @property
     def name(self):
         return "Kuja Dosha Analyzer"
@@ -38,5 +41,5 @@ class KujaDoshaPlugin(IChartPlugin):
         }
         
         # Store in analysis bucket
-        if "dosha" not in ctx.analysis: ctx.analysis["dosha"] = {}
-        ctx.analysis["dosha"]["manglik"] = result
+        # setdefault is atomic: both dosha plugins share this dict from parallel threads
+        ctx.analysis.setdefault("dosha", {})["manglik"] = result
@@ -3,6 +3,9 @@ from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.core.context import ChartContext
 
 class KalaSarpaPlugin(IChartPlugin):
+    provides = ("dosha.kala_sarpa",)
+    requires = ("positions",)
+
     @property
     def name(self):
         return "Kala Sarpa Analyzer"
@@ -25,5 +28,5 @@ class KalaSarpaPlugin(IChartPlugin):
             "type": "None"
         }
         
-        if "dosha" not in ctx.analysis: ctx.analysis["dosha"] = {}
-        ctx.analysis["dosha"]["kala_sarpa"] = result
+        # setdefault is atomic: both dosha plugins share this dict from parallel threads
+        ctx.analysis.setdefault("dosha", {})["kala_sarpa"] = result
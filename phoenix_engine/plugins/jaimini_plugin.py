@@ -6,6 +6,9 @@ from phoenix_engine.vedic.calculations.jaimini.jaimini_yogas import JaiminiYogaE
 
 
 class JaiminiIndicatorsPlugin(IChartPlugin):
+    provides = ("jaimini",)
+    requires = ("positions",)
+
     @property
     def name(self):
         return "Jaimini Indicators & Yogas (Phase 4+5)"
@@ -14,15 +17,8 @@ class JaiminiIndicatorsPlugin(IChartPlugin):
         if 'jaimini' not in ctx.analysis:
             ctx.analysis['jaimini'] = {}
 
-        # Adapter: PlanetPosition -> dict for legacy engines
-        adapted_planets = {
-            name: {
-                "longitude": p.longitude,
-                "speed": p.speed,
-                "house": p.house,
-            }
-            for name, p in ctx.planets.items()
-        }
+        # Karaka/Arudha/Yoga engines read PlanetPosition attributes (degree, sign)
+        adapted_planets = ctx.planets
 
         # Allow configurable 7/8 Karaka mode (default 7)
         use_8 = getattr(ctx.config, "use_8_karakas", False)
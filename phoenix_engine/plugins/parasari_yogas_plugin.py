@@ -4,6 +4,9 @@ from phoenix_engine.core.context import ChartContext
 
 
 class ParasariYogasPlugin(IChartPlugin):
+    provides = ("parasari_yogas",)
+    requires = ("positions",)
+
     @property
     def name(self):
         return "Parasari Raja Yogas (Phase 5.5)"
@@ -3,6 +3,9 @@ from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.vedic.calculations.yoga import YogaEngine
 
 class PredictionPlugin(IChartPlugin):
+    provides = ("yogas",)
+    requires = ("positions",)
+
     @property
     def name(self): return "Predictive Analytics"
 
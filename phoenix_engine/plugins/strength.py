@@ -3,6 +3,9 @@ from phoenix_engine.vedic.calculations.strength import ShadbalaEngine
 
 
 class StrengthPlugin(IChartPlugin):
+    provides = ("shadbala",)
+    requires = ("positions",)
+
     @property
     def name(self): return "Shadbala Strength Engine (Phase 6)"
 
@@ -1,3 +1,5 @@
+import swisseph as swe
+
 from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 from phoenix_engine.vedic.calculations.upagraha import UpagrahaEngine
@@ -6,11 +8,14 @@ from phoenix_engine.domain.celestial import PlanetPosition
 
 
 class SubtleBodiesPlugin(IChartPlugin):
+    provides = ("subtle_bodies", "yogi_info")
+    requires = ("positions",)
+
     @property
     def name(self): return "Invisible Bodies & Special Lagnas"
 
     def execute(self, ctx):
-        swe = SwissEphemeris()
+        ephemeris = SwissEphemeris(sidereal_mode=ctx.ephemeris.sidereal_mode, cache=ctx.ephemeris)
         
         # 1. Sun-based Upagrahas
         # FIX: Check if Sun exists
@@ -22,20 +27,7 @@ class SubtleBodiesPlugin(IChartPlugin):
         
         # 2. Time-based Upagrahas (Mandi/Gulika)
         # FIX: Handle rise/set failure gracefully
-        sunrise_jd, sunset_jd = swe.get_rise_set(ctx.jd_ut, ctx.input.lat, ctx.input.lon)
-        
-        # Calculate Panchanga (Phase 2 Upgrade)
-        try:
-            from phoenix_engine.vedic.calculations.panchanga import PanchangaEngine
-            if 'Sun' in ctx.planets and 'Moon' in ctx.planets:
-                sun_lon = ctx.planets['Sun'].longitude
-                moon_lon = ctx.planets['Moon'].longitude
-                panchanga_data = PanchangaEngine.calculate_panchanga(
-                    ctx.jd_ut, sun_lon, moon_lon, sunrise_jd
-                )
-                ctx.analysis['panchanga'] = panchanga_data
-        except Exception:
-            pass
+        sunrise_jd, sunset_jd = ephemeris.get_rise_set(ctx.jd_ut, ctx.input.lat, ctx.input.lon)
         
         # If calculation failed (0.0), we can't compute accurate Mandi/Gulika
         # But UpagrahaEngine now handles 0.0 safely.
@@ -44,7 +36,7 @@ class SubtleBodiesPlugin(IChartPlugin):
         
         for k_name, k_jd in kuta_times.items():
             if k_jd == 0.0: continue # Skip if invalid
-            res = swe.calculate_houses_sidereal(k_jd, ctx.input.lat, ctx.input.lon)
+            res = ephemeris.calculate_houses_sidereal(k_jd, ctx.input.lat, ctx.input.lon)
             body_name = k_name.replace("_JD", "")
             self._add_body(ctx, body_name, res['ascendant'], "Upagraha")
             
@@ -55,10 +47,9 @@ class SubtleBodiesPlugin(IChartPlugin):
             hours_since_rise = dt_diff_days * 24.0
             
             # Sun position at Sunrise
-            # We calc it specifically for sunrise moment
+            # We calc it specifically for sunrise moment (Sun only, through the chart cache)
             try:
-                sun_rise_data = swe.calculate_planets(sunrise_jd)
-                sun_rise_pos = sun_rise_data['Sun']['longitude'] if 'Sun' in sun_rise_data else 0.0
+                sun_rise_pos = ephemeris.calculate_planets_batch([sunrise_jd], [swe.SUN])[0, 0, SwissEphemeris.LONGITUDE]
                 
                 hl = SpecialLagnaEngine.calculate_hora_lagna(sun_rise_pos, hours_since_rise)
                 gl = SpecialLagnaEngine.calculate_ghati_lagna(sun_rise_pos, hours_since_rise)
@@ -12,6 +12,9 @@ class TajakaChartPlugin(IChartPlugin):
     Requires a populated Birth Context (Planets & Houses) to find the exact solar return.
     """
 
+    provides = ("tajaka", "varshaphal")
+    requires = ("positions",)
+
     def __init__(self, config):
         self.config = config
 
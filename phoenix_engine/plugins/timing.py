@@ -1,30 +1,42 @@
-
 from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.vedic.calculations.dasha import DashaEngine
+from phoenix_engine.vedic.calculations.dashas.interval_index import DashaIntervalIndex
 from phoenix_engine.vedic.calculations.panchanga import PanchangaEngine
-from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
-from datetime import datetime
+from datetime import datetime, timezone
+import swisseph as swe
+
+class PanchangaPlugin(IChartPlugin):
+    provides = ("panchanga",)
+    requires = ("positions",)
+
+    @property
+    def name(self): return "Panchanga"
+
+    def execute(self, ctx):
+        # Only compute if not already provided by SubtleBodies
+        if 'panchanga' not in ctx.analysis:
+            ctx.analysis['panchanga'] = PanchangaEngine(ctx.config).calculate(ctx)
+
 
 class TimingPlugin(IChartPlugin):
+    provides = ("dashas.vimshottari", "current_dasha_chain")
+    requires = ("positions",)
+
     @property
     def name(self): return "Timing Systems"
 
     def execute(self, ctx):
-        # Panchanga (only compute if not already provided by SubtleBodies)
-        sun = ctx.planets['Sun'].longitude
-        moon = ctx.planets['Moon'].longitude
-        if 'panchanga' not in ctx.analysis:
-            swe = SwissEphemeris()
-            sunrise_jd, _ = swe.get_rise_set(ctx.jd_ut, ctx.input.lat, ctx.input.lon)
-            ctx.analysis['panchanga'] = PanchangaEngine.calculate_panchanga(
-                ctx.jd_ut, sun, moon, sunrise_jd
-            )
-
-        # Dashas (Vimshottari)
-        # We need the datetime object from context input
-        bd = ctx.input # BirthData
-        dt = datetime(bd.year, bd.month, bd.day, bd.hour, bd.minute) # Naive is ok for logic
-        
-        nested = DashaEngine.calculate_vimshottari_nested(moon, dt)
-        ctx.analysis['dashas'] = {"vimshottari": nested}
-        ctx.analysis['current_dasha_chain'] = DashaEngine.get_current_chain(nested, datetime.now())
+        # Dashas (Vimshottari), JD based; deeper levels are expanded only where they are read
+        tree = DashaEngine(ctx.config).vimshottari_tree(ctx)
+        if tree is None:
+            ctx.analysis.setdefault('dashas', {})['vimshottari'] = []
+            ctx.analysis['current_dasha_chain'] = []
+            return
+        ctx.dasha_trees['vimshottari'] = tree
+        ctx.dasha_indexes['vimshottari'] = DashaIntervalIndex.from_tree(tree, depth=2)
+        ctx.analysis.setdefault('dashas', {})['vimshottari'] = tree.to_list(depth=2)
+
+        # Maha -> prana running now
+        now = datetime.now(timezone.utc)
+        now_jd = swe.julday(now.year, now.month, now.day, now.hour + now.minute / 60.0 + now.second / 3600.0)
+        ctx.analysis['current_dasha_chain'] = [tree.node_dict(node) for node in tree.chain_at(now_jd)]
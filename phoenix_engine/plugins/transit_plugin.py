@@ -1,11 +1,19 @@
+import swisseph as swe
 from datetime import datetime
 from phoenix_engine.plugins.base import IChartPlugin
 from phoenix_engine.core.context import ChartContext
 from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+from phoenix_engine.vedic.calculations.events import EventFinder
+from phoenix_engine.vedic.calculations.event_calendar import get_event_calendar
 from phoenix_engine.vedic.calculations.gochar import GocharEngine
+from phoenix_engine.vedic.calculations.dashas.interval_index import DashaIntervalIndex
 
 
 class TransitAnalysisPlugin(IChartPlugin):
+    provides = ("transits",)
+    requires = ("positions", "ashtakavarga")
+    uses = ("jaimini", "dashas.vimshottari")
+
     @property
     def name(self): return "Transit Analysis System (Smart Gochar - Phase 8)"
 
@@ -34,37 +42,47 @@ class TransitAnalysisPlugin(IChartPlugin):
         # Temporal fallback: use prediction_start_date if provided, else now
         target_dt = getattr(ctx, 'prediction_start_date', datetime.now())
         target_date_str = target_dt.strftime("%Y-%m-%d")
-        if 'dashas' in ctx.analysis and 'vimshottari' in ctx.analysis['dashas']:
-            for d in ctx.analysis['dashas']['vimshottari']:
-                if d['start'] <= target_date_str <= d['end']:
-                    context["active_dasha_lords"].append(d['lord'])
-                    break
+        index = ctx.dasha_indexes.get('vimshottari')
+        if index is None and 'vimshottari' in ctx.analysis.get('dashas', {}):
+            index = DashaIntervalIndex.from_periods(ctx.analysis['dashas']['vimshottari'])
+        if index is not None:
+            target_jd = swe.julday(target_dt.year, target_dt.month, target_dt.day,
+                                   target_dt.hour + target_dt.minute / 60.0)
+            maha_lord = index.labels_at([target_jd], level=1)[0]
+            if maha_lord:
+                context["active_dasha_lords"].append(maha_lord)
         
         # 3. Calc Raw Transits
-        raw_transits = TransitCalculator.get_daily_transits(target_dt, days_count=30)
+        days_count = 30
+        _, positions = TransitCalculator.get_daily_transit_array(target_dt, days_count=days_count)
         
-        # 4. Ingress Events
-        ingress_events = TransitCalculator.detect_ingress(raw_transits)
+        # 4. Ingress & Station Events (exact times, Moon included)
+        start_jd = swe.julday(target_dt.year, target_dt.month, target_dt.day, 0.0)
+        event_kinds = ("sign", "station")
+        calendar = get_event_calendar()
+        if calendar is not None and calendar.covers(start_jd, start_jd + days_count, event_kinds):
+            ingress_events = calendar.query(start_jd, start_jd + days_count, kinds=event_kinds)
+        else:
+            ingress_events = EventFinder().find(start_jd, start_jd + days_count, kinds=event_kinds)
         
         # 5. Smart Analysis
         asc_sign = int(ctx.ascendant / 30) + 1
-        # Adapt planets for Gochar Engine
-        adapted_planets = {
-            name: {
-                "longitude": p.longitude,
-                "house": p.house,
-                "speed": p.speed
-            }
-            for name, p in ctx.planets.items()
-        }
-
-        smart_data = GocharEngine.analyze_smart_series(
-            raw_transits,
-            adapted_planets,
+        grid = GocharEngine.analyze_grid(
+            positions,
+            list(TransitCalculator.PLANET_IDS),
             asc_sign,
+            GocharEngine.natal_moon_sign(ctx.planets),
             sav_scores,
-            context
+            context["active_dasha_lords"]
         )
+
+        # Nested JSON only at the edge (or columns when requested)
+        dates, timestamps = TransitCalculator.day_labels(target_dt, days_count)
+        output = getattr(ctx.config, "output", None)
+        if getattr(output, "columnar_transits", False):
+            smart_data = GocharEngine.to_columns(grid, dates)
+        else:
+            smart_data = GocharEngine.to_timeline(grid, dates, timestamps)
         
         # 6. Output
         ctx.analysis['transits'] = {
@@ -4,6 +4,9 @@ from phoenix_engine.vedic.calculations.varga import VargaEngine
 from phoenix_engine.domain.analysis import VargaInfo # Assuming model exists or dict
 
 class VargaPlugin(IChartPlugin):
+    provides = ("vargas",)
+    requires = ("positions",)
+
     @property
     def name(self): return "Shodashavarga"
 
@@ -2,7 +2,8 @@ from typing import Optional, Dict
 
 import pytz
 from geopy.geocoders import Nominatim
-from timezonefinder import TimezoneFinder
+
+from phoenix_engine.infrastructure.time.timezone import get_timezone_resolver
 
 
 class GeoLocator:
@@ -25,7 +26,7 @@ class GeoLocator:
 
     def __init__(self):
         self.geolocator = Nominatim(user_agent="phoenix_engine_v2")
-        self.tf = TimezoneFinder()
+        self.tz_resolver = get_timezone_resolver()
 
     def resolve_city(self, city_name: str) -> Optional[Dict]:
         """
@@ -42,7 +43,7 @@ class GeoLocator:
             location = self.geolocator.geocode(city_name)
             if location:
                 lat, lon = location.latitude, location.longitude
-                tz_str = self.tf.timezone_at(lng=lon, lat=lat) or "UTC"
+                tz_str = self.tz_resolver.timezone_at(lat, lon) or "UTC"
                 return {
                     "lat": lat,
                     "lon": lon,
@@ -1,8 +1,12 @@
-from typing import Dict, List, Any
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 import swisseph as swe
 
 from phoenix_engine.core.context import ChartContext
+from phoenix_engine.vedic.calculations.dashas.periods import (
+    GREGORIAN_YEAR, SAVANA_YEAR, SIDEREAL_YEAR, DashaNode, DashaTree, jd_to_date_str, year_length,
+)
 
 
 class DashaEngine:
@@ -33,71 +37,66 @@ class DashaEngine:
     # average_gregorian_year = 365.2425
     #
     # We use Sidereal Year by default to match JHora's primary logic unless configured otherwise.
-    SIDEREAL_YEAR = 365.256364
-    SAVANA_YEAR = 360.0
-    GREGORIAN_YEAR = 365.2425
+    SIDEREAL_YEAR = SIDEREAL_YEAR
+    SAVANA_YEAR = SAVANA_YEAR
+    GREGORIAN_YEAR = GREGORIAN_YEAR
 
     def __init__(self, config: Any = None):
         self.config = config
-        # Default to JHora Standard (Sidereal) if not specified
-        self.year_length = self.SIDEREAL_YEAR
-
-        # Future-proofing: Allow config to override year type (Savana/Gregorian)
-        if config and hasattr(config, "dasha_year_type"):
-            if config.dasha_year_type == "SAVANA":
-                self.year_length = self.SAVANA_YEAR
-            elif config.dasha_year_type == "GREGORIAN":
-                self.year_length = self.GREGORIAN_YEAR
+        # JHora standard (sidereal) unless config.dasha_year_type asks for savana/gregorian
+        self.year_length = year_length(config)
 
     @staticmethod
     def _jd_to_date_str(jd: float) -> str:
         """Converts Julian Day to YYYY-MM-DD string safely."""
-        y, m, d, _ = swe.revjul(jd)
-        return f"{y:04d}-{m:02d}-{int(d):02d}"
+        return jd_to_date_str(jd)
+
+    @staticmethod
+    def get_current_chain(dashas: List[Dict], when: datetime) -> List[Dict[str, Any]]:
+        """Maha -> Antar -> ... periods running at `when`, outermost first.
 
-    def _get_sub_periods_jd(
-        self, main_lord: str, start_jd: float, main_duration_years: float, level: int
-    ) -> List[Dict]:
-        """Recursive JD-based sub-period calculator."""
-        if level > 3:
-            return []
+        Aware datetimes are converted to UT; naive ones are taken as UT already,
+        so pass ``datetime.now(timezone.utc)`` rather than local ``datetime.now()``.
+        """
+        if when.tzinfo is not None:
+            when = when.astimezone(timezone.utc)
+        jd = swe.julday(when.year, when.month, when.day,
+                        when.hour + when.minute / 60.0 + when.second / 3600.0)
+        chain: List[Dict[str, Any]] = []
+        periods = dashas
+        while periods:
+            current = next((p for p in periods if p["start_jd"] <= jd < p["end_jd"]), None)
+            if current is None:
+                break
+            chain.append({k: v for k, v in current.items() if k != "sub_periods"})
+            periods = current.get("sub_periods", [])
+        return chain
 
-        sub_periods: List[Dict[str, Any]] = []
-        current_jd = start_jd
+    def sub_periods(self, parent: "DashaNode") -> List["DashaNode"]:
+        """The nine sub-periods of `parent`, starting with its own lord (JD arithmetic)."""
+        sub_periods: List[DashaNode] = []
+        current_jd = parent.start_jd
 
-        start_idx = self.DASHA_LORDS.index(main_lord)
+        start_idx = self.DASHA_LORDS.index(parent.lord)
         ordered_lords = self.DASHA_LORDS[start_idx:] + self.DASHA_LORDS[:start_idx]
 
         for sub_lord in ordered_lords:
             # Formula: SubPeriod = (MainPeriod * SubPeriodYears) / 120
-            sub_duration_years = (main_duration_years * self.DASHA_YEARS[sub_lord]) / 120.0
-            duration_days = sub_duration_years * self.year_length
-
-            end_jd = current_jd + duration_days
-
-            period_data = {
-                "lord": sub_lord,
-                "start": self._jd_to_date_str(current_jd),
-                "end": self._jd_to_date_str(end_jd),
-                "start_jd": current_jd,
-                "end_jd": end_jd,
-                "duration_years": round(sub_duration_years, 4),
-                "level": level,
-                "sub_periods": [],
-            }
-
-            sub_periods.append(period_data)
+            sub_duration_years = (parent.duration_years * self.DASHA_YEARS[sub_lord]) / 120.0
+            end_jd = current_jd + sub_duration_years * self.year_length
+            sub_periods.append(DashaNode(sub_lord, current_jd, end_jd, sub_duration_years, parent.level + 1))
             current_jd = end_jd
 
         return sub_periods
 
-    def calculate_vimshottari(self, ctx: ChartContext) -> List[Dict]:
+    def vimshottari_tree(self, ctx: ChartContext) -> Optional["VimshottariTree"]:
         """
-        Calculates Vimshottari Dasha using strict Julian Day arithmetic.
+        Lazy Vimshottari tree (maha -> prana) for the chart; None without a Moon.
+        Only the mahadashas are built here; every deeper level is generated on access.
         """
         moon = ctx.get_planet("Moon")
         if not moon:
-            return []
+            return None
 
         moon_lon = moon.longitude
         birth_jd = ctx.jd_ut
@@ -122,7 +121,7 @@ class DashaEngine:
         spent_days = spent_years * self.year_length
         theoretical_start_jd = birth_jd - spent_days
 
-        dashas: List[Dict[str, Any]] = []
+        roots: List[DashaNode] = []
         current_jd = theoretical_start_jd
 
         # 4. Generate Cycles (Covering 120+ years)
@@ -137,33 +136,34 @@ class DashaEngine:
                 end_jd = current_jd + duration_days
 
                 if end_jd > birth_jd:
-                    antardashas = self._get_sub_periods_jd(lord, current_jd, duration_years, 2)
-
-                    valid_antars = []
-                    for ad in antardashas:
-                        if ad["end_jd"] > birth_jd:
-                            if ad["start_jd"] < birth_jd:
-                                ad["start"] = self._jd_to_date_str(birth_jd)
-                            valid_antars.append(ad)
-
-                    display_start = self._jd_to_date_str(max(birth_jd, current_jd))
-
-                    dasha_entry = {
-                        "lord": lord,
-                        "start": display_start,
-                        "end": self._jd_to_date_str(end_jd),
-                        "start_jd": max(birth_jd, current_jd),
-                        "end_jd": end_jd,
-                        "duration_years": duration_years,
-                        "level": 1,
-                        "sub_periods": valid_antars,
-                    }
-                    dashas.append(dasha_entry)
+                    roots.append(DashaNode(lord, current_jd, end_jd, duration_years, 1))
 
                 current_jd = end_jd
-                if len(dashas) >= 15:
+                if len(roots) >= 15:
                     break
-            if len(dashas) >= 15:
+            if len(roots) >= 15:
                 break
 
-        return dashas
+        return VimshottariTree(roots, birth_jd, self)
+
+    def calculate_vimshottari(self, ctx: ChartContext) -> List[Dict]:
+        """
+        Calculates Vimshottari Dasha using strict Julian Day arithmetic.
+        Maha and antar periods as nested dicts; see vimshottari_tree for deeper levels.
+        """
+        tree = self.vimshottari_tree(ctx)
+        return tree.to_list(depth=2) if tree is not None else []
+
+
+class VimshottariTree(DashaTree):
+    """
+    Vimshottari periods to full depth (maha, antar, pratyantar, sookshma, prana), expanded
+    lazily. Nodes hold only JD bounds; calendar dates are produced by to_list()/node_dict()
+    at serialization time. Lookups descend with binary searches and expand only the nodes on
+    their path, so zooming into one week of prana periods touches a few dozen nodes instead
+    of the ~100k a fully materialized tree would hold.
+    """
+
+    def __init__(self, roots: List[DashaNode], birth_jd: float, engine: DashaEngine):
+        super().__init__(roots, birth_jd, engine.sub_periods)
+        self.engine = engine
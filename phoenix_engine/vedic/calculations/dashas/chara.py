@@ -1,6 +1,9 @@
 from typing import Dict, List, Any
-from datetime import timedelta
 from phoenix_engine.vedic.const import ODD_FOOTED_SIGNS, EVEN_FOOTED_SIGNS, EXALTATION_SIGNS, DEBILITATION_SIGNS
+from phoenix_engine.vedic.calculations.dashas.periods import (
+    SIDEREAL_YEAR, SIGN_DASHA_DEPTH, SIGN_NAMES, DashaTree, SignPeriods, chara_antar_direction, normalize_sign,
+    sequence,
+)
 
 
 class CharaDashaEngine:
@@ -45,35 +48,28 @@ class CharaDashaEngine:
         return duration
 
     @staticmethod
-    def calculate(asc_sign: int, planets: Dict[str, Any], birth_date: Any) -> List[Dict]:
-        dashas = []
-        curr_date = birth_date
-        
+    def direction(asc_sign: int) -> int:
+        """+1 (zodiacal) or -1, from the footedness of the 9th house."""
         ninth_house = asc_sign + 8
         if ninth_house > 12:
             ninth_house -= 12
         ninth_idx = ninth_house - 1
-        
-        direction = -1 if ninth_idx in EVEN_FOOTED_SIGNS else 1
-            
-        curr_sign = asc_sign
-        sign_names = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        
-        for _ in range(12):
-            dur = CharaDashaEngine.calculate_duration(curr_sign, planets)
-            end_date = curr_date + timedelta(days=dur * 365.256363)
-            
-            dashas.append({
-                "sign_name": sign_names[curr_sign-1],
-                "duration": dur,
-                "end_date": end_date.strftime("%Y-%m-%d")
-            })
-            curr_date = end_date
-            
-            curr_sign += direction
-            if curr_sign > 12:
-                curr_sign = 1
-            elif curr_sign < 1:
-                curr_sign = 12
-            
-        return dashas
+        return -1 if ninth_idx in EVEN_FOOTED_SIGNS else 1
+
+    @staticmethod
+    def tree(asc_sign: int, planets: Dict[str, Any], birth_jd: float,
+             days_per_year: float = SIDEREAL_YEAR) -> DashaTree:
+        direction = CharaDashaEngine.direction(asc_sign)
+        signs = [normalize_sign(asc_sign + direction * i) for i in range(12)]
+        entries = (
+            (SIGN_NAMES[s - 1], CharaDashaEngine.calculate_duration(s, planets), {"sign": s, "sign_name": SIGN_NAMES[s - 1]})
+            for s in signs
+        )
+        roots = sequence(entries, birth_jd, days_per_year)
+        # Antardashas follow their mahadasha sign's own direction (K.N. Rao)
+        return DashaTree(roots, birth_jd, SignPeriods(chara_antar_direction, days_per_year), max_depth=SIGN_DASHA_DEPTH)
+
+    @staticmethod
+    def calculate(asc_sign: int, planets: Dict[str, Any], birth_jd: float,
+                  days_per_year: float = SIDEREAL_YEAR) -> List[Dict]:
+        return CharaDashaEngine.tree(asc_sign, planets, birth_jd, days_per_year).to_list(depth=1)
@@ -0,0 +1,122 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+
+def _date_to_jd(value: str) -> float:
+    """'YYYY-MM-DD' (as the dasha engines print it) -> JD at 0h UT."""
+    y, m, d = (int(part) for part in value[:10].split("-"))
+    return swe.julday(y, m, d, 0.0)
+
+
+class DashaIntervalIndex:
+    """
+    Per-level sorted interval arrays over a dasha tree.
+
+    Periods of one level never overlap and, concatenated across parents, are already in time
+    order, so each level is a pair of sorted (start, end) arrays. "Which period runs at t" is
+    one searchsorted per level, and a whole vector of instants is answered at once. Works for
+    any system: Vimshottari trees, and the nested period lists of Yogini, Chara, Narayana and
+    Sudasa (bounds from start_jd/end_jd, or from 'start'/'end'/'end_date' strings, a missing
+    start being the previous period's end).
+    """
+
+    def __init__(self, levels: List[List[Dict[str, Any]]]):
+        self.periods = levels
+        self.starts = [np.array([p["start_jd"] for p in level], dtype=float) for level in levels]
+        self.ends = [np.array([p["end_jd"] for p in level], dtype=float) for level in levels]
+
+    @property
+    def depth(self) -> int:
+        return len(self.periods)
+
+    # --- Building ---
+    @classmethod
+    def from_periods(cls, periods: Sequence[Dict[str, Any]], start_jd: Optional[float] = None) -> "DashaIntervalIndex":
+        """Index over nested period dicts (sub_periods optional). `start_jd` opens the first period."""
+        levels: List[List[Dict[str, Any]]] = []
+
+        def visit(items: Sequence[Dict[str, Any]], level: int, opening_jd: Optional[float]):
+            previous_end = opening_jd
+            for item in items:
+                end_jd = item.get("end_jd")
+                if end_jd is None:
+                    end_jd = _date_to_jd(item.get("end") or item["end_date"])
+                begin_jd = item.get("start_jd")
+                if begin_jd is None:
+                    begin_jd = _date_to_jd(item["start"]) if item.get("start") else previous_end
+                if begin_jd is None:
+                    begin_jd = -np.inf
+
+                while len(levels) <= level:
+                    levels.append([])
+                entry = {k: v for k, v in item.items() if k != "sub_periods"}
+                entry.update({"start_jd": begin_jd, "end_jd": end_jd, "level": level + 1})
+                levels[level].append(entry)
+
+                if item.get("sub_periods"):
+                    visit(item["sub_periods"], level + 1, begin_jd)
+                previous_end = end_jd
+
+        visit(periods, 0, start_jd)
+        return cls(levels)
+
+    @classmethod
+    def from_tree(cls, tree: Any, depth: int = 2) -> "DashaIntervalIndex":
+        """Index over a VimshottariTree down to `depth` (expands those levels)."""
+        levels: List[List[Dict[str, Any]]] = [[] for _ in range(depth)]
+        stack = list(reversed(tree.roots))
+        while stack:
+            node = stack.pop()
+            entry = tree.node_dict(node)
+            # True bounds, so sub-periods running at birth keep tiling their parent
+            entry["start_jd"] = node.start_jd
+            levels[node.level - 1].append(entry)
+            if node.level < depth:
+                stack.extend(reversed(tree.children(node)))
+        return cls(levels)
+
+    # --- Queries ---
+    def active_indices(self, jds: Sequence[float]) -> np.ndarray:
+        """
+        (len(jds), depth) int array: index into self.periods[level] of the period running at
+        each instant, or -1 where none does (before the first / after the last period).
+        """
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        out = np.full((len(jds), self.depth), -1, dtype=np.int64)
+        for level in range(self.depth):
+            if not len(self.starts[level]):
+                continue
+            idx = np.searchsorted(self.starts[level], jds, side="right") - 1
+            safe = np.clip(idx, 0, None)
+            inside = (idx >= 0) & (jds < self.ends[level][safe])
+            out[:, level] = np.where(inside, idx, -1)
+        return out
+
+    def chain_at(self, jd: float) -> List[Dict[str, Any]]:
+        """Periods running at `jd`, outermost first."""
+        chain = []
+        for level, idx in enumerate(self.active_indices([jd])[0]):
+            if idx < 0:
+                break
+            chain.append(self.periods[level][idx])
+        return chain
+
+    def labels_at(self, jds: Sequence[float], level: int = 1, field: str = "lord") -> List[Optional[str]]:
+        """Vectorized: the `field` (e.g. lord, sign_name) of the level-`level` period at each instant."""
+        periods = self.periods[level - 1]
+        return [
+            periods[i].get(field) if i >= 0 else None
+            for i in self.active_indices(jds)[:, level - 1].tolist()
+        ]
+
+    def periods_between(self, start_jd: float, end_jd: float, level: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Periods overlapping [start_jd, end_jd), of one level or of every level (outermost first)."""
+        levels = range(self.depth) if level is None else [level - 1]
+        found: List[Dict[str, Any]] = []
+        for lv in levels:
+            lo = np.searchsorted(self.ends[lv], start_jd, side="right")
+            hi = np.searchsorted(self.starts[lv], end_jd, side="left")
+            found.extend(self.periods[lv][lo:hi])
+        return found
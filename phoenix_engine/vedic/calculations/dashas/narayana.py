@@ -1,5 +1,8 @@
 from typing import Dict, List, Any
 from phoenix_engine.vedic.calculations.dashas.chara import CharaDashaEngine
+from phoenix_engine.vedic.calculations.dashas.periods import (
+    SIDEREAL_YEAR, SIGN_DASHA_DEPTH, SIGN_NAMES, DashaTree, SignPeriods, sequence,
+)
 
 
 class NarayanaDashaEngine:
@@ -78,9 +81,8 @@ class NarayanaDashaEngine:
         return sequence
 
     @staticmethod
-    def calculate(ascendant_sign: int, planets: Dict[str, Any], birth_date: Any) -> List[Dict]:
-        dashas = []
-        
+    def tree(ascendant_sign: int, planets: Dict[str, Any], birth_jd: float,
+             days_per_year: float = SIDEREAL_YEAR) -> DashaTree:
         # 1. پیدا کردن نقطه شروع (Arambha)
         sign_1 = ascendant_sign
         sign_7 = ascendant_sign + 6
@@ -93,10 +95,7 @@ class NarayanaDashaEngine:
         signs_seq = NarayanaDashaEngine.get_progression_sequence(start_sign)
         
         # 3. محاسبه داشاها
-        current_date = birth_date
-        sign_names = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", 
-                      "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        
+        entries = []
         for sign_id in signs_seq:
             lord_pos = CharaDashaEngine.get_stronger_lord(sign_id, planets)
             
@@ -107,22 +106,16 @@ class NarayanaDashaEngine:
             duration = dist - 1
             if duration == 0:
                 duration = 12
-            
-            try:
-                end_date = current_date.replace(year=current_date.year + duration)
-            except ValueError:
-                safe_date = current_date.replace(month=2, day=28)
-                end_date = safe_date.replace(year=current_date.year + duration)
-            
-            dashas.append({
-                "sign_id": sign_id,
-                "sign_name": sign_names[sign_id - 1],
-                "ruler_pos": lord_pos,
-                "duration_years": duration,
-                "start": current_date.strftime("%Y-%m-%d"),
-                "end": end_date.strftime("%Y-%m-%d")
-            })
-            
-            current_date = end_date
-            
-        return dashas
+
+            info = {"sign": sign_id, "sign_id": sign_id, "sign_name": SIGN_NAMES[sign_id - 1], "ruler_pos": lord_pos}
+            entries.append((SIGN_NAMES[sign_id - 1], duration, info))
+
+        # Antardashas run from the next sign, forward for odd signs and backward for even ones
+        direction = lambda sign: 1 if sign % 2 else -1
+        return DashaTree(sequence(entries, birth_jd, days_per_year), birth_jd,
+                         SignPeriods(direction, days_per_year), max_depth=SIGN_DASHA_DEPTH)
+
+    @staticmethod
+    def calculate(ascendant_sign: int, planets: Dict[str, Any], birth_jd: float,
+                  days_per_year: float = SIDEREAL_YEAR) -> List[Dict]:
+        return NarayanaDashaEngine.tree(ascendant_sign, planets, birth_jd, days_per_year).to_list(depth=1)
@@ -0,0 +1,216 @@
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from phoenix_engine.infrastructure.time.julian import jd_to_date_strings
+from phoenix_engine.vedic.const import ODD_FOOTED_SIGNS
+
+
+# Dasha year lengths in days (JHora: sidereal by default, savana and average gregorian on request)
+SIDEREAL_YEAR = 365.256364
+SAVANA_YEAR = 360.0
+GREGORIAN_YEAR = 365.2425
+YEAR_LENGTHS = {"SIDEREAL": SIDEREAL_YEAR, "SAVANA": SAVANA_YEAR, "GREGORIAN": GREGORIAN_YEAR}
+
+# Sign dashas are subdivided down to pratyantar (twelfths of twelfths)
+SIGN_DASHA_DEPTH = 3
+
+SIGN_NAMES = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+              "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+
+def year_length(config: Any = None) -> float:
+    """Days per dasha year for `config.dasha_year_type` (SIDEREAL, SAVANA, GREGORIAN)."""
+    return YEAR_LENGTHS.get(str(getattr(config, "dasha_year_type", "") or "").upper(), SIDEREAL_YEAR)
+
+
+def jd_to_date_str(jd: float) -> str:
+    """Converts Julian Day to YYYY-MM-DD string safely."""
+    return jd_to_date_strings(jd)[0]
+
+
+def normalize_sign(sign: int) -> int:
+    return (sign - 1) % 12 + 1
+
+
+def chara_antar_direction(sign: int) -> int:
+    """
+    Direction of the antardashas inside a Chara dasha of `sign` (K.N. Rao): +1 for the
+    odd-footed (savya) signs, -1 for the even-footed ones. Shared by every Chara dasha path.
+    """
+    return 1 if sign - 1 in ODD_FOOTED_SIGNS else -1
+
+
+class DashaNode:
+    """
+    One period of a dasha tree, bounded by Julian Days. `info` carries the system's own
+    descriptive fields (ruler, sign number, ...); `children` are generated on first read.
+    """
+
+    __slots__ = ("lord", "start_jd", "end_jd", "duration_years", "level", "info", "_children")
+
+    def __init__(self, lord: str, start_jd: float, end_jd: float, duration_years: float, level: int,
+                 info: Optional[Dict[str, Any]] = None):
+        self.lord = lord
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.duration_years = duration_years
+        self.level = level
+        self.info = info
+        self._children: Optional[List["DashaNode"]] = None
+
+    @property
+    def is_expanded(self) -> bool:
+        return self._children is not None
+
+    def __repr__(self):
+        return f"<DashaNode L{self.level} {self.lord} {self.start_jd:.3f}-{self.end_jd:.3f}>"
+
+
+def sequence(entries: Iterable[Tuple[str, float, Optional[Dict[str, Any]]]], start_jd: float,
+             days_per_year: float, level: int = 1) -> List[DashaNode]:
+    """Back-to-back periods from (lord, years, info) entries, starting at `start_jd`."""
+    nodes: List[DashaNode] = []
+    current_jd = start_jd
+    for lord, years, info in entries:
+        end_jd = current_jd + years * days_per_year
+        nodes.append(DashaNode(lord, current_jd, end_jd, years, level, info))
+        current_jd = end_jd
+    return nodes
+
+
+class DashaTree:
+    """
+    Periods of any dasha system as a tree of JD-bounded nodes, expanded lazily through the
+    system's `subdivide(node)` rule. Calendar dates are produced only by to_list()/node_dict()
+    at serialization time, and lookups expand only the nodes on their path, so every system
+    feeds the same interval indexes, caches and serializers.
+    """
+
+    MAX_DEPTH = 5
+    LEVEL_NAMES = {1: "maha", 2: "antar", 3: "pratyantar", 4: "sookshma", 5: "prana"}
+
+    def __init__(self, roots: List[DashaNode], birth_jd: float,
+                 subdivide: Callable[[DashaNode], List[DashaNode]], max_depth: Optional[int] = None):
+        self.roots = roots
+        self.birth_jd = birth_jd
+        self.subdivide = subdivide
+        self.max_depth = max_depth or self.MAX_DEPTH
+        self.materialized = len(roots)
+
+    def children(self, node: DashaNode) -> List[DashaNode]:
+        if node._children is None:
+            node._children = self.subdivide(node) if node.level < self.max_depth else []
+            self.materialized += len(node._children)
+        return node._children
+
+    def expand(self, depth: Optional[int] = None) -> "DashaTree":
+        """Materializes every period down to `depth` (1 = maha only)."""
+        depth = depth or self.max_depth
+        stack = list(self.roots)
+        while stack:
+            node = stack.pop()
+            if node.level < depth:
+                stack.extend(self.children(node))
+        return self
+
+    def chain_at(self, jd: float, depth: Optional[int] = None) -> List[DashaNode]:
+        """Periods running at `jd`, outermost first (empty outside the tree)."""
+        depth = depth or self.max_depth
+        chain: List[DashaNode] = []
+        periods = self.roots
+        while periods and len(chain) < depth:
+            idx = bisect_right([p.end_jd for p in periods], jd)
+            if idx == len(periods) or periods[idx].start_jd > jd:
+                break
+            chain.append(periods[idx])
+            periods = self.children(periods[idx]) if len(chain) < depth else []
+        return chain
+
+    def periods_between(self, start_jd: float, end_jd: float, depth: Optional[int] = None) -> Iterator[DashaNode]:
+        """Periods of level `depth` overlapping [start_jd, end_jd), in time order."""
+        depth = depth or self.max_depth
+
+        def walk(periods: List[DashaNode]) -> Iterator[DashaNode]:
+            for node in periods:
+                if node.end_jd <= start_jd:
+                    continue
+                if node.start_jd >= end_jd:
+                    break
+                if node.level == depth:
+                    yield node
+                else:
+                    yield from walk(self.children(node))
+
+        return walk(self.roots)
+
+    # --- Serialization ---
+    def node_dict(self, node: DashaNode, start: Optional[str] = None, end: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Flat period dict (no sub_periods); periods running at birth display from birth.
+        `start`/`end` take dates already formatted in bulk by to_list().
+        """
+        start_jd = max(self.birth_jd, node.start_jd)
+        entry = {
+            "lord": node.lord,
+            "start": start or jd_to_date_str(start_jd),
+            "end": end or jd_to_date_str(node.end_jd),
+            # Mahadashas report the clipped start, sub-periods their true start (legacy layout)
+            "start_jd": start_jd if node.level == 1 else node.start_jd,
+            "end_jd": node.end_jd,
+            "duration_years": node.duration_years if node.level == 1 else round(node.duration_years, 4),
+            "level": node.level,
+        }
+        if node.info:
+            entry.update(node.info)
+        return entry
+
+    def to_list(self, depth: int = 2, periods: Optional[List[DashaNode]] = None) -> List[Dict[str, Any]]:
+        """Nested dicts down to `depth`, skipping periods that ended before birth."""
+        periods = self.roots if periods is None else periods
+
+        def walk(nodes: List[DashaNode]) -> Iterator[DashaNode]:
+            for node in nodes:
+                if node.end_jd > self.birth_jd:
+                    yield node
+                    if node.level < depth:
+                        yield from walk(self.children(node))
+
+        # Every boundary of the export is formatted in one vectorized pass
+        order = list(walk(periods))
+        starts = jd_to_date_strings([max(self.birth_jd, n.start_jd) for n in order])
+        ends = jd_to_date_strings([n.end_jd for n in order])
+        dates = iter(zip(starts, ends))
+
+        def build(nodes: List[DashaNode]) -> List[Dict[str, Any]]:
+            out = []
+            for node in nodes:
+                if node.end_jd <= self.birth_jd:
+                    continue
+                entry = self.node_dict(node, *next(dates))
+                entry["sub_periods"] = build(self.children(node)) if node.level < depth else []
+                out.append(entry)
+            return out
+
+        return build(periods)
+
+
+class SignPeriods:
+    """
+    Sub-period rule shared by the Jaimini sign dashas: twelve equal parts, starting from the
+    sign after the parent's and moving in `direction_of(parent_sign)` (+1 or -1). Nodes keep
+    their sign number in info["sign"], so the rule applies again at every deeper level.
+    """
+
+    def __init__(self, direction_of: Callable[[int], int], days_per_year: float = SIDEREAL_YEAR):
+        self.direction_of = direction_of
+        self.days_per_year = days_per_year
+
+    def __call__(self, parent: DashaNode) -> List[DashaNode]:
+        sign = parent.info["sign"]
+        step = self.direction_of(sign)
+        years = parent.duration_years / 12.0
+        signs = [normalize_sign(sign + step * k) for k in range(1, 13)]
+        return sequence(
+            ((SIGN_NAMES[s - 1], years, {"sign": s, "sign_name": SIGN_NAMES[s - 1]}) for s in signs),
+            parent.start_jd, self.days_per_year, parent.level + 1,
+        )
@@ -1,7 +1,9 @@
 from typing import Dict, List, Any
-from datetime import timedelta
 from phoenix_engine.vedic.const import ODD_SIGNS, EVEN_SIGNS
 from phoenix_engine.vedic.calculations.dashas.chara import CharaDashaEngine
+from phoenix_engine.vedic.calculations.dashas.periods import (
+    SIDEREAL_YEAR, SIGN_DASHA_DEPTH, SIGN_NAMES, DashaTree, SignPeriods, normalize_sign, sequence,
+)
 
 
 class SudasaDashaEngine:
@@ -16,14 +18,14 @@ class SudasaDashaEngine:
         return sree_lagna_deg
 
     @staticmethod
-    def calculate(asc_lon: float, planets: Dict[str, Any], birth_date: Any) -> List[Dict]:
+    def tree(asc_lon: float, planets: Dict[str, Any], birth_jd: float,
+             days_per_year: float = SIDEREAL_YEAR) -> DashaTree:
         moon_lon = planets['Moon'].longitude
         sl_deg = SudasaDashaEngine.calculate_sree_lagna(asc_lon, moon_lon)
         sl_sign = int(sl_deg / 30) + 1
         
-        # Balance fraction of SL sign remaining
-        sl_sign_rem_deg = 30.0 - (sl_deg % 30)
-        balance_factor = sl_sign_rem_deg / 30.0
+        # Fraction of the SL sign already traversed (elapsed part of the first dasha)
+        elapsed_factor = (sl_deg % 30) / 30.0
         
         direction = 1 if (sl_sign-1) in ODD_SIGNS else -1
         
@@ -36,34 +38,17 @@ class SudasaDashaEngine:
         
         # Sequence: Kendras, Panaparas, Apoklimas from SL
         kendra_offsets = [0, 3, 6, 9, 1, 4, 7, 10, 2, 5, 8, 11]
-        
-        dashas = []
-        curr_date = birth_date
-        sign_names = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+        signs = [normalize_sign(sl_sign + offset * direction) for offset in kendra_offsets]
+        durations = [CharaDashaEngine.calculate_duration(s, planets) for s in signs]
+
+        entries = (
+            (SIGN_NAMES[s - 1], dur, {"sign": s, "sign_name": SIGN_NAMES[s - 1]})
+            for s, dur in zip(signs, durations)
+        )
+        roots = sequence(entries, birth_jd - durations[0] * elapsed_factor * days_per_year, days_per_year)
+        return DashaTree(roots, birth_jd, SignPeriods(lambda _: direction, days_per_year), max_depth=SIGN_DASHA_DEPTH)
 
-        for i, offset in enumerate(kendra_offsets):
-            shift = offset * direction
-            curr_sign = (sl_sign + shift)
-            while curr_sign > 12:
-                curr_sign -= 12
-            while curr_sign < 1:
-                curr_sign += 12
-            
-            dur = CharaDashaEngine.calculate_duration(curr_sign, planets)
-            
-            if i == 0:
-                real_dur = dur * balance_factor
-            else:
-                real_dur = dur
-                
-            end_date = curr_date + timedelta(days=real_dur * 365.256363)
-            
-            dashas.append({
-                "sign_name": sign_names[curr_sign-1],
-                "duration": round(real_dur, 2),
-                "full_duration": dur,
-                "end_date": end_date.strftime("%Y-%m-%d")
-            })
-            curr_date = end_date
-            
-        return dashas
+    @staticmethod
+    def calculate(asc_lon: float, planets: Dict[str, Any], birth_jd: float,
+                  days_per_year: float = SIDEREAL_YEAR) -> List[Dict]:
+        return SudasaDashaEngine.tree(asc_lon, planets, birth_jd, days_per_year).to_list(depth=1)
@@ -1,5 +1,6 @@
-from typing import Dict, List, Any
-from datetime import timedelta
+from typing import Dict, List
+
+from phoenix_engine.vedic.calculations.dashas.periods import SIDEREAL_YEAR, DashaNode, DashaTree, sequence
 
 
 class YoginiDashaEngine:
@@ -13,53 +14,41 @@ class YoginiDashaEngine:
         {"name": "Siddha",   "duration": 7, "ruler": "Venus"},
         {"name": "Sankata",  "duration": 8, "ruler": "Rahu"}
     ]
+    CYCLE_YEARS = 36
+    MAX_DEPTH = 3
+
+    @staticmethod
+    def _entries(start_idx: int, scale: float = 1.0, count: int = 8):
+        for i in range(count):
+            y = YoginiDashaEngine.YOGINIS[(start_idx + i) % 8]
+            yield y["name"], y["duration"] * scale, {"ruler": y["ruler"]}
+
+    @staticmethod
+    def sub_periods(parent: DashaNode, days_per_year: float = SIDEREAL_YEAR) -> List[DashaNode]:
+        """Eight sub-periods from the parent's own yogini, each parent * yogini / 36 years."""
+        start_idx = next(i for i, y in enumerate(YoginiDashaEngine.YOGINIS) if y["name"] == parent.lord)
+        scale = parent.duration_years / YoginiDashaEngine.CYCLE_YEARS
+        return sequence(YoginiDashaEngine._entries(start_idx, scale), parent.start_jd, days_per_year, parent.level + 1)
 
     @staticmethod
-    def calculate(moon_lon: float, birth_date: Any) -> List[Dict]:
+    def tree(moon_lon: float, birth_jd: float, days_per_year: float = SIDEREAL_YEAR) -> DashaTree:
         nak_raw = moon_lon / 13.333333333
         nak_index = int(nak_raw) + 1
         passed_percent = nak_raw % 1
-        remaining_percent = 1.0 - passed_percent
-        
+
         # JHora Logic: (Nak Index + 3) % 8. If 0 -> 8.
         start_idx_raw = (nak_index + 3) % 8
         start_idx = 8 if start_idx_raw == 0 else start_idx_raw
         list_idx = start_idx - 1
-        
-        start_yogini = YoginiDashaEngine.YOGINIS[list_idx]
-        balance_years = start_yogini["duration"] * remaining_percent
-        
-        dashas = []
-        current_date = birth_date
-        
-        # First Dasha
-        days_balance = int(balance_years * 365.256363)  # Sidereal year
-        end_date = current_date + timedelta(days=days_balance)
-        
-        dashas.append({
-            "lord": start_yogini["name"],
-            "ruler": start_yogini["ruler"],
-            "start": current_date.strftime("%Y-%m-%d"),
-            "end": end_date.strftime("%Y-%m-%d"),
-            "duration_years": round(balance_years, 2)
-        })
-        current_date = end_date
-        
-        # Next cycles (Full life ~100 years)
-        for i in range(1, 12):
-            next_idx = (list_idx + i) % 8
-            y = YoginiDashaEngine.YOGINIS[next_idx]
-            dur = y["duration"]
-            days = int(dur * 365.256363)
-            end_date = current_date + timedelta(days=days)
-            
-            dashas.append({
-                "lord": y["name"],
-                "ruler": y["ruler"],
-                "start": current_date.strftime("%Y-%m-%d"),
-                "end": end_date.strftime("%Y-%m-%d"),
-                "duration_years": dur
-            })
-            current_date = end_date
-            
-        return dashas
+
+        # The first yogini began before birth; its elapsed part is the Moon's run through the nakshatra
+        elapsed_years = YoginiDashaEngine.YOGINIS[list_idx]["duration"] * passed_percent
+        roots = sequence(YoginiDashaEngine._entries(list_idx, count=12), birth_jd - elapsed_years * days_per_year,
+                         days_per_year)
+        return DashaTree(roots, birth_jd, lambda node: YoginiDashaEngine.sub_periods(node, days_per_year),
+                         max_depth=YoginiDashaEngine.MAX_DEPTH)
+
+    @staticmethod
+    def calculate(moon_lon: float, birth_jd: float, days_per_year: float = SIDEREAL_YEAR) -> List[Dict]:
+        # 12 mahadashas (full life ~100 years)
+        return YoginiDashaEngine.tree(moon_lon, birth_jd, days_per_year).to_list(depth=1)
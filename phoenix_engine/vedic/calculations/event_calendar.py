@@ -0,0 +1,154 @@
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from phoenix_engine.vedic.calculations.events import EventFinder
+from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+
+class TransitEventCalendar:
+    """
+    Precomputed, natal-independent transit events (ingresses, stations, combustion,
+    nakshatra/pada/kakshya changes) for a fixed span of years.
+
+    Events are kept in one packed structured array sorted by (planet, kind, jd). A
+    (planet, kind) block is located with two binary searches on `key`, and a JD range
+    inside the block with two more, so a query costs O(log n) plus the size of the answer.
+    On disk the array is a plain .npy file (memory-mapped on load) with a small JSON sidecar
+    for the span.
+    """
+
+    PLANETS = list(TransitCalculator.PLANET_IDS)
+    KINDS = list(EventFinder.KINDS)
+    KIND_STRIDE = 16  # key = planet_index * KIND_STRIDE + kind_index
+
+    DTYPE = np.dtype([("key", "<u2"), ("jd", "<f8"), ("code", "<i2"), ("retro", "?")])
+
+    def __init__(self, events: np.ndarray, start_jd: float, end_jd: float, kinds: Optional[Iterable[str]] = None):
+        self.events = events
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+        self.kinds = list(kinds) if kinds is not None else list(self.KINDS)
+
+    # --- Building ---
+    @classmethod
+    def build(
+        cls,
+        start_jd: float,
+        end_jd: float,
+        kinds: Optional[Iterable[str]] = None,
+        finder: Optional[EventFinder] = None,
+        chunk_days: float = 366.0,
+    ) -> "TransitEventCalendar":
+        """Runs the EventFinder over [start_jd, end_jd] one chunk at a time (bounded memory)."""
+        finder = finder or EventFinder()
+        kinds = list(cls.KINDS) if kinds is None else list(kinds)
+
+        chunks = []
+        chunk_start = start_jd
+        while chunk_start < end_jd:
+            chunk_end = min(chunk_start + chunk_days, end_jd)
+            raw = finder.find_raw(chunk_start, chunk_end, kinds=kinds)
+            chunk = np.empty(len(raw), dtype=cls.DTYPE)
+            if raw:
+                jds, planets, event_kinds, codes, retros = zip(*raw)
+                chunk["key"] = [cls._key(p, k) for p, k in zip(planets, event_kinds)]
+                chunk["jd"] = jds
+                chunk["code"] = codes
+                chunk["retro"] = retros
+            chunks.append(chunk)
+            chunk_start = chunk_end
+
+        events = np.concatenate(chunks) if chunks else np.empty(0, dtype=cls.DTYPE)
+        events = events[np.lexsort((events["jd"], events["key"]))]
+        return cls(events, start_jd, end_jd, kinds)
+
+    @classmethod
+    def _key(cls, planet: str, kind: str) -> int:
+        return cls.PLANETS.index(planet) * cls.KIND_STRIDE + cls.KINDS.index(kind)
+
+    # --- Persistence ---
+    def save(self, path: str):
+        """Writes `path` (.npy event table) and `path + '.json'` (span metadata)."""
+        with open(path, "wb") as f:
+            np.save(f, self.events, allow_pickle=False)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump({"start_jd": self.start_jd, "end_jd": self.end_jd, "kinds": self.kinds}, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "TransitEventCalendar":
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        events = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return cls(events, meta["start_jd"], meta["end_jd"], meta["kinds"])
+
+    # --- Queries ---
+    def covers(self, start_jd: float, end_jd: float, kinds: Optional[Iterable[str]] = None) -> bool:
+        if kinds is not None and any(k not in self.kinds for k in kinds):
+            return False
+        return self.start_jd <= start_jd and end_jd <= self.end_jd
+
+    def query_raw(
+        self,
+        start_jd: float,
+        end_jd: float,
+        planets: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """Rows with start_jd <= jd < end_jd for the requested planets/kinds, sorted by jd."""
+        planets = self.PLANETS if planets is None else list(planets)
+        kinds = self.kinds if kinds is None else list(kinds)
+
+        keys = self.events["key"]
+        parts = []
+        for planet in planets:
+            for kind in kinds:
+                key = self._key(planet, kind)
+                lo, hi = np.searchsorted(keys, [key, key + 1])
+                block = self.events["jd"][lo:hi]
+                first, last = np.searchsorted(block, [start_jd, end_jd])
+                if last > first:
+                    parts.append(np.asarray(self.events[lo + first:lo + last]))
+
+        if not parts:
+            return np.empty(0, dtype=self.DTYPE)
+        rows = np.concatenate(parts)
+        return rows[np.argsort(rows["jd"], kind="stable")]
+
+    def query(
+        self,
+        start_jd: float,
+        end_jd: float,
+        planets: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+        finder: Optional[EventFinder] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Same event dicts as EventFinder.find() over the same half-open [start_jd, end_jd),
+        read from the table (`finder` only looks up station longitudes).
+        """
+        finder = finder or EventFinder()
+        events = []
+        for key, jd, code, retro in self.query_raw(start_jd, end_jd, planets, kinds).tolist():
+            planet = self.PLANETS[key // self.KIND_STRIDE]
+            kind = self.KINDS[key % self.KIND_STRIDE]
+            events.append(finder.describe(jd, planet, kind, code, retro))
+        return events
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+_default_calendar: Optional[TransitEventCalendar] = None
+
+
+def get_event_calendar() -> Optional[TransitEventCalendar]:
+    """Process-wide calendar, or None when none has been loaded."""
+    return _default_calendar
+
+
+def set_event_calendar(calendar: Optional[TransitEventCalendar]):
+    """Install a calendar (e.g. TransitEventCalendar.load(path) at startup) for all requests."""
+    global _default_calendar
+    _default_calendar = calendar
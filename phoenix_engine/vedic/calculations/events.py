@@ -0,0 +1,303 @@
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+
+class EventFinder:
+    """
+    Exact transit events: sign / nakshatra / pada / kakshya boundary crossings and stations.
+
+    Each planet is sampled coarsely through the batch ephemeris API. Stations are bracketed by
+    a change of sign in the speed, crossings by a change of boundary index between samples;
+    every bracket is then refined with Brent's method on the ephemeris itself. Splitting the
+    sample grid at the stations keeps the longitude monotonic inside every interval, so a
+    retrograde loop is never mistaken for a single crossing.
+    """
+
+    SIGN_NAMES = [
+        "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+        "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+    ]
+
+    # Boundary spacing in degrees and the number of units per parent (sign / nakshatra)
+    BOUNDARIES = {
+        "sign": (30.0, 12),
+        "nakshatra": (360.0 / 27.0, 27),
+        "pada": (360.0 / 108.0, 4),
+        "kakshya": (30.0 / 8.0, 8),
+    }
+    EVENT_TYPES = {"sign": "Ingress", "nakshatra": "Nakshatra", "pada": "Pada", "kakshya": "Kakshya"}
+    KINDS = ("sign", "nakshatra", "pada", "kakshya", "station", "combustion")
+
+    # Coarse sampling step in days (short enough that no boundary is crossed twice in one step)
+    STEP_DAYS = {"Moon": 0.25, "Mercury": 0.5, "Rahu": 0.5, "Ketu": 0.5}
+    DEFAULT_STEP_DAYS = 1.0
+
+    # Sun and Moon never station; the nodes wobble around their mean motion and are not reported
+    STATION_PLANETS = ["Mars", "Mercury", "Jupiter", "Venus", "Saturn"]
+
+    # Combustion (Asta) orbs: distance from the Sun in degrees
+    COMBUSTION_ORBS = {"Moon": 12.0, "Mars": 17.0, "Mercury": 14.0, "Jupiter": 11.0, "Venus": 10.0, "Saturn": 15.0}
+
+    def __init__(self, ephemeris: Optional[SwissEphemeris] = None, xtol_days: float = 1e-6):
+        self.ephemeris = ephemeris or SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
+        self.xtol_days = xtol_days
+
+    # --- Ephemeris access ---
+    def track(self, planet: str, jds: Iterable[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Sidereal longitude and speed of a TransitCalculator planet at every JD."""
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        offset = 0.0
+        body = TransitCalculator.PLANET_IDS[planet]
+        if body is None:  # Ketu
+            body, offset = TransitCalculator.PLANET_IDS["Rahu"], 180.0
+
+        raw = self.ephemeris.calculate_planets_batch(jds, [body])[:, 0, :]
+        lon = (raw[:, SwissEphemeris.LONGITUDE] + offset) % 360.0
+        return lon, raw[:, SwissEphemeris.SPEED_LONGITUDE]
+
+    def _longitude(self, planet: str, jd: float) -> float:
+        return float(self.track(planet, [jd])[0][0])
+
+    def _speed(self, planet: str, jd: float) -> float:
+        return float(self.track(planet, [jd])[1][0])
+
+    def _grid(self, planet: str, start_jd: float, end_jd: float) -> np.ndarray:
+        step = self.STEP_DAYS.get(planet, self.DEFAULT_STEP_DAYS)
+        n = max(1, int(math.ceil((end_jd - start_jd) / step)))
+        return np.linspace(start_jd, end_jd, n + 1)
+
+    # --- Stations ---
+    def find_stations(self, planet: str, start_jd: float, end_jd: float) -> List[Tuple[float, bool]]:
+        """Returns (jd, turns_retrograde) for every zero of the longitude speed."""
+        jds = self._grid(planet, start_jd, end_jd)
+        _, speed = self.track(planet, jds)
+        return self._stations(planet, jds, speed)
+
+    def _stations(self, planet: str, jds: np.ndarray, speed: np.ndarray) -> List[Tuple[float, bool]]:
+        stations = []
+        for i in np.nonzero(np.signbit(speed[:-1]) != np.signbit(speed[1:]))[0]:
+            jd = self.brent(lambda t: self._speed(planet, t), jds[i], jds[i + 1],
+                            speed[i], speed[i + 1], self.xtol_days)
+            stations.append((float(jd), bool(speed[i] > 0)))
+        return stations
+
+    # --- Boundary crossings ---
+    def find_crossings(
+        self, planet: str, start_jd: float, end_jd: float, size: float
+    ) -> List[Tuple[float, int, bool]]:
+        """
+        Returns (jd, boundary, retrograde) for every crossing of a multiple of `size` degrees;
+        the boundary k lies at k * size degrees (0 <= k < 360 / size).
+        """
+        jds = self._grid(planet, start_jd, end_jd)
+        lon, speed = self.track(planet, jds)
+        return self._crossings(planet, *self._split_at_stations(planet, jds, lon, speed), size)
+
+    def _split_at_stations(self, planet, jds, lon, speed):
+        stations = self._stations(planet, jds, speed)
+        if stations:
+            st_jds = np.array([jd for jd, _ in stations])
+            st_lon, _ = self.track(planet, st_jds)
+            order = np.argsort(np.concatenate((jds, st_jds)), kind="stable")
+            jds = np.concatenate((jds, st_jds))[order]
+            lon = np.concatenate((lon, st_lon))[order]
+        return jds, lon
+
+    def _crossings(self, planet: str, jds: np.ndarray, lon: np.ndarray, size: float):
+        units = int(round(360.0 / size))
+        unwrapped = np.unwrap(lon, period=360.0)
+        index = np.floor(unwrapped / size).astype(int)
+
+        crossings = []
+        for i in np.nonzero(index[:-1] != index[1:])[0]:
+            forward = index[i + 1] > index[i]
+            # Boundaries passed inside the (monotonic) interval, in time order
+            passed = range(index[i] + 1, index[i + 1] + 1) if forward else range(index[i], index[i + 1], -1)
+            a, b = jds[i], jds[i + 1]
+            for k in passed:
+                target = k * size
+                f = lambda t, target=target: self.angular_offset(self._longitude(planet, t), target)
+                fa = self.angular_offset(lon[i], target) if a == jds[i] else None
+                fb = self.angular_offset(lon[i + 1], target)
+                jd = self.brent(f, a, b, fa, fb, self.xtol_days)
+                crossings.append((float(jd), k % units, not forward))
+                a = jd  # next boundary of the interval lies after this one
+        return crossings
+
+    @staticmethod
+    def angular_offset(lon: float, target: float) -> float:
+        """Signed angular distance lon - target in [-180, 180), for floats or arrays."""
+        return (lon - target + 180.0) % 360.0 - 180.0
+
+    # --- Combustion ---
+    def find_combustion(self, planet: str, start_jd: float, end_jd: float) -> List[Tuple[float, bool, bool]]:
+        """Returns (jd, enters_combustion, retrograde) whenever the Sun distance crosses the orb."""
+        jds = self._grid(planet, start_jd, end_jd)
+        lon, speed = self.track(planet, jds)
+        return self._combustion(planet, jds, lon, speed)
+
+    def _combustion(self, planet, jds, lon, speed):
+        orb = self.COMBUSTION_ORBS[planet]
+        sun_lon, _ = self.track("Sun", jds)
+        gap = np.abs((lon - sun_lon + 180.0) % 360.0 - 180.0) - orb
+
+        def f(t):
+            return abs(self.angular_offset(self._longitude(planet, t), self._longitude("Sun", t))) - orb
+
+        events = []
+        for i in np.nonzero(np.signbit(gap[:-1]) != np.signbit(gap[1:]))[0]:
+            jd = float(self.brent(f, jds[i], jds[i + 1], gap[i], gap[i + 1], self.xtol_days))
+            events.append((jd, bool(gap[i] > 0), self._speed(planet, jd) < 0))
+        return events
+
+    # --- All events ---
+    def find_raw(
+        self,
+        start_jd: float,
+        end_jd: float,
+        planets: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[float, str, str, int, bool]]:
+        """
+        Compact form of find(): (jd, planet, kind, code, retrograde) tuples, unsorted, for
+        start_jd <= jd < end_jd (half-open, so back-to-back ranges never repeat an event).
+        code is the boundary index for boundary kinds, 1/0 for turning retrograde/direct
+        (station) and entering/leaving combustion.
+        """
+        planets = list(TransitCalculator.PLANET_IDS) if planets is None else list(planets)
+        kinds = self.KINDS if kinds is None else tuple(kinds)
+
+        events = []
+        for planet in planets:
+            jds = self._grid(planet, start_jd, end_jd)
+            lon, speed = self.track(planet, jds)
+
+            if "station" in kinds and planet in self.STATION_PLANETS:
+                for jd, turns_retro in self._stations(planet, jds, speed):
+                    events.append((jd, planet, "station", int(turns_retro), not turns_retro))
+
+            if "combustion" in kinds and planet in self.COMBUSTION_ORBS:
+                for jd, enters, retro in self._combustion(planet, jds, lon, speed):
+                    events.append((jd, planet, "combustion", int(enters), retro))
+
+            boundary_kinds = [k for k in kinds if k in self.BOUNDARIES]
+            if not boundary_kinds:
+                continue
+            split_jds, split_lon = self._split_at_stations(planet, jds, lon, speed)
+            for kind in boundary_kinds:
+                for jd, boundary, retro in self._crossings(planet, split_jds, split_lon, self.BOUNDARIES[kind][0]):
+                    events.append((jd, planet, kind, boundary, retro))
+        return [event for event in events if start_jd <= event[0] < end_jd]
+
+    def find(
+        self,
+        start_jd: float,
+        end_jd: float,
+        planets: Optional[Iterable[str]] = None,
+        kinds: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """All requested events in [start_jd, end_jd) (as TransitEventCalendar.query), sorted by time."""
+        raw = sorted(self.find_raw(start_jd, end_jd, planets, kinds), key=lambda e: e[0])
+        return [self.describe(*event) for event in raw]
+
+    def describe(self, jd: float, planet: str, kind: str, code: int, retro: bool) -> Dict[str, Any]:
+        """Expands a find_raw() tuple into the event dict returned by find()."""
+        if kind == "station":
+            states = ("Direct", "Retrograde") if code else ("Retrograde", "Direct")
+            return self._event(jd, planet, "Station", *states, longitude=round(self._longitude(planet, jd), 6))
+        if kind == "combustion":
+            states = ("Visible", "Combust") if code else ("Combust", "Visible")
+            return self._event(jd, planet, "Combustion", *states, is_retro=retro,
+                              orb=self.COMBUSTION_ORBS[planet])
+
+        size, per_parent = self.BOUNDARIES[kind]
+        units = int(round(360.0 / size))
+        left, entered = (code, (code - 1) % units) if retro else ((code - 1) % units, code)
+
+        extra = {"is_retro": retro, "boundary": round(code * size, 6)}
+        if kind == "sign":
+            extra["sign_id"] = entered + 1
+            return self._event(jd, planet, "Ingress", self.SIGN_NAMES[left], self.SIGN_NAMES[entered], **extra)
+        if kind == "pada":
+            extra["nakshatra_id"] = entered // 4 + 1
+        elif kind == "kakshya":
+            extra["sign_id"] = entered // 8 + 1
+        return self._event(jd, planet, self.EVENT_TYPES[kind],
+                          left % per_parent + 1, entered % per_parent + 1, **extra)
+
+    @staticmethod
+    def _event(jd: float, planet: str, event_type: str, frm: Any, to: Any, **extra) -> Dict[str, Any]:
+        year, month, day, hours = swe.revjul(jd)
+        minutes = int(round(hours * 60.0))
+        if minutes == 24 * 60:  # rounds up into the next day
+            year, month, day, _ = swe.revjul(jd + 1.0 / 1440.0)
+            minutes = 0
+        return {
+            "jd": jd,
+            "date": f"{year:04d}-{month:02d}-{day:02d}",
+            "time": f"{minutes // 60:02d}:{minutes % 60:02d}",
+            "planet": planet,
+            "type": event_type,
+            "from": frm,
+            "to": to,
+            **extra,
+        }
+
+    # --- Root finding ---
+    @staticmethod
+    def brent(
+        f: Callable[[float], float], a: float, b: float,
+        fa: Optional[float] = None, fb: Optional[float] = None,
+        xtol: float = 1e-6, max_iter: int = 100,
+    ) -> float:
+        """Brent's method for a root of f bracketed by [a, b] (inverse quadratic / secant / bisection)."""
+        fa = f(a) if fa is None else fa
+        fb = f(b) if fb is None else fb
+        if fa == 0.0:
+            return a
+        if fb == 0.0:
+            return b
+
+        c, fc = a, fa
+        d = e = b - a
+        for _ in range(max_iter):
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol = 2.0 * 1e-15 * abs(b) + 0.5 * xtol
+            m = 0.5 * (c - b)
+            if abs(m) <= tol or fb == 0.0:
+                return b
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:  # secant
+                    p, q = 2.0 * m * s, 1.0 - s
+                else:  # inverse quadratic interpolation
+                    q, r = fa / fc, fb / fc
+                    p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                    q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            fb = f(b)
+        return b
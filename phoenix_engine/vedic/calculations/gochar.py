@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Dict, Any
 from phoenix_engine.vedic.const import SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN
 
@@ -16,91 +17,177 @@ class GocharEngine:
         9: "Luck/Dharma", 10: "Karma/Career", 11: "Gains/Income", 12: "Loss/Expenses"
     }
 
+    # Columnar grid layout
+    NAK_LEN = 13.333333333
+    PADA_LEN = 3.333333333
+    SKIPPED_PLANETS = ["Rahu", "Ketu"]
+    TRANSIT_YOGAS = [
+        "Gaja Kesari (Transit): Reputation & Success",
+        "Budhaditya (Transit): Intelligence & Communication",
+        "Chandra Mangala (Transit): Wealth & Earnings",
+        "Guru Mangala (Transit): High Energy & Leadership",
+    ]
+
     @staticmethod
-    def _check_transit_yogas(daily_planets: Dict[str, Dict[str, Any]]) -> List[str]:
-        yogas = []
-        signs = {p: data['sign'] for p, data in daily_planets.items() if p in ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']}
-        
-        if 'Moon' in signs and 'Jupiter' in signs:
-            dist = (signs['Jupiter'] - signs['Moon']) % 12
-            if dist in [0, 3, 6, 9]:
-                yogas.append("Gaja Kesari (Transit): Reputation & Success")
-
-        if 'Sun' in signs and 'Mercury' in signs and signs['Sun'] == signs['Mercury']:
-            yogas.append("Budhaditya (Transit): Intelligence & Communication")
-                
-        if 'Moon' in signs and 'Mars' in signs and signs['Moon'] == signs['Mars']:
-            yogas.append("Chandra Mangala (Transit): Wealth & Earnings")
-
-        if 'Jupiter' in signs and 'Mars' in signs:
-            dist = (signs['Mars'] - signs['Jupiter']) % 12
-            if dist in [0, 6]:
-                yogas.append("Guru Mangala (Transit): High Energy & Leadership")
-
-        return yogas
+    def natal_moon_sign(natal_chart: Dict[str, Any]) -> int:
+        """Natal Moon sign (1-12) from a PlanetPosition-like object or a plain dict."""
+        moon = natal_chart["Moon"]
+        if isinstance(moon, dict):
+            if "sign" in moon:
+                return int(moon["sign"])
+            return int(moon["longitude"] / 30.0) % 12 + 1
+        return int(moon.sign)
 
     @staticmethod
-    def analyze_smart_series(
-        transit_series: List[Dict], 
-        natal_chart: Dict[str, Any], 
-        asc_sign: int, 
+    def analyze_grid(
+        positions: np.ndarray,
+        planet_names: List[str],
+        asc_sign: int,
+        natal_moon_sign: int,
         sav_data: List[int],
-        context: Dict[str, Any]
+        active_lords: List[str],
     ) -> Dict[str, Any]:
-        
+        """
+        Columnar Gochar for a whole (days x planets) grid.
+        positions: (days, planets, 2) sidereal longitude / speed, as from
+        TransitCalculator.get_daily_transit_array. Every field is one NumPy array.
+        """
+        keep = [i for i, p in enumerate(planet_names) if p not in GocharEngine.SKIPPED_PLANETS]
+        names = [planet_names[i] for i in keep]
+        lon = positions[:, keep, 0]
+        speed = positions[:, keep, 1]
+
+        sign = (lon // 30.0).astype(np.int64) + 1
+        degree = lon % 30.0
+        h_lagna = (sign - asc_sign + 12) % 12 + 1
+        h_moon = (sign - natal_moon_sign + 12) % 12 + 1
+
+        nak_rem = lon % GocharEngine.NAK_LEN
+        kakshya = np.minimum((degree / 3.75).astype(np.int64), 7)
+
+        # Transit yogas from the daily sign columns (False if a planet is absent)
+        def sign_of(name):
+            return sign[:, names.index(name)] if name in names else None
+
+        def yoga(a, b, distances):
+            sa, sb = sign_of(a), sign_of(b)
+            if sa is None or sb is None:
+                return np.zeros(len(sign), dtype=bool)
+            return np.isin((sb - sa) % 12, distances)
+
+        yogas = np.stack([
+            yoga("Moon", "Jupiter", [0, 3, 6, 9]),
+            yoga("Sun", "Mercury", [0]),
+            yoga("Moon", "Mars", [0]),
+            yoga("Jupiter", "Mars", [0, 6]),
+        ], axis=1) if len(sign) else np.zeros((0, 4), dtype=bool)
+
+        return {
+            "planets": names,
+            "longitude": lon,
+            "speed": speed,
+            "sign": sign,
+            "degree": degree,
+            "is_retro": speed < 0,
+            "nakshatra_id": (lon / GocharEngine.NAK_LEN).astype(np.int64) + 1,
+            "nakshatra_pada": (nak_rem / GocharEngine.PADA_LEN).astype(np.int64) + 1,
+            "nakshatra_percent": nak_rem / GocharEngine.NAK_LEN * 100,
+            "house_from_lagna": h_lagna,
+            "house_from_moon": h_moon,
+            "sav_points": np.asarray(sav_data)[sign - 1],
+            "kakshya": kakshya,
+            "is_benefic": np.isin(h_lagna, [1, 5, 9]),
+            "is_dasha_lord": np.array([p in active_lords for p in names], dtype=bool),
+            "yogas": yogas,
+        }
+
+    @staticmethod
+    def to_columns(grid: Dict[str, Any], dates: List[str]) -> Dict[str, Any]:
+        """JSON-ready columnar output: (days x planets) lists plus the lookup tables."""
+        columns = {k: (v.tolist() if isinstance(v, np.ndarray) else v) for k, v in grid.items()}
+        columns["dates"] = list(dates)
+        columns["lookup"] = {
+            "kakshya_lords": GocharEngine.KAKSHYA_LORDS,
+            "house_topics": GocharEngine.HOUSE_TOPICS,
+            "yogas": GocharEngine.TRANSIT_YOGAS,
+        }
+        return {"columnar_timeline": columns}
+
+    @staticmethod
+    def to_timeline(grid: Dict[str, Any], dates: List[str], timestamps: List[Any]) -> Dict[str, Any]:
+        """Materializes the nested chronological_timeline from a grid (serialization edge)."""
+        names = grid["planets"]
+        cols = {k: v.tolist() for k, v in grid.items() if isinstance(v, np.ndarray)}
+        lords = GocharEngine.KAKSHYA_LORDS
+        topics = GocharEngine.HOUSE_TOPICS
+        yoga_names = GocharEngine.TRANSIT_YOGAS
+
         timeline = []
-        active_lords = context.get('active_dasha_lords', [])
-        natal_moon_sign = natal_chart["Moon"].sign
-
-        for day_data in transit_series:
-            date = day_data["date"]
-            active_yogas = GocharEngine._check_transit_yogas(day_data["planets"])
-            
-            day_snapshot = {
-                "date": date,
-                "timestamp": day_data.get("timestamp"),
-                "global_yogas": active_yogas,
-                "planets": {}
-            }
-            
-            for p_name, t_info in day_data["planets"].items():
-                if p_name in ["Rahu", "Ketu"]:
-                    continue
-                
-                current_sign = t_info["sign"]
-                h_lagna = (current_sign - asc_sign + 12) % 12 + 1
-                h_moon = (current_sign - natal_moon_sign + 12) % 12 + 1
-                
-                sav_score = sav_data[current_sign - 1]
-                kakshya_idx = int(t_info["degree"] / 3.75)
-                kakshya_lord = GocharEngine.KAKSHYA_LORDS[min(kakshya_idx, 7)]
-                
-                planet_detail = {
+        for d, date in enumerate(dates):
+            planets = {}
+            for j, p_name in enumerate(names):
+                h_lagna = cols["house_from_lagna"][d][j]
+                planets[p_name] = {
                     "coordinates": {
-                        "sign_id": current_sign,
-                        "longitude": t_info["longitude"],
-                        "degree_in_sign": t_info["degree"],
-                        "speed": t_info["speed"],
-                        "is_retrograde": t_info["is_retro"]
+                        "sign_id": cols["sign"][d][j],
+                        "longitude": round(cols["longitude"][d][j], 6),
+                        "degree_in_sign": round(cols["degree"][d][j], 6),
+                        "speed": cols["speed"][d][j],
+                        "is_retrograde": cols["is_retro"][d][j]
+                    },
+                    "nakshatra": {
+                        "id": cols["nakshatra_id"][d][j],
+                        "pada": cols["nakshatra_pada"][d][j],
+                        "percent": cols["nakshatra_percent"][d][j]
                     },
-                    "nakshatra": t_info["nakshatra"],
                     "houses": {
                         "from_lagna": h_lagna,
-                        "topic": GocharEngine.HOUSE_TOPICS.get(h_lagna, "General"),
-                        "from_moon": h_moon
+                        "topic": topics.get(h_lagna, "General"),
+                        "from_moon": cols["house_from_moon"][d][j]
                     },
                     "strength": {
-                        "sav_points": sav_score,
-                        "kakshya_lord": kakshya_lord
+                        "sav_points": cols["sav_points"][d][j],
+                        "kakshya_lord": lords[cols["kakshya"][d][j]]
                     },
                     "context": {
-                        "is_dasha_lord": p_name in active_lords,
-                        "functional_nature": "Benefic" if h_lagna in [1,5,9] else "Neutral"
+                        "is_dasha_lord": cols["is_dasha_lord"][j],
+                        "functional_nature": "Benefic" if cols["is_benefic"][d][j] else "Neutral"
                     }
                 }
-                
-                day_snapshot["planets"][p_name] = planet_detail
-            
-            timeline.append(day_snapshot)
-            
+
+            timeline.append({
+                "date": date,
+                "timestamp": timestamps[d],
+                "global_yogas": [y for y, on in zip(yoga_names, cols["yogas"][d]) if on],
+                "planets": planets
+            })
+
         return {"chronological_timeline": timeline}
+
+    @staticmethod
+    def analyze_smart_series(
+        transit_series: List[Dict], 
+        natal_chart: Dict[str, Any], 
+        asc_sign: int, 
+        sav_data: List[int],
+        context: Dict[str, Any],
+        columnar: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Legacy entry point (daily snapshot dicts from TransitCalculator.get_daily_transits).
+        Packs the series into a grid and runs the columnar engine.
+        """
+        planet_names = list(transit_series[0]["planets"]) if transit_series else []
+        positions = np.array([
+            [[day["planets"][p]["longitude"], day["planets"][p]["speed"]] for p in planet_names]
+            for day in transit_series
+        ], dtype=float).reshape(len(transit_series), len(planet_names), 2)
+
+        grid = GocharEngine.analyze_grid(
+            positions, planet_names, asc_sign, GocharEngine.natal_moon_sign(natal_chart),
+            sav_data, context.get('active_dasha_lords', [])
+        )
+        dates = [day["date"] for day in transit_series]
+        if columnar:
+            return GocharEngine.to_columns(grid, dates)
+        return GocharEngine.to_timeline(grid, dates, [day.get("timestamp") for day in transit_series])
@@ -3,6 +3,8 @@ import swisseph as swe
 from typing import Dict, Any, List
 
 from phoenix_engine.core.context import ChartContext
+from phoenix_engine.infrastructure.astronomy.cache import sidereal_calc_ut
+from phoenix_engine.infrastructure.astronomy.rise_set import get_rise_set_cache
 from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 from phoenix_engine.vedic.calculations.vedic_math import VedicMath
 
@@ -17,6 +19,31 @@ class PanchangaEngine:
 
     WEEKDAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
+    TITHI_NAMES = [
+        "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti",
+        "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
+        "Trayodashi", "Chaturdashi", "Purnima",
+        "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti",
+        "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
+        "Trayodashi", "Chaturdashi", "Amavasya"
+    ]
+
+    NAKSHATRA_NAMES = [
+        "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu", "Pushya", "Ashlesha",
+        "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+        "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+    ]
+
+    YOGA_NAMES = [
+        "Vishkumbha", "Priti", "Ayushman", "Saubhagya", "Sobhana", "Atiganda", "Sukarma", "Dhriti",
+        "Shula", "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra", "Siddhi",
+        "Vyatipata", "Variyan", "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
+        "Brahma", "Indra", "Vaidhriti"
+    ]
+
+    KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti"]
+    FIXED_KARANAS = ["Shakuni", "Chatushpada", "Naga", "Kimstughna"]
+
     # Vedic Rise Flags: Center of Disc, No Refraction
     # This differs from Western/Standard astronomical sunrise
     VEDIC_RISE_FLAGS = swe.BIT_DISC_CENTER | swe.BIT_NO_REFRACTION
@@ -26,6 +53,9 @@ class PanchangaEngine:
         self.sw_engine = SwissEphemeris(getattr(config, 'ephemeris_path', None))
 
     def calculate(self, ctx: ChartContext) -> Dict[str, Any]:
+        # Read positions through the chart's shared ephemeris cache. calc_ut is passed down the
+        # call chain rather than stored, so one engine can serve concurrent charts.
+        calc_ut = ctx.ephemeris.calc_ut if ctx.ephemeris is not None else sidereal_calc_ut
         jd = ctx.jd_ut
         lat = ctx.birth_data.lat
         lon = ctx.birth_data.lon
@@ -35,20 +65,20 @@ class PanchangaEngine:
         sunrise_jd = rise_set["sunrise_jd"]
 
         # 2. Basic Positions at Birth Time
-        sun_long = self._get_sidereal_pos(jd, swe.SUN)
-        moon_long = self._get_sidereal_pos(jd, swe.MOON)
+        sun_long = self._get_sidereal_pos(jd, swe.SUN, calc_ut)
+        moon_long = self._get_sidereal_pos(jd, swe.MOON, calc_ut)
 
         # 3. Vara (Weekday)
         vara = self._calculate_vara(jd, rise_set)
 
         # 4. Tithi (with Lagrange)
-        tithi = self._calculate_tithi_precision(jd, sunrise_jd, lat, lon)
+        tithi = self._calculate_tithi_precision(jd, sunrise_jd, lat, lon, calc_ut)
 
         # 5. Nakshatra (with Lagrange)
-        nak = self._calculate_nakshatra_precision(jd, sunrise_jd, lat, lon)
+        nak = self._calculate_nakshatra_precision(jd, sunrise_jd, lat, lon, calc_ut)
 
         # 6. Yoga (with Lagrange)
-        yoga = self._calculate_yoga_precision(jd, sunrise_jd, lat, lon)
+        yoga = self._calculate_yoga_precision(jd, sunrise_jd, lat, lon, calc_ut)
 
         # 7. Karana
         karana = self._calculate_karana(tithi["index_float"])
@@ -67,27 +97,15 @@ class PanchangaEngine:
 
     def _get_vedic_rise_set(self, jd: float, lat: float, lon: float) -> Dict[str, float]:
         """Calculates Sunrise/Sunset using strict Vedic flags."""
-        res_rise = swe.rise_trans(
-            tjd=jd - (5.5 / 24.0),
-            body=swe.SUN,
-            geopos=(lon, lat, 0.0),
-            rsmi=self.VEDIC_RISE_FLAGS + swe.CALC_RISE
-        )
-        sunrise_jd = res_rise[1][0]
-
-        res_set = swe.rise_trans(
-            tjd=jd,
-            body=swe.SUN,
-            geopos=(lon, lat, 0.0),
-            rsmi=self.VEDIC_RISE_FLAGS + swe.CALC_SET
-        )
-        sunset_jd = res_set[1][0]
+        cache = get_rise_set_cache()
+        sunrise_jd = cache.next_event(jd - (5.5 / 24.0), lat, lon, self.VEDIC_RISE_FLAGS + swe.CALC_RISE)
+        sunset_jd = cache.next_event(jd, lat, lon, self.VEDIC_RISE_FLAGS + swe.CALC_SET)
 
         return {"sunrise_jd": sunrise_jd, "sunset_jd": sunset_jd}
 
-    def _get_sidereal_pos(self, jd: float, body: int) -> float:
+    def _get_sidereal_pos(self, jd: float, body: int, calc_ut=sidereal_calc_ut) -> float:
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
-        res = swe.calc_ut(jd, body, flags)
+        res = calc_ut(jd, body, flags)
         return res[0][0]
 
     def _calculate_vara(self, jd: float, rise_set: Dict) -> Dict[str, Any]:
@@ -111,14 +129,16 @@ class PanchangaEngine:
         fraction = VedicMath.inverse_lagrange(offsets, unwrapped_values, target_val)
         return start_jd + fraction
 
-    def _calculate_tithi_precision(self, jd: float, sunrise_jd: float, lat: float, lon: float) -> Dict[str, Any]:
+    def _calculate_tithi_precision(
+        self, jd: float, sunrise_jd: float, lat: float, lon: float, calc_ut=sidereal_calc_ut
+    ) -> Dict[str, Any]:
         offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
         diffs = []
 
         for off in offsets:
             t_jd = jd + off
-            s_lon = self._get_sidereal_pos(t_jd, swe.SUN)
-            m_lon = self._get_sidereal_pos(t_jd, swe.MOON)
+            s_lon = self._get_sidereal_pos(t_jd, swe.SUN, calc_ut)
+            m_lon = self._get_sidereal_pos(t_jd, swe.MOON, calc_ut)
             diff = (m_lon - s_lon) % 360
             diffs.append(diff)
 
@@ -135,30 +155,23 @@ class PanchangaEngine:
 
         percentage = (current_diff % 12) / 12.0 * 100
 
-        TITHI_NAMES = [
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti",
-            "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
-            "Trayodashi", "Chaturdashi", "Purnima",
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti",
-            "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
-            "Trayodashi", "Chaturdashi", "Amavasya"
-        ]
-
         return {
             "index": tithi_index + 1,
             "index_float": tithi_float,
-            "name": TITHI_NAMES[tithi_index],
+            "name": self.TITHI_NAMES[tithi_index],
             "paksha": "Shukla" if tithi_index < 15 else "Krishna",
             "elapsed_percentage": round(percentage, 2),
             "end_time_jd": end_time_jd
         }
 
-    def _calculate_nakshatra_precision(self, jd: float, sunrise_jd: float, lat: float, lon: float) -> Dict[str, Any]:
+    def _calculate_nakshatra_precision(
+        self, jd: float, sunrise_jd: float, lat: float, lon: float, calc_ut=sidereal_calc_ut
+    ) -> Dict[str, Any]:
         offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
         lons = []
 
         for off in offsets:
-            lons.append(self._get_sidereal_pos(jd + off, swe.MOON))
+            lons.append(self._get_sidereal_pos(jd + off, swe.MOON, calc_ut))
 
         current_lon = lons[0]
         nak_span = 360.0 / 27.0
@@ -174,27 +187,23 @@ class PanchangaEngine:
 
         percentage = (current_lon % nak_span) / nak_span * 100
 
-        NAK_NAMES = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu", "Pushya", "Ashlesha",
-            "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-            "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-        ]
-
         return {
             "index": nak_index + 1,
-            "name": NAK_NAMES[nak_index],
+            "name": self.NAKSHATRA_NAMES[nak_index],
             "elapsed_percentage": round(percentage, 2),
             "end_time_jd": end_time_jd
         }
 
-    def _calculate_yoga_precision(self, jd: float, sunrise_jd: float, lat: float, lon: float) -> Dict[str, Any]:
+    def _calculate_yoga_precision(
+        self, jd: float, sunrise_jd: float, lat: float, lon: float, calc_ut=sidereal_calc_ut
+    ) -> Dict[str, Any]:
         offsets = [0.0, 0.25, 0.5, 0.75, 1.0]
         sums = []
 
         for off in offsets:
             t_jd = jd + off
-            s = self._get_sidereal_pos(t_jd, swe.SUN)
-            m = self._get_sidereal_pos(t_jd, swe.MOON)
+            s = self._get_sidereal_pos(t_jd, swe.SUN, calc_ut)
+            m = self._get_sidereal_pos(t_jd, swe.MOON, calc_ut)
             sums.append((s + m) % 360)
 
         current_sum = sums[0]
@@ -210,37 +219,28 @@ class PanchangaEngine:
 
         percentage = (current_sum % yoga_span) / yoga_span * 100
 
-        YOGA_NAMES = [
-            "Vishkumbha", "Priti", "Ayushman", "Saubhagya", "Sobhana", "Atiganda", "Sukarma", "Dhriti",
-            "Shula", "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra", "Siddhi",
-            "Vyatipata", "Variyan", "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
-            "Brahma", "Indra", "Vaidhriti"
-        ]
-
         return {
             "index": yoga_index + 1,
-            "name": YOGA_NAMES[yoga_index],
+            "name": self.YOGA_NAMES[yoga_index],
             "elapsed_percentage": round(percentage, 2),
             "end_time_jd": end_time_jd
         }
 
+    @classmethod
+    def karana_name(cls, karana_index: int) -> str:
+        """Name of the 0-based karana (half-tithi) of the synodic month."""
+        if karana_index == 0:
+            return "Kimstughna"
+        if 57 <= karana_index <= 59:
+            return cls.FIXED_KARANAS[karana_index - 57]
+        return cls.KARANAS[(karana_index - 1) % 7]
+
     def _calculate_karana(self, tithi_float: float) -> Dict[str, Any]:
         karana_float = tithi_float * 2.0
         karana_index = int(karana_float)
 
-        KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti"]
-        FIXED = ["Shakuni", "Chatushpada", "Naga", "Kimstughna"]
-
-        name = ""
-        if karana_index == 0:
-            name = "Kimstughna"
-        elif 57 <= karana_index <= 59:
-            name = FIXED[karana_index - 57]
-        else:
-            name = KARANAS[(karana_index - 1) % 7]
-
         return {
             "index": karana_index + 1,
-            "name": name,
+            "name": self.karana_name(karana_index),
             "elapsed_percentage": (karana_float % 1) * 100
         }
@@ -0,0 +1,167 @@
+import math
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from phoenix_engine.infrastructure.astronomy.rise_set import rise_trans
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.infrastructure.time.julian import JD_UNIX_EPOCH
+from phoenix_engine.vedic.calculations.events import EventFinder
+from phoenix_engine.vedic.calculations.panchanga import PanchangaEngine
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class PanchangaCalendar:
+    """
+    Day-by-day panchanga (vara, tithi, nakshatra, yoga, karana with exact start/end JDs, and
+    sunrise/sunset) for any location over a span of months or years.
+
+    The limb boundaries depend on the Sun and Moon only, never on the place: they are found
+    once for the whole span from one shared Sun/Moon sample grid (tithi ends being every other
+    karana end) and refined with Brent's method on the ephemeris. Every day, and every city,
+    then reads its limbs from those sorted boundary arrays with binary searches; only sunrise
+    and sunset are computed per location.
+    """
+
+    # Sample spacing: the fastest limb (yoga, ~16 deg/day) moves ~4 deg per step, under any span
+    STEP_DAYS = 0.25
+    # Karana boundaries every 6 deg of elongation, nakshatra (Moon) and yoga (Sun + Moon) every 13.33 deg
+    LIMBS = {"karana": 6.0, "nakshatra": 360.0 / 27.0, "yoga": 360.0 / 27.0}
+    # Limb periods never exceed ~1.1 days; this much span around a day finds its bounding ends
+    MARGIN_DAYS = 1.5
+
+    def __init__(self, boundaries: Dict[str, Tuple[np.ndarray, np.ndarray]], start_jd: float, end_jd: float):
+        # limb -> (boundary JDs, 0-based unit entered at each), sorted by JD
+        self.boundaries = boundaries
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+
+    # --- Building ---
+    @classmethod
+    def build(
+        cls,
+        start_jd: float,
+        end_jd: float,
+        ephemeris: Optional[SwissEphemeris] = None,
+        xtol_days: float = 1e-6,
+        chunk_days: float = 366.0,
+    ) -> "PanchangaCalendar":
+        """Finds every limb boundary in [start_jd, end_jd], one chunk of samples at a time."""
+        ephemeris = ephemeris or SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
+        found: Dict[str, List[Tuple[float, int]]] = {limb: [] for limb in cls.LIMBS}
+
+        chunk_start = start_jd
+        while chunk_start < end_jd:
+            chunk_end = min(chunk_start + chunk_days, end_jd)
+            n = max(1, int(math.ceil((chunk_end - chunk_start) / cls.STEP_DAYS)))
+            jds = np.linspace(chunk_start, chunk_end, n + 1)
+            values = cls._limb_values(ephemeris, jds)
+            for limb, size in cls.LIMBS.items():
+                found[limb].extend(cls._crossings(ephemeris, limb, size, jds, values[limb], xtol_days))
+            chunk_start = chunk_end
+
+        boundaries = {}
+        for limb, crossings in found.items():
+            crossings.sort()
+            boundaries[limb] = (np.array([jd for jd, _ in crossings]), np.array([u for _, u in crossings], dtype=int))
+
+        # Tithis end at the even karana boundaries (karana 2k + 1 begins tithi k)
+        karana_jds, karana_units = boundaries["karana"]
+        even = karana_units % 2 == 0
+        boundaries["tithi"] = (karana_jds[even], karana_units[even] // 2)
+        return cls(boundaries, start_jd, end_jd)
+
+    @classmethod
+    def covering(cls, start: date, days: int, **kwargs) -> "PanchangaCalendar":
+        """Calendar whose span holds `days` civil days from `start` at any longitude."""
+        first_jd = JD_UNIX_EPOCH + (start - _EPOCH_DATE).days
+        return cls.build(first_jd - 1.0 - cls.MARGIN_DAYS, first_jd + days + 1.0 + cls.MARGIN_DAYS, **kwargs)
+
+    @staticmethod
+    def _limb_values(ephemeris: SwissEphemeris, jds: np.ndarray) -> Dict[str, np.ndarray]:
+        pos = ephemeris.calculate_planets_batch(jds, [swe.SUN, swe.MOON])[:, :, SwissEphemeris.LONGITUDE]
+        sun, moon = pos[:, 0], pos[:, 1]
+        return {"karana": (moon - sun) % 360.0, "nakshatra": moon, "yoga": (moon + sun) % 360.0}
+
+    @classmethod
+    def _crossings(cls, ephemeris, limb, size, jds, values, xtol_days) -> List[Tuple[float, int]]:
+        """(jd, unit entered) for every multiple of `size` the (always increasing) limb passes."""
+        units = int(round(360.0 / size))
+        index = np.floor(np.unwrap(values, period=360.0) / size).astype(int)
+
+        def offset(t: float, target: float) -> float:
+            value = cls._limb_values(ephemeris, np.array([t]))[limb][0]
+            return EventFinder.angular_offset(value, target)
+
+        crossings = []
+        for i in np.nonzero(index[:-1] != index[1:])[0]:
+            target = (index[i + 1] * size) % 360.0
+            fa = EventFinder.angular_offset(values[i], target)
+            fb = EventFinder.angular_offset(values[i + 1], target)
+            jd = EventFinder.brent(lambda t: offset(t, target), jds[i], jds[i + 1], fa, fb, xtol_days)
+            crossings.append((float(jd), int(index[i + 1] % units)))
+        return crossings
+
+    # --- Queries ---
+    def periods(self, limb: str, start_jd: float, end_jd: float) -> List[Dict[str, Any]]:
+        """Periods of `limb` overlapping [start_jd, end_jd): the one running at start_jd first."""
+        jds, units = self.boundaries[limb]
+        first = np.searchsorted(jds, start_jd, side="right")
+        last = np.searchsorted(jds, end_jd, side="left")
+        if first == 0 or last >= len(jds):
+            raise ValueError(f"[{start_jd}, {end_jd}) is outside the calendar span")
+
+        out = []
+        for k in range(first, last + 1):
+            unit = int(units[k - 1])
+            out.append({"index": unit + 1, "name": self._name(limb, unit),
+                        "start_jd": float(jds[k - 1]), "end_jd": float(jds[k])})
+            if limb == "tithi":
+                out[-1]["paksha"] = "Shukla" if unit < 15 else "Krishna"
+        return out
+
+    @staticmethod
+    def _name(limb: str, unit: int) -> str:
+        if limb == "tithi":
+            return PanchangaEngine.TITHI_NAMES[unit]
+        if limb == "nakshatra":
+            return PanchangaEngine.NAKSHATRA_NAMES[unit]
+        if limb == "yoga":
+            return PanchangaEngine.YOGA_NAMES[unit]
+        return PanchangaEngine.karana_name(unit)
+
+    def days(self, lat: float, lon: float, start: date, days: int) -> Iterator[Dict[str, Any]]:
+        """
+        Streams one panchanga per civil day: the Vedic day runs from that day's sunrise to the
+        next, and lists every limb period touching it. Where the Sun does not rise (polar
+        regions) the day runs from 06:00 local mean time and sunrise/sunset are None.
+        """
+        rise_flags = PanchangaEngine.VEDIC_RISE_FLAGS + swe.CALC_RISE
+        set_flags = PanchangaEngine.VEDIC_RISE_FLAGS + swe.CALC_SET
+
+        def sunrise(day: date) -> Tuple[float, Optional[float]]:
+            local_midnight = JD_UNIX_EPOCH + (day - _EPOCH_DATE).days - lon / 360.0
+            jd = rise_trans(local_midnight, lat, lon, rise_flags)
+            return (jd, jd) if jd else (local_midnight + 0.25, None)
+
+        day_start, rise_jd = sunrise(start)
+        for i in range(days):
+            day = start + timedelta(days=i)
+            next_start, next_rise = sunrise(day + timedelta(days=1))
+            set_jd = rise_trans(day_start, lat, lon, set_flags) or None
+
+            yield {
+                "date": day.isoformat(),
+                "sunrise_jd": rise_jd,
+                "sunset_jd": set_jd,
+                "next_sunrise_jd": next_rise,
+                "vara": {"name": PanchangaEngine.WEEKDAYS[day.toordinal() % 7], "index": day.toordinal() % 7},
+                "tithi": self.periods("tithi", day_start, next_start),
+                "nakshatra": self.periods("nakshatra", day_start, next_start),
+                "yoga": self.periods("yoga", day_start, next_start),
+                "karana": self.periods("karana", day_start, next_start),
+            }
+            day_start, rise_jd = next_start, next_rise
@@ -131,7 +131,7 @@ class ShadbalaEngine:
             if pid is None:
                 continue
             try:
-                res = swe.calc_ut(ctx.jd_ut, pid, swe.FLG_EQUATORIAL)
+                res = ctx.ephemeris.calc_ut(ctx.jd_ut, pid, swe.FLG_EQUATORIAL)
                 decs[name] = res[0][1]  # declination index
             except swe.Error:
                 continue
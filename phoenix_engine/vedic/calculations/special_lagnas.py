@@ -1,6 +1,7 @@
 import swisseph as swe
 
 from phoenix_engine.core.context import ChartContext
+from phoenix_engine.infrastructure.astronomy.rise_set import get_rise_set_cache
 from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
 from phoenix_engine.vedic.calculations.panchanga import PanchangaEngine
 
@@ -26,20 +27,16 @@ class SpecialLagnaEngine:
         lon = ctx.birth_data.lon
 
         # 1. Get Sunrise (Vedic flags)
-        res_rise = swe.rise_trans(
-            tjd=jd - (5.5 / 24.0),
-            body=swe.SUN,
-            geopos=(lon, lat, 0.0),
-            rsmi=PanchangaEngine.VEDIC_RISE_FLAGS + swe.CALC_RISE
+        sunrise_jd = get_rise_set_cache().next_event(
+            jd - (5.5 / 24.0), lat, lon, PanchangaEngine.VEDIC_RISE_FLAGS + swe.CALC_RISE
         )
-        sunrise_jd = res_rise[1][0]
 
         time_diff_hours = (jd - sunrise_jd) * 24.0
         if time_diff_hours < 0:
             time_diff_hours += 24.0
 
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
-        sun_res = swe.calc_ut(sunrise_jd, swe.SUN, flags)
+        sun_res = ctx.ephemeris.calc_ut(sunrise_jd, swe.SUN, flags)
         sun_rise_lon = sun_res[0][0]
 
         time_diff_mins = time_diff_hours * 60.0
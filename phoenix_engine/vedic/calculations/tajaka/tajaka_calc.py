@@ -1,9 +1,9 @@
 import swisseph as swe
 from datetime import datetime
-from typing import Dict, Any, Tuple
-
-import pytz
+from typing import Dict, Any, Optional, Tuple
 
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.infrastructure.time.julian import jd_to_datetime
 from phoenix_engine.vedic.const import SUN
 
 
@@ -14,16 +14,22 @@ class TajakaCalculator:
     """
 
     @staticmethod
-    def get_solar_return_time(natal_jd: float, target_year: int, birth_year: int) -> Tuple[float, datetime]:
+    def get_solar_return_time(
+        natal_jd: float, target_year: int, birth_year: int, ephemeris: Optional[SwissEphemeris] = None
+    ) -> Tuple[float, datetime]:
         """
         Compute precise solar return (Varshaphal) moment via Newton-Raphson.
         Returns (jd_ut, datetime_utc).
+        An ephemeris with a fitted backend can be passed to keep the iterations in-process.
         """
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+        ephemeris = ephemeris or SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
+
+        def sun_at(jd: float):
+            pos = ephemeris.calculate_planets_batch([jd], [SUN])[0, 0]
+            return float(pos[SwissEphemeris.LONGITUDE]), float(pos[SwissEphemeris.SPEED_LONGITUDE])
 
         # 1) Natal Sun longitude
-        natal_sun = swe.calc_ut(natal_jd, SUN, flags)[0][0]
+        natal_sun = sun_at(natal_jd)[0]
 
         # 2) Initial estimate using sidereal year
         SIDEREAL_YEAR_DAYS = 365.256363004
@@ -32,9 +38,7 @@ class TajakaCalculator:
 
         # 3) Newton-Raphson refinement
         for _ in range(15):
-            sun_res = swe.calc_ut(current_jd, SUN, flags | swe.FLG_SPEED)
-            current_sun_lon = sun_res[0][0]
-            sun_speed = sun_res[0][3]  # deg/day
+            current_sun_lon, sun_speed = sun_at(current_jd)  # deg, deg/day
 
             # shortest angular difference
             diff = (natal_sun - current_sun_lon + 180.0) % 360.0 - 180.0
@@ -43,14 +47,8 @@ class TajakaCalculator:
 
             current_jd += diff / sun_speed
 
-        # 4) Convert JD to aware UTC datetime
-        y, m, d, h_dec = swe.revjul(current_jd)
-        h = int(h_dec)
-        mn = int((h_dec - h) * 60)
-        s = int((((h_dec - h) * 60) - mn) * 60)
-        return_dt = datetime(y, m, d, h, mn, s, tzinfo=pytz.utc)
-
-        return current_jd, return_dt
+        # 4) Convert JD to aware UTC datetime (nearest second)
+        return current_jd, jd_to_datetime(current_jd)
 
     @staticmethod
     def calculate_muntha(natal_asc_sign: int, birth_year: int, target_year: int) -> Dict[str, Any]:
@@ -1,7 +1,11 @@
+import numpy as np
 import swisseph as swe
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from phoenix_engine.vedic.const import SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, RAHU, KETU
+from typing import List, Dict, Any, Optional, Tuple
+
+from phoenix_engine.infrastructure.astronomy.sky_cache import DailySkyCache, get_sky_cache
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.infrastructure.time.julian import SECONDS_PER_DAY, jd_to_date_strings
 
 
 class TransitCalculator:
@@ -14,10 +18,11 @@ class TransitCalculator:
     """
     
     PLANET_IDS = {
-        "Sun": SUN, "Moon": MOON, "Mars": MARS, "Mercury": MERCURY,
-        "Jupiter": JUPITER, "Venus": VENUS, "Saturn": SATURN,
-        "Rahu": RAHU, "Ketu": KETU
+        "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
+        "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
+        "Rahu": swe.TRUE_NODE, "Ketu": None  # Ketu is derived from Rahu
     }
+    EPHEMERIS_BODIES = [p_id for p_id in PLANET_IDS.values() if p_id is not None]
 
     @staticmethod
     def get_nakshatra(lon: float) -> Dict[str, Any]:
@@ -35,39 +40,64 @@ class TransitCalculator:
         }
 
     @staticmethod
-    def get_daily_transits(start_date: datetime, days_count: int = 30) -> List[Dict[str, Any]]:
+    def get_daily_transit_array(
+        start_date: datetime,
+        days_count: int = 30,
+        ephemeris: Optional[SwissEphemeris] = None,
+        hour: float = 12.0,
+        sidereal_mode: int = swe.SIDM_LAHIRI,
+        sky_cache: Optional[DailySkyCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Array form of the daily transit series (one sample per day at `hour` UT).
+        Returns (jds, positions) where positions has shape (days, len(PLANET_IDS), 2):
+        sidereal longitude and speed, in PLANET_IDS order (Ketu derived from Rahu).
+        Without an explicit ephemeris the rows come from the process-wide DailySkyCache.
+        """
+        jd0 = swe.julday(start_date.year, start_date.month, start_date.day, hour)
+        jds = jd0 + np.arange(days_count, dtype=float)
+
+        def compute(sample_jds: np.ndarray) -> np.ndarray:
+            source = ephemeris or SwissEphemeris(sidereal_mode=sidereal_mode)
+            raw = source.calculate_planets_batch(sample_jds, TransitCalculator.EPHEMERIS_BODIES)
+            positions = np.empty((len(sample_jds), len(TransitCalculator.PLANET_IDS), 2))
+            positions[:, :-1, 0] = raw[:, :, SwissEphemeris.LONGITUDE]
+            positions[:, :-1, 1] = raw[:, :, SwissEphemeris.SPEED_LONGITUDE]
+            positions[:, -1, 0] = (positions[:, -2, 0] + 180.0) % 360.0
+            positions[:, -1, 1] = positions[:, -2, 1]
+            return positions
+
+        if ephemeris is not None:
+            return jds, compute(jds)
+
+        cache = sky_cache or get_sky_cache()
+        day0 = DailySkyCache.day_number(start_date.year, start_date.month, start_date.day)
+        return jds, cache.get_rows(day0 + np.arange(days_count), hour, sidereal_mode, compute)
+
+    @staticmethod
+    def get_daily_transits(
+        start_date: datetime, days_count: int = 30, ephemeris: Optional[SwissEphemeris] = None
+    ) -> List[Dict[str, Any]]:
         """
         تولید داده‌های سری زمانی (Time Series) برای آنالیز Gochar.
         """
+        _, positions = TransitCalculator.get_daily_transit_array(start_date, days_count, ephemeris)
+        planet_names = list(TransitCalculator.PLANET_IDS)
+        dates, timestamps = TransitCalculator.day_labels(start_date, days_count)
+
         results = []
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-        current_date = start_date
-        
-        for _ in range(days_count):
-            jd = swe.julday(current_date.year, current_date.month, current_date.day, 12.0)
-            
+        for date, timestamp, day_positions in zip(dates, timestamps, positions.tolist()):
             daily_snapshot = {
-                "date": current_date.strftime("%Y-%m-%d"),
-                "timestamp": current_date.timestamp(),
+                "date": date,
+                "timestamp": timestamp,
                 "planets": {}
             }
-            
-            for p_name, p_id in TransitCalculator.PLANET_IDS.items():
-                flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_SPEED
-                
-                if p_name == "Ketu":
-                    rahu_res = swe.calc_ut(jd, RAHU, flags)
-                    lon = (rahu_res[0][0] + 180.0) % 360.0
-                    speed = rahu_res[0][3]
-                else:
-                    res = swe.calc_ut(jd, p_id, flags)
-                    lon = res[0][0]
-                    speed = res[0][3]
-                
+
+            for p_name, (lon, speed) in zip(planet_names, day_positions):
                 sign_id = int(lon / 30.0) + 1
                 degree_in_sign = lon % 30.0
                 nak_info = TransitCalculator.get_nakshatra(lon)
-                
+
                 daily_snapshot["planets"][p_name] = {
                     "longitude": round(lon, 6),
                     "sign": sign_id,
@@ -76,12 +106,22 @@ class TransitCalculator:
                     "speed": speed,
                     "is_retro": speed < 0
                 }
-            
+
             results.append(daily_snapshot)
-            current_date += timedelta(days=1)
-            
+
         return results
 
+    @staticmethod
+    def day_labels(start_date: datetime, days_count: int) -> Tuple[List[str], List[float]]:
+        """Date strings and timestamps of the daily series rows."""
+        jd0 = swe.julday(start_date.year, start_date.month, start_date.day, 12.0)
+        dates = jd_to_date_strings(jd0 + np.arange(days_count, dtype=float))
+        if start_date.tzinfo is not None and start_date.tzinfo.utcoffset(None) is not None:
+            # Fixed offset (UTC): whole days are exactly 86400 s apart
+            return dates, (start_date.timestamp() + SECONDS_PER_DAY * np.arange(days_count, dtype=float)).tolist()
+        # Naive (local time) or DST-aware starts: day lengths follow the zone's rules
+        return dates, [(start_date + timedelta(days=i)).timestamp() for i in range(days_count)]
+
     @staticmethod
     def detect_ingress(daily_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
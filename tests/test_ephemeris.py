@@ -0,0 +1,126 @@
+import math
+from datetime import datetime
+
+import numpy as np
+import swisseph as swe
+
+from phoenix_engine.infrastructure.astronomy.chebyshev import ChebyshevEphemeris
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+
+JD_1997 = 2450607.1652777777
+
+
+def test_batch_matches_single_calls():
+    ephemeris = SwissEphemeris()
+    jds = JD_1997 + np.arange(5) * 0.5
+    batch = ephemeris.calculate_planets_batch(jds)
+    assert batch.shape == (5, len(ephemeris.BODY_MAP), 6)
+
+    expected = swe.calc_ut(jds[3], swe.MOON, SwissEphemeris.DEFAULT_FLAGS)[0]
+    moon_col = list(ephemeris.BODY_MAP).index(swe.MOON)
+    assert np.allclose(batch[3, moon_col], expected)
+
+    planets = ephemeris.calculate_planets(JD_1997)
+    assert planets == ephemeris.planet_dicts(batch[0])
+    assert planets["Ketu"]["longitude"] == (planets["Rahu"]["longitude"] + 180.0) % 360.0
+
+
+def test_daily_transits_built_from_array():
+    jds, positions = TransitCalculator.get_daily_transit_array(datetime(2024, 1, 1), days_count=3)
+    assert positions.shape == (3, len(TransitCalculator.PLANET_IDS), 2)
+    assert jds[1] - jds[0] == 1.0
+
+    series = TransitCalculator.get_daily_transits(datetime(2024, 1, 1), days_count=3)
+    assert [d["date"] for d in series] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert series[2]["planets"]["Moon"]["longitude"] == round(positions[2, 1, 0], 6)
+
+
+def test_chebyshev_backend_tracks_swiss_ephemeris():
+    fit = ChebyshevEphemeris.fit(JD_1997, JD_1997 + 40, bodies=[swe.SUN, swe.MOON])
+    assert set(fit.max_error) == {swe.SUN, swe.MOON}
+    assert fit.max_error[swe.MOON]["longitude"] < 1e-4
+
+    jds = JD_1997 + np.linspace(0, 40, 97)
+    fitted = SwissEphemeris(backend=fit).calculate_planets_batch(jds, [swe.SUN, swe.MOON])
+    exact = SwissEphemeris().calculate_planets_batch(jds, [swe.SUN, swe.MOON])
+    lon_err = (fitted[..., 0] - exact[..., 0] + 180.0) % 360.0 - 180.0
+    assert np.abs(lon_err).max() < 1e-4
+    assert np.abs(fitted[..., 3] - exact[..., 3]).max() < 1e-2
+
+
+def test_chart_context_ephemeris_cache_counts_reuse():
+    from phoenix_engine.core.context import ChartContext
+    from phoenix_engine.domain.config import ChartConfig
+    from phoenix_engine.domain.input import BirthData
+    from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemerisEngine
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+
+    bd = BirthData(year=1997, month=6, day=7, hour=15, minute=58, timezone="UTC", lat=35.69, lon=51.39)
+    ctx = ChartContext(bd, ChartConfig())
+    ctx.jd_ut = JD_1997
+
+    BirthChartPlugin(ctx.config).execute(ctx)
+    body_count = len(SwissEphemeris().BODY_MAP)
+    assert ctx.ephemeris.stats()["misses"] == body_count
+
+    SwissEphemerisEngine(ctx.config, cache=ctx.ephemeris).calculate_planets(JD_1997, bd.lat, bd.lon)
+    assert ctx.ephemeris.stats() == {
+        "hits": body_count, "misses": body_count, "entries": body_count, "hit_rate": 0.5,
+    }
+
+
+def test_sidereal_mode_is_set_per_call_under_one_lock():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from phoenix_engine.infrastructure.astronomy.cache import EphemerisCache, sidereal_ayanamsa, sidereal_calc_ut
+
+    flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
+    jds = [JD_1997 + k for k in range(200)]
+    reference = [sidereal_calc_ut(jd, swe.MOON, flags, swe.SIDM_RAMAN)[0][0] for jd in jds]
+
+    # Constructing an engine no longer resets the process-wide mode
+    swe.set_sid_mode(swe.SIDM_RAMAN, 0, 0)
+    SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
+    assert swe.get_ayanamsa_ut(JD_1997) == sidereal_ayanamsa(JD_1997, swe.SIDM_RAMAN)
+
+    # Lahiri work on sibling threads never leaks into the Raman cache
+    cache = EphemerisCache(swe.SIDM_RAMAN)
+
+    def work(k):
+        SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI).calculate_planets_batch([jds[k]], [swe.SUN])
+        return cache.calc_ut(jds[k], swe.MOON, flags)[0][0]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(work, range(len(jds)))) == reference
+    assert cache.stats()["misses"] == len(jds)
+
+
+def test_rise_set_cache_shares_cells_and_persists(tmp_path, monkeypatch):
+    from phoenix_engine.infrastructure.astronomy.rise_set import RiseSetCache, rise_trans
+
+    rsmi = swe.CALC_RISE | swe.BIT_DISC_CENTER
+    db_path = str(tmp_path / "rise_set.db")
+    cache = RiseSetCache(db_path=db_path)
+
+    rise = cache.next_event(JD_1997 - 1.0, 35.69, 51.39, rsmi)
+    assert abs(rise - rise_trans(JD_1997 - 1.0, 35.69, 51.39, rsmi)) * 86400 < 5
+    # Same cell, later start on the same local day
+    assert cache.next_event(JD_1997 - 0.9, 35.691, 51.392, rsmi) == rise
+    assert cache.stats()["hits"] >= 1
+
+    reopened = RiseSetCache(db_path=db_path)
+    assert reopened.next_event(JD_1997 - 1.0, 35.69, 51.39, rsmi) == rise
+    assert reopened.stats()["misses"] == 0
+
+    # A day without the event (polar night) is skipped, not returned as 0.0
+    from phoenix_engine.infrastructure.astronomy import rise_set
+
+    polar = RiseSetCache()
+    first_day = int(math.floor(JD_1997 + 0.5 + 51.39 / 360.0))
+    real = rise_set.rise_trans
+    monkeypatch.setattr(rise_set, "rise_trans", lambda jd, *a: 0.0 if jd < first_day else real(jd, *a))
+    assert polar.next_event(JD_1997, 35.69, 51.39, rsmi) > JD_1997
+    monkeypatch.setattr(rise_set, "rise_trans", lambda *a: 0.0)
+    assert RiseSetCache().next_event(JD_1997, 35.69, 51.39, rsmi) == 0.0
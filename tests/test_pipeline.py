@@ -0,0 +1,433 @@
+import warnings
+
+import pytest
+
+from phoenix_engine.core.context import ChartContext
+from phoenix_engine.core.factory import ChartFactory
+from phoenix_engine.core.scheduler import PluginScheduler
+from phoenix_engine.domain.config import ChartConfig
+from phoenix_engine.domain.input import BirthData
+from phoenix_engine.plugins.base import IChartPlugin
+
+
+JD_1997 = 2450607.1652777777
+
+
+def _context():
+    bd = BirthData(year=1997, month=6, day=7, hour=15, minute=58, timezone="UTC", lat=35.69, lon=51.39)
+    ctx = ChartContext(bd, ChartConfig())
+    ctx.jd_ut = JD_1997
+    return ctx
+
+
+class _Stub(IChartPlugin):
+    def __init__(self, label, provides=(), requires=(), uses=()):
+        super().__init__()
+        self.label, self.provides, self.requires, self.uses = label, provides, requires, uses
+
+    @property
+    def name(self):
+        return self.label
+
+    def execute(self, ctx):
+        ctx.analysis.setdefault("order", []).append(self.label)
+
+
+def test_scheduler_stages_and_pruning():
+    plugins = [
+        _Stub("transit", ("transits",), ("positions", "sav"), ("dasha",)),
+        _Stub("sav", ("sav",), ("positions",)),
+        _Stub("dasha", ("dasha",), ("positions",)),
+        _Stub("varga", ("vargas",), ("positions",)),
+        _Stub("birth", ("positions",)),
+    ]
+    scheduler = PluginScheduler(plugins)
+
+    stages = [[p.name for p in stage] for stage in scheduler.plan()]
+    assert stages == [["birth"], ["sav", "dasha", "varga"], ["transit"]]
+
+    # 'uses' orders but never pulls a plugin in
+    pruned = [[p.name for p in stage] for stage in scheduler.plan(["transits"])]
+    assert pruned == [["birth"], ["sav"], ["transit"]]
+
+    with pytest.raises(ValueError):
+        PluginScheduler([_Stub("a", ("x",), ("y",)), _Stub("b", ("y",), ("x",))]).plan()
+
+
+def test_natal_pipeline_runs_in_parallel_stages():
+    ctx = _context()
+    scheduler = ChartFactory.create_scheduler("NATAL", ctx.config, max_workers=4)
+    scheduler.run(ctx)
+
+    assert len(ctx.meta["pipeline"]["stages"]) == 2
+    for section in ("vargas", "shadbala", "ashtakavarga", "jaimini", "panchanga", "dosha"):
+        assert section in ctx.analysis
+    assert {"vimshottari", "yogini", "narayana"} <= set(ctx.analysis["dashas"])
+    assert ctx.analysis["current_dasha_chain"][0]["level"] == 1
+
+    # The chain is looked up in UT whatever zone the caller's clock is in
+    from datetime import datetime, timedelta, timezone
+    import swisseph as swe
+    from phoenix_engine.vedic.calculations.dasha import DashaEngine
+    nested = ctx.analysis["dashas"]["vimshottari"]
+    boundary = nested[1]["sub_periods"][1]["start_jd"]
+    y, m, d, h = swe.revjul(boundary + 1 / 24.0)
+    utc = datetime(y, m, d, tzinfo=timezone.utc) + timedelta(hours=h)
+    local = utc.astimezone(timezone(timedelta(hours=-5)))
+    assert DashaEngine.get_current_chain(nested, local) == DashaEngine.get_current_chain(nested, utc)
+    assert DashaEngine.get_current_chain(nested, local.replace(tzinfo=None)) != DashaEngine.get_current_chain(nested, utc)
+    assert DashaEngine.get_current_chain(nested, utc) == DashaEngine.get_current_chain(nested, utc.replace(tzinfo=None))
+
+
+def test_parallel_dosha_plugins_never_drop_each_others_results():
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.plugins.doshas.kuja import KujaDoshaPlugin
+    from phoenix_engine.plugins.doshas.sarpa import KalaSarpaPlugin
+
+    ctx = _context()
+    BirthChartPlugin(ctx.config).execute(ctx)
+    # Positions are already in ctx; the stub only satisfies the 'positions' requirement
+    scheduler = PluginScheduler([_Stub("positions", ("positions",)), KujaDoshaPlugin(), KalaSarpaPlugin()], max_workers=2)
+    for _ in range(300):
+        ctx.analysis = {}
+        stages = scheduler.run(ctx)
+        assert len(stages[-1]) == 2
+        assert set(ctx.analysis["dosha"]) == {"manglik", "kala_sarpa"}
+
+
+def test_shared_panchanga_engine_serves_concurrent_charts():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from phoenix_engine.vedic.calculations.panchanga import PanchangaEngine
+
+    contexts = [_context(), _context()]
+    contexts[1].jd_ut = JD_1997 + 9.3
+    engine = PanchangaEngine(ChartConfig())
+    serial = [engine.calculate(ctx) for ctx in contexts]
+
+    # The engine keeps no per-call ephemeris, so interleaved calls never read another chart's cache
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(engine.calculate, contexts * 20))
+    assert results == serial * 20
+    assert contexts[0].ephemeris.stats()["hits"] > 0 and contexts[1].ephemeris.stats()["hits"] > 0
+
+
+def test_output_options_prune_natal_pipeline():
+    from phoenix_engine.core.scheduler import output_targets
+    from phoenix_engine.domain.config import OutputOptions
+
+    flags = {name: False for name in OutputOptions.model_fields if name.startswith("include_")}
+    options = OutputOptions(**{**flags, "include_dashas": True})
+
+    ctx = _context()
+    scheduler = ChartFactory.create_scheduler("NATAL", ctx.config)
+    stages = scheduler.run(ctx, targets=output_targets(options), strict=False)
+
+    ran = {p.name for stage in stages for p in stage}
+    assert ran == {"Birth Chart Calculator", "Timing Systems", "Advanced Dasha Systems (Phase 3)"}
+    assert "dashas" in ctx.analysis and "shadbala" not in ctx.analysis and "panchanga" not in ctx.analysis
+
+
+def test_every_output_flag_prunes_or_reports_its_sections():
+    from phoenix_engine.core.scheduler import OUTPUT_TARGETS, output_targets, requested_targets
+    from phoenix_engine.domain.config import OutputOptions
+
+    flags = {name: False for name in OutputOptions.model_fields if name.startswith("include_")}
+    assert set(OUTPUT_TARGETS) == set(flags)
+
+    scheduler = ChartFactory.create_scheduler("NATAL", _context().config)
+    for flag, resources in OUTPUT_TARGETS.items():
+        for enabled in (True, False):
+            ctx = _context()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                stages = scheduler.run(ctx, targets=output_targets(OutputOptions(**{**flags, flag: enabled})),
+                                       strict=False)
+            ran = {id(p) for stage in stages for p in stage}
+            for resource in resources:
+                provider = scheduler.providers.get(resource)
+                if provider is None:
+                    # No natal plugin computes this section: reported instead of silently dropped
+                    assert (resource in ctx.meta["pipeline"]["unprovided"]) == enabled
+                else:
+                    assert (id(provider) in ran) == enabled, (flag, resource)
+
+    # Defaults are only recorded; a warning is kept for sections the caller asked for
+    ctx = _context()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        scheduler.run(ctx, targets=output_targets(OutputOptions()), strict=False,
+                      requested=requested_targets(OutputOptions()))
+    assert "maitri" in ctx.meta["pipeline"]["unprovided"]
+
+    explicit = OutputOptions(include_maitri=True)
+    with pytest.warns(UserWarning, match="maitri") as caught:
+        scheduler.run(_context(), targets=output_targets(explicit), strict=False,
+                      requested=requested_targets(explicit))
+    assert "aspects" not in str(caught[0].message)
+
+
+def test_birth_charts_batch_matches_single_runs():
+    from phoenix_engine.core.config import ChartConfig as CoreConfig
+    from phoenix_engine.core.orchestrator import ChartOrchestrator
+
+    records = [
+        {"name": "A", "year": 1997, "month": 6, "day": 7, "hour": 15, "minute": 58, "lat": 35.69, "lon": 51.39},
+        {"name": "B", "year": 1985, "month": 11, "day": 3, "hour": 6, "minute": 5, "second": 30, "lat": 40.71, "lon": -74.0},
+        {"name": "C", "year": 2001, "month": 1, "day": 20, "hour": 23, "minute": 59, "lat": 51.51, "lon": -0.13},
+        {"name": "D", "year": 1997, "month": 6, "day": 8, "hour": 1, "minute": 0, "lat": 35.7, "lon": 51.4},
+        {"name": "bad", "year": 1997, "month": 2, "day": 30, "hour": 1, "minute": 0, "lat": 0.0, "lon": 0.0},
+    ]
+    orchestrator = ChartOrchestrator(CoreConfig())
+
+    results = dict(orchestrator.run_birth_charts_batch(records[:4], workers=2, chunk_size=1))
+    assert sorted(results) == [0, 1, 2, 3]
+    for index, record in enumerate(records[:4]):
+        single = orchestrator.run_birth_chart(**{"second": 0, **record})
+        assert results[index]["meta"] == single["meta"]
+        assert results[index]["planets"] == single["planets"]
+
+    # An invalid record is reported in place of its report; the rest of the batch still runs
+    results = dict(orchestrator.run_birth_charts_batch(records, workers=1))
+    assert isinstance(results[4], ValueError)
+    assert results[0]["meta"] == orchestrator.run_birth_chart(**{"second": 0, **records[0]})["meta"]
+
+    # A non-positive chunk size would slice every record away; it is refused instead
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(orchestrator.run_birth_charts_batch(records[:4], workers=1, chunk_size=0))
+
+
+def test_result_cache_serves_repeat_charts_from_memory_and_sqlite(tmp_path):
+    from phoenix_engine.core.config import ChartConfig as CoreConfig
+    from phoenix_engine.core.orchestrator import ChartOrchestrator
+    from phoenix_engine.core.result_cache import ChartResultCache
+
+    db = str(tmp_path / "charts.sqlite")
+    orchestrator = ChartOrchestrator(CoreConfig())
+    orchestrator.result_cache = ChartResultCache(db_path=db)
+    args = (1997, 6, 7, 15, 58, 0, 35.69, 51.39)
+
+    first = orchestrator.run_birth_chart("A", *args)
+    again = orchestrator.run_birth_chart("B", *args)
+    assert orchestrator.result_cache.stats()["hits"] == 1
+    assert again["planets"] == first["planets"] and again["houses"] == first["houses"]
+    assert again["meta"]["name"] == "B" and first["meta"]["name"] == "A"
+
+    natal_orchestrator = ChartOrchestrator(ChartConfig())
+    natal_orchestrator.result_cache = ChartResultCache()
+    natal = natal_orchestrator.run_natal_analysis("A", *args)
+    assert natal_orchestrator.run_natal_analysis("A", *args) == natal
+    assert natal_orchestrator.result_cache.stats()["hits"] == 1
+
+    # A new process (empty memory tier) reads the compressed SQLite tier
+    orchestrator.result_cache = ChartResultCache(db_path=db)
+    assert orchestrator.run_birth_chart("A", *args) == first
+    assert orchestrator.result_cache.stats()["disk_hits"] == 1
+
+    # A different engine salt never sees the old entries
+    orchestrator.result_cache = ChartResultCache(db_path=db, salt="next-deploy")
+    orchestrator.run_birth_chart("A", *args)
+    assert orchestrator.result_cache.stats()["misses"] == 1
+
+
+def test_annual_forecast_cache_skips_failed_reports_and_keeps_identity(monkeypatch):
+    from phoenix_engine.core.orchestrator import ChartOrchestrator
+    from phoenix_engine.core.result_cache import ChartResultCache
+    from phoenix_engine.vedic.calculations.tajaka.tajaka_engine import TajakaEngine
+
+    orchestrator = ChartOrchestrator(ChartConfig())
+    orchestrator.result_cache = ChartResultCache()
+    args = (1997, 6, 7, 15, 58, 0, 35.69, 51.39, 2024)
+
+    # The plugin swallows engine errors; the partial report must not be stored
+    def broken(self, *args, **kwargs):
+        raise RuntimeError("ephemeris unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(TajakaEngine, "generate_annual_report", broken)
+        assert "tajaka" not in orchestrator.run_annual_forecast("A", *args)
+    assert orchestrator.result_cache.stats()["entries"] == 0
+
+    first = orchestrator.run_annual_forecast("A", *args)
+    again = orchestrator.run_annual_forecast("B", *args)
+    assert "tajaka" in first and orchestrator.result_cache.stats()["hits"] == 1
+    assert first["meta"]["name"] == "A" and again["meta"]["name"] == "B"
+    assert again["meta"]["original_input"] == "1997-06-07 15:58:00"
+
+
+def test_vimshottari_tree_expands_lazily_to_prana():
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.vedic.calculations.dasha import DashaEngine
+
+    ctx = _context()
+    BirthChartPlugin(ctx.config).execute(ctx)
+    engine = DashaEngine(ctx.config)
+    tree = engine.vimshottari_tree(ctx)
+    assert tree.materialized == len(tree.roots)
+
+    # One week of prana periods only expands the branches covering that week
+    week = list(tree.periods_between(JD_1997 + 3000, JD_1997 + 3007, depth=5))
+    assert week and all(p.level == 5 for p in week)
+    assert all(a.end_jd == b.start_jd for a, b in zip(week, week[1:]))
+    assert tree.materialized < 200
+
+    chain = tree.chain_at(JD_1997 + 3003)
+    assert [n.level for n in chain] == [1, 2, 3, 4, 5]
+    assert all(n.start_jd <= JD_1997 + 3003 < n.end_jd for n in chain)
+    assert chain[-1] in week
+
+    # Sub-periods of every node tile their parent exactly
+    parent = chain[3]
+    kids = tree.children(parent)
+    assert kids[0].lord == parent.lord and abs(kids[-1].end_jd - parent.end_jd) < 1e-6
+
+    # The legacy two-level layout is unchanged
+    assert engine.calculate_vimshottari(ctx) == tree.to_list(depth=2)
+    assert all(not ad["sub_periods"] for md in tree.to_list(depth=2) for ad in md["sub_periods"])
+
+
+def test_dasha_interval_index_answers_active_period_queries():
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.vedic.calculations.dasha import DashaEngine
+    from phoenix_engine.vedic.calculations.dashas.interval_index import DashaIntervalIndex
+
+    ctx = _context()
+    BirthChartPlugin(ctx.config).execute(ctx)
+    tree = DashaEngine(ctx.config).vimshottari_tree(ctx)
+    index = DashaIntervalIndex.from_tree(tree, depth=2)
+
+    jds = [JD_1997 + 10 + 977 * k for k in range(30)]
+    rows = index.active_indices(jds)
+    for jd, row in zip(jds, rows):
+        expected = tree.chain_at(jd, depth=2)
+        assert [index.periods[lv][i]["lord"] for lv, i in enumerate(row)] == [n.lord for n in expected]
+    assert index.labels_at(jds) == [tree.chain_at(jd, depth=1)[0].lord for jd in jds]
+    assert index.labels_at([JD_1997 - 1e6]) == [None]
+
+    # Range query: the antar periods overlapping one year, in order and contiguous
+    year = index.periods_between(JD_1997 + 5000, JD_1997 + 5365, level=2)
+    assert year and year[0]["start_jd"] <= JD_1997 + 5000 and year[-1]["end_jd"] > JD_1997 + 5365
+    assert all(abs(a["end_jd"] - b["start_jd"]) < 1e-6 for a, b in zip(year, year[1:]))
+
+    # Date-string lists with only end dates (Chara style) chain from the opening JD
+    chara = [{"sign_name": "Aries", "end_date": "2000-01-01"}, {"sign_name": "Taurus", "end_date": "2010-01-01"}]
+    flat = DashaIntervalIndex.from_periods(chara, start_jd=JD_1997)
+    assert flat.labels_at([JD_1997, 2451545.0, 2455000.0, 2456000.0], field="sign_name") == [
+        "Aries", "Taurus", "Taurus", None,
+    ]
+
+
+def test_transit_pipeline_runs_end_to_end():
+    from datetime import datetime
+
+    import swisseph as swe
+
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.vedic.calculations.dasha import DashaEngine
+    from phoenix_engine.vedic.calculations.dashas.interval_index import DashaIntervalIndex
+
+    ctx = _context()
+    ctx.prediction_start_date = datetime(2024, 1, 1)
+    BirthChartPlugin(ctx.config).execute(ctx)
+    tree = DashaEngine(ctx.config).vimshottari_tree(ctx)
+    ctx.dasha_indexes["vimshottari"] = DashaIntervalIndex.from_tree(tree, depth=2)
+
+    stages = ChartFactory.create_scheduler("TRANSIT", ctx.config).run(ctx)
+    assert [p.name for p in stages[-1]] == ["Transit Analysis System (Smart Gochar - Phase 8)"]
+
+    transits = ctx.analysis["transits"]
+    assert transits["meta"]["start_date"] == "2024-01-01"
+    assert not transits["meta"]["data_integrity"]["is_sav_mocked"]
+    # The running mahadasha comes from the interval index
+    assert transits["meta"]["active_dasha"] == [tree.chain_at(swe.julday(2024, 1, 1, 0.0), depth=1)[0].lord]
+    assert len(transits["forecast"]["chronological_timeline"]) == 30
+    assert transits["events"] and all(e["date"] >= "2024-01-01" for e in transits["events"])
+
+
+def test_advanced_dashas_share_the_jd_period_tree():
+    from types import SimpleNamespace
+    from phoenix_engine.plugins.advanced_dashas import AdvancedDashasPlugin
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.vedic.calculations.dashas.periods import SAVANA_YEAR, DashaTree, year_length
+    from phoenix_engine.vedic.calculations.dashas.yogini import YoginiDashaEngine
+
+    ctx = _context()
+    BirthChartPlugin(ctx.config).execute(ctx)
+    AdvancedDashasPlugin().execute(ctx)
+
+    for system in ("yogini", "chara_knr", "narayana", "sudasa"):
+        tree = ctx.dasha_trees[system]
+        periods = ctx.analysis["dashas"][system]
+        assert isinstance(tree, DashaTree) and len(periods) == 12
+        assert periods[0]["start_jd"] == JD_1997
+        assert all(a["end_jd"] == b["start_jd"] for a, b in zip(periods, periods[1:]))
+        # Sub-periods tile their parent, and the index sees the same chain as the tree
+        maha = tree.roots[1]
+        kids = tree.children(maha)
+        assert kids[0].start_jd == maha.start_jd and abs(kids[-1].end_jd - maha.end_jd) < 1e-6
+        jd = JD_1997 + 5000
+        assert [p["lord"] for p in ctx.dasha_indexes[system].chain_at(jd)] == [n.lord for n in tree.chain_at(jd, depth=2)]
+
+    # The first yogini started before birth: its balance runs from birth, its antars from the true start
+    yogini = ctx.dasha_trees["yogini"]
+    assert yogini.roots[0].start_jd < JD_1997 < yogini.roots[0].end_jd
+    assert [n.lord for n in yogini.children(yogini.roots[0])][0] == yogini.roots[0].lord
+
+    # One year-length setting drives every system
+    assert year_length(SimpleNamespace(dasha_year_type="SAVANA")) == SAVANA_YEAR
+    savana = YoginiDashaEngine.tree(ctx.planets["Moon"].longitude, JD_1997, SAVANA_YEAR)
+    assert abs((savana.roots[1].end_jd - savana.roots[1].start_jd) - savana.roots[1].duration_years * 360) < 1e-6
+
+
+def test_chara_dasha_antardashas_follow_their_mahadasha_sign():
+    from phoenix_engine.plugins.birth_plugin import BirthChartPlugin
+    from phoenix_engine.vedic.calculations.dashas.chara import CharaDashaEngine
+    from phoenix_engine.vedic.calculations.dashas.periods import SIDEREAL_YEAR
+
+    ctx = _context()
+    BirthChartPlugin(ctx.config).execute(ctx)
+    tree = CharaDashaEngine.tree(int(ctx.ascendant / 30) + 1, ctx.planets, JD_1997)
+
+    antars = {maha.info["sign"]: [n.info["sign"] for n in tree.children(maha)] for maha in tree.roots}
+    assert len(antars) == 12
+    # Savya Aries runs forward from Taurus, apasavya Cancer backward from Gemini
+    assert antars[1][:3] == [2, 3, 4] and antars[4][:3] == [3, 2, 1]
+    # Boundaries are counted in sidereal years
+    first = tree.roots[0]
+    assert abs((first.end_jd - first.start_jd) - first.duration_years * SIDEREAL_YEAR) < 1e-6
+
+
+def test_panchanga_calendar_streams_days_from_shared_boundaries():
+    from datetime import date
+
+    import numpy as np
+    import swisseph as swe
+
+    from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+    from phoenix_engine.vedic.calculations.events import EventFinder
+    from phoenix_engine.vedic.calculations.panchanga_calendar import PanchangaCalendar
+
+    calendar = PanchangaCalendar.covering(date(2024, 1, 1), 40, chunk_days=15)
+    ephemeris = SwissEphemeris(sidereal_mode=swe.SIDM_LAHIRI)
+    sizes = {"tithi": 12.0, "karana": 6.0, "nakshatra": 360.0 / 27.0, "yoga": 360.0 / 27.0}
+
+    # The same boundaries serve two cities; only the day windows differ
+    for lat, lon in [(28.61, 77.21), (51.51, -0.13)]:
+        days = list(calendar.days(lat, lon, date(2024, 1, 1), 40))
+        assert len(days) == 40 and days[0]["vara"]["name"] == "Monday"
+        for day in days:
+            sun, moon = ephemeris.calculate_planets_batch([day["sunrise_jd"]], [swe.SUN, swe.MOON])[0, :, 0]
+            values = {"tithi": (moon - sun) % 360.0, "karana": (moon - sun) % 360.0,
+                      "nakshatra": moon, "yoga": (moon + sun) % 360.0}
+            for limb, size in sizes.items():
+                periods = day[limb]
+                # The limb running at sunrise comes first, then every one starting before next sunrise
+                assert periods[0]["index"] == int(values[limb] / size) + 1
+                assert periods[0]["start_jd"] <= day["sunrise_jd"] < periods[0]["end_jd"]
+                assert periods[-1]["end_jd"] >= day["next_sunrise_jd"]
+                assert all(a["end_jd"] == b["start_jd"] for a, b in zip(periods, periods[1:]))
+
+    # Boundaries are exact: the elongation at a tithi end is a multiple of 12 degrees
+    jds, units = calendar.boundaries["tithi"]
+    sun, moon = ephemeris.calculate_planets_batch(jds[:5], [swe.SUN, swe.MOON])[:, :, 0].T
+    assert np.all(np.abs(EventFinder.angular_offset((moon - sun) % 360.0, units[:5] * 12.0)) < 1e-5)
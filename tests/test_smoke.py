@@ -1,4 +1,5 @@
 
+import pytest
 from phoenix_engine.api.app import app
 from fastapi.testclient import TestClient
 
@@ -34,3 +35,185 @@ def test_invalid_lat_lon_rejected():
     }
     response = client.post("/calculate", json=bad)
     assert response.status_code == 422
+
+
+def test_batch_endpoint_streams_ndjson_with_per_item_errors():
+    import json
+
+    good = {"birth_data": {"year": 1997, "month": 6, "day": 7, "hour": 20, "minute": 28,
+                           "timezone": "Asia/Tehran", "lat": 35.69, "lon": 51.39}, "name": "Mehran"}
+    bad = {"birth_data": {**good["birth_data"], "lat": 999}}
+    body = "\n".join(json.dumps(item) for item in [good, bad, good])
+
+    response = client.post("/calculate/batch", content=body, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 200
+    lines = sorted((json.loads(line) for line in response.text.splitlines()), key=lambda line: line["index"])
+    assert [line["status"] for line in lines] == [200, 422, 200]
+    assert lines[0]["result"] == lines[2]["result"]
+    assert lines[0]["result"]["meta"]["geo_timezone"] == "Asia/Tehran"
+
+    from phoenix_engine.api import app as app_module
+    too_many = [good] * (app_module.BATCH_MAX_ITEMS + 1)
+    assert client.post("/calculate/batch", json=too_many).status_code == 413
+
+    # NDJSON parsing stops at item BATCH_MAX_ITEMS + 1: the broken line after it is never read
+    ndjson = "\n".join([json.dumps(good)] * (app_module.BATCH_MAX_ITEMS + 1) + ["{not json"])
+    response = client.post("/calculate/batch", content=ndjson, headers={"content-type": "application/x-ndjson"})
+    assert response.status_code == 413
+
+    # Oversized bodies are refused from their length, before any parsing
+    huge = b"[" + b" " * app_module.BATCH_MAX_BYTES + b"]"
+    assert client.post("/calculate/batch", content=huge).status_code == 413
+
+
+def test_compute_pool_serves_calculate_and_match():
+    from phoenix_engine.api.compute import ComputePool, get_compute_pool, set_compute_pool
+
+    previous = get_compute_pool()
+    set_compute_pool(ComputePool(workers=2))
+    try:
+        person = {"year": 1997, "month": 6, "day": 7, "hour": 20, "minute": 28,
+                  "timezone": "Asia/Tehran", "lat": 35.69, "lon": 51.39}
+        chart = client.post("/calculate", json={"birth_data": person, "name": "Mehran"})
+        assert chart.status_code == 200
+        assert chart.json()["meta"]["geo_timezone"] == "Asia/Tehran"
+
+        match = client.post("/match", json={"p1": person, "p2": {**person, "day": 9}})
+        assert match.status_code == 200
+        assert get_compute_pool().stats()["in_flight"] == 0
+    finally:
+        set_compute_pool(previous)
+
+
+def test_admission_prioritizes_interactive_and_rejects_when_full():
+    import asyncio
+
+    from phoenix_engine.api.admission import BULK, INTERACTIVE, AdmissionController, Overloaded
+
+    async def scenario():
+        controller = AdmissionController(capacity=1, max_queue=2, limits={})
+        order = []
+        gate = asyncio.Event()
+
+        async def job(label, endpoint, priority, wait=False):
+            async with controller.admit(endpoint, priority):
+                order.append(label)
+                if wait:
+                    await gate.wait()
+
+        running = asyncio.create_task(job("first", "calculate", INTERACTIVE, wait=True))
+        await asyncio.sleep(0)
+        bulk = asyncio.create_task(job("bulk", "batch", BULK))
+        interactive = asyncio.create_task(job("interactive", "calculate", INTERACTIVE))
+        await asyncio.sleep(0)
+        assert controller.stats()["queue_depth_by_priority"] == {"interactive": 1, "bulk": 1}
+
+        with pytest.raises(Overloaded) as excinfo:
+            async with controller.admit("calculate", INTERACTIVE):
+                pass
+        assert excinfo.value.retry_after >= 1
+
+        gate.set()
+        await asyncio.gather(running, bulk, interactive)
+        assert order == ["first", "interactive", "bulk"]
+        stats = controller.stats()
+        assert stats["admitted"] == 3 and stats["rejected"] == 1 and stats["active"] == 0
+
+    asyncio.run(scenario())
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200 and "queue_depth" in metrics.json()["admission"]
+
+
+def test_single_flight_coalesces_identical_chart_requests():
+    import asyncio
+
+    from phoenix_engine.api.coalesce import SingleFlight, chart_key
+    from phoenix_engine.core.models import ChartRequest
+
+    person = {"year": 1997, "month": 6, "day": 7, "hour": 20, "minute": 28,
+              "timezone": "Asia/Tehran", "lat": 35.69, "lon": 51.39}
+    a = ChartRequest(birth_data=person, name="A")
+    b = ChartRequest(birth_data={**person, "timezone": "UTC"}, name="B")
+    c = ChartRequest(birth_data={**person, "minute": 29})
+    assert chart_key(a) == chart_key(b) != chart_key(c)
+
+    async def scenario():
+        flight, calls = SingleFlight(), []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"meta": {"name": "A"}}
+
+        results = await asyncio.gather(*(flight.do(chart_key(a), compute) for _ in range(5)))
+        assert len(calls) == 1 and all(r is results[0] for r in results)
+        assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+    asyncio.run(scenario())
+
+
+def test_calculate_etag_and_conditional_get():
+    query = {"year": 1997, "month": 6, "day": 7, "hour": 20, "minute": 28,
+             "lat": 35.69, "lon": 51.39, "name": "Mehran", "sections": "dashas,panchanga"}
+    first = client.get("/calculate", params=query)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and "max-age" in first.headers["cache-control"]
+    assert first.json()["dashas"] and first.json().get("shadbala") is None
+
+    revalidated = client.get("/calculate", params=query, headers={"If-None-Match": f'W/"x", {etag}'})
+    assert revalidated.status_code == 304 and revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+    # POST with the same chart (same sections) carries the same validator
+    output = {f: f in ("include_dashas", "include_panchanga") for f in
+              ("include_vargas", "include_shadbala", "include_ashtakavarga", "include_yogas", "include_jaimini",
+               "include_maitri", "include_aspects", "include_avasthas", "include_bhavabala", "include_phala",
+               "include_doshas", "include_dashas", "include_panchanga", "include_semantics")}
+    body = {"birth_data": {**{k: query[k] for k in ("year", "month", "day", "hour", "minute", "lat", "lon")},
+                           "timezone": "UTC"}, "name": "Mehran", "config": {"output": output}}
+    assert client.post("/calculate", json=body, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/calculate", params={**query, "name": "Other"}).headers["etag"] != etag
+    assert client.get("/calculate", params={**query, "sections": "nope"}).status_code == 422
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_responses_conform_to_chart_output(monkeypatch, use_orjson):
+    import numpy as np
+
+    from phoenix_engine.api import app as app_module
+    from phoenix_engine.api import serialization
+    from phoenix_engine.core.models import ChartOutput
+
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+
+    body = {"birth_data": {"year": 1997, "month": 6, "day": 7, "hour": 20, "minute": 28,
+                           "timezone": "Asia/Tehran", "lat": 35.69, "lon": 51.39}, "name": "Mehran"}
+    validated = client.post("/calculate", json=body)
+
+    monkeypatch.setattr(app_module, "FAST_RESPONSES", True)
+    fast = client.post("/calculate", json=body)
+    # Different bytes, so a different strong validator
+    assert fast.status_code == 200 and fast.headers["etag"] != validated.headers["etag"]
+    assert client.post("/calculate", json=body, headers={"If-None-Match": validated.headers["etag"]}).status_code == 200
+
+    # The raw fast bytes already hold the validated document, every default section included
+    assert set(fast.json()) == set(ChartOutput.model_fields)
+    assert fast.json() == validated.json()
+
+    # Non-finite floats become null on both encoders instead of failing the response
+    assert serialization.dumps({"a": float("nan"), "b": [np.float64("inf"), 1.5]}) == b'{"a":null,"b":[null,1.5]}'
+
+
+def test_fast_responses_are_enabled_from_the_environment(monkeypatch):
+    from phoenix_engine.api import app as app_module
+
+    monkeypatch.delenv("PHOENIX_FAST_RESPONSES", raising=False)
+    assert app_module._env_flag("PHOENIX_FAST_RESPONSES") is False
+    for value, enabled in (("1", True), ("true", True), (" On ", True), ("0", False), ("no", False), ("", False)):
+        monkeypatch.setenv("PHOENIX_FAST_RESPONSES", value)
+        assert app_module._env_flag("PHOENIX_FAST_RESPONSES") is enabled, value
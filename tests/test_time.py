@@ -0,0 +1,64 @@
+from phoenix_engine.infrastructure.time.timezone import TimezoneResolver
+
+
+def test_timezone_resolver_caches_cells_and_handles_boundaries():
+    resolver = TimezoneResolver(cell_deg=0.01)
+
+    assert resolver.timezone_at(35.6892, 51.3890) == "Asia/Tehran"
+    # Another point of the same (uniform) cell is answered from the cache
+    assert resolver.timezone_at(35.6895, 51.3893) == "Asia/Tehran"
+    assert resolver.stats()["hits"] == 1
+
+    # Points either side of the Spain/Portugal border agree with an exact lookup
+    for lat, lon in [(41.86, -6.6), (41.86, -6.2), (42.0, -8.2), (38.0, -7.2)]:
+        assert resolver.timezone_at(lat, lon) == resolver.finder.timezone_at(lng=lon, lat=lat)
+        assert resolver.timezone_at(lat, lon) == resolver.finder.timezone_at(lng=lon, lat=lat)
+
+
+def test_local_to_utc_matches_pytz_and_flags_dst_edges():
+    from datetime import datetime
+
+    import pytz
+
+    from phoenix_engine.infrastructure.time.offsets import (
+        AMBIGUOUS, NONEXISTENT, OK, get_offset_table, local_to_utc,
+    )
+
+    naive = [
+        datetime(2023, 3, 12, 2, 30),   # spring-forward gap
+        datetime(2023, 11, 5, 1, 30),   # fall-back overlap
+        datetime(1990, 7, 1, 12, 0),
+        datetime(1883, 1, 1, 12, 0),    # local mean time, before standard zones
+    ]
+    utc, offsets, status = local_to_utc("America/New_York", naive)
+
+    assert status.tolist() == [NONEXISTENT, AMBIGUOUS, OK, OK]
+    tz = pytz.timezone("America/New_York")
+    for dt, got in zip(naive, utc):
+        expected = tz.localize(dt).astimezone(pytz.UTC).replace(tzinfo=None)
+        assert got.astype(datetime) == expected
+    assert get_offset_table("America/New_York").to_utc(naive[2]) == tz.localize(naive[2]).astimezone(pytz.UTC)
+
+
+def test_julian_day_conversion_matches_swisseph():
+    import numpy as np
+    import swisseph as swe
+
+    from phoenix_engine.infrastructure.time.julian import (
+        calendar_to_jd, jd_to_calendar, jd_to_date_strings, jd_to_datetime, jd_to_iso,
+    )
+
+    jds = np.random.default_rng(7).uniform(swe.julday(1, 1, 1, 0), swe.julday(3000, 1, 1, 0), 5000)
+    expected = []
+    for jd in jds:
+        y, m, d, _ = swe.revjul(jd)
+        expected.append(f"{y:04d}-{m:02d}-{int(d):02d}")
+    assert jd_to_date_strings(jds) == expected
+
+    year, month, day, second = jd_to_calendar(jds)
+    assert np.all(np.abs(calendar_to_jd(year, month, day, second) - jds) * 86400 <= 0.5 + 1e-3)
+    assert calendar_to_jd([2024], [2], [29], [43200])[0] == swe.julday(2024, 2, 29, 12.0)
+
+    # Rounded to the second, carrying into the next day
+    assert jd_to_iso([2451545.0, 2451545.49999999]) == ["2000-01-01T12:00:00", "2000-01-02T00:00:00"]
+    assert jd_to_datetime(2451545.25).isoformat() == "2000-01-01T18:00:00+00:00"
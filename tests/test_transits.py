@@ -0,0 +1,120 @@
+import numpy as np
+import swisseph as swe
+
+from phoenix_engine.infrastructure.astronomy.swiss import SwissEphemeris
+from phoenix_engine.vedic.calculations.events import EventFinder
+
+
+JD_2024 = swe.julday(2024, 1, 1, 0.0)
+
+
+def test_event_finder_exact_crossings_and_stations():
+    finder = EventFinder()
+    events = finder.find(JD_2024, JD_2024 + 120, planets=["Moon", "Mercury"])
+
+    moon_ingresses = [e for e in events if e["planet"] == "Moon" and e["type"] == "Ingress"]
+    assert 50 <= len(moon_ingresses) <= 56
+
+    # Mercury's April 2024 retrograde: station, backwards ingress into Pisces, station again
+    mercury = [e for e in events if e["planet"] == "Mercury" and e["type"] in ("Ingress", "Station")]
+    retro_ingress = [e for e in mercury if e["type"] == "Ingress" and e["is_retro"]]
+    assert [(e["from"], e["to"]) for e in retro_ingress] == [("Aries", "Pisces")]
+    stations = [e for e in mercury if e["type"] == "Station"]
+    assert [e["to"] for e in stations] == ["Direct", "Retrograde", "Direct"]
+    assert all(abs(e["longitude"] - finder._longitude("Mercury", e["jd"])) < 1e-6 for e in stations)
+
+    for e in events:
+        if "boundary" in e:
+            lon = finder.track(e["planet"], [e["jd"]])[0][0]
+            assert abs(finder.angular_offset(lon, e["boundary"])) < 1e-4  # well under a minute of motion
+    assert events == sorted(events, key=lambda e: e["jd"])
+
+
+def test_event_calendar_round_trip_and_range_query(tmp_path):
+    from phoenix_engine.vedic.calculations.event_calendar import TransitEventCalendar
+
+    kinds = ["sign", "station", "combustion"]
+    calendar = TransitEventCalendar.build(JD_2024, JD_2024 + 200, kinds=kinds, chunk_days=60)
+    path = str(tmp_path / "events.npy")
+    calendar.save(path)
+    loaded = TransitEventCalendar.load(path)
+    assert len(loaded) == len(calendar)
+    assert loaded.covers(JD_2024 + 10, JD_2024 + 40, ["sign"])
+    assert not loaded.covers(JD_2024 + 10, JD_2024 + 40, ["pada"])
+
+    expected = EventFinder().find(JD_2024 + 10, JD_2024 + 40, planets=["Moon", "Mercury"], kinds=kinds)
+    got = loaded.query(JD_2024 + 10, JD_2024 + 40, planets=["Moon", "Mercury"])
+    assert [(e["planet"], e["type"], e["to"]) for e in got] == [(e["planet"], e["type"], e["to"]) for e in expected]
+    assert max(abs(a["jd"] - b["jd"]) for a, b in zip(got, expected)) < 1e-5
+    assert [e.get("longitude") for e in got] == [e.get("longitude") for e in expected]
+
+    # Both use half-open ranges: adjacent windows split the events without repeating one
+    split = JD_2024 + 25
+    first, second = loaded.query(JD_2024 + 10, split), loaded.query(split, JD_2024 + 40)
+    assert first + second == loaded.query(JD_2024 + 10, JD_2024 + 40)
+
+
+def test_daily_sky_cache_serves_repeat_windows():
+    from datetime import datetime
+
+    from phoenix_engine.infrastructure.astronomy.sky_cache import DailySkyCache
+    from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+    cache = DailySkyCache(max_bytes=20 * 9 * 2 * 8)  # room for 20 rows
+    cache.warm(days=10, start=datetime(2024, 1, 1))
+    jds, cached = TransitCalculator.get_daily_transit_array(datetime(2024, 1, 5), days_count=10, sky_cache=cache)
+    assert cache.stats()["hits"] == 6 and cache.stats()["misses"] == 14
+
+    _, direct = TransitCalculator.get_daily_transit_array(
+        datetime(2024, 1, 5), days_count=10, ephemeris=SwissEphemeris()
+    )
+    assert np.array_equal(cached, direct)
+    assert jds[0] == swe.julday(2024, 1, 5, 12.0)
+
+    TransitCalculator.get_daily_transit_array(datetime(2024, 3, 1), days_count=15, sky_cache=cache)
+    assert cache.stats()["entries"] == 20
+
+
+def _per_day_transit_yogas(signs):
+    """The former one-day-at-a-time transit yoga rules, kept as the reference."""
+    yogas = []
+    if (signs["Jupiter"] - signs["Moon"]) % 12 in (0, 3, 6, 9):
+        yogas.append("Gaja Kesari (Transit): Reputation & Success")
+    if signs["Sun"] == signs["Mercury"]:
+        yogas.append("Budhaditya (Transit): Intelligence & Communication")
+    if signs["Moon"] == signs["Mars"]:
+        yogas.append("Chandra Mangala (Transit): Wealth & Earnings")
+    if (signs["Mars"] - signs["Jupiter"]) % 12 in (0, 6):
+        yogas.append("Guru Mangala (Transit): High Energy & Leadership")
+    return yogas
+
+
+def test_gochar_grid_matches_nested_timeline():
+    from datetime import datetime
+
+    from phoenix_engine.vedic.calculations.gochar import GocharEngine
+    from phoenix_engine.vedic.calculations.transit_calc import TransitCalculator
+
+    start = datetime(2024, 1, 1)
+    sav = list(range(20, 32))
+    natal = {"Moon": {"longitude": 100.0}}  # Cancer, given as a plain dict
+    context = {"active_dasha_lords": ["Jupiter"]}
+
+    nested = GocharEngine.analyze_smart_series(
+        TransitCalculator.get_daily_transits(start, days_count=40), natal, 3, sav, context
+    )["chronological_timeline"]
+    columns = GocharEngine.analyze_smart_series(
+        TransitCalculator.get_daily_transits(start, days_count=40), natal, 3, sav, context, columnar=True
+    )["columnar_timeline"]
+
+    assert len(nested) == 40 and columns["planets"] == list(nested[0]["planets"])
+    assert "Rahu" not in columns["planets"]
+    for d, day in enumerate(nested):
+        for j, (name, cell) in enumerate(day["planets"].items()):
+            sign = cell["coordinates"]["sign_id"]
+            assert cell["houses"]["from_lagna"] == columns["house_from_lagna"][d][j] == (sign - 3) % 12 + 1
+            assert cell["houses"]["from_moon"] == (sign - 4) % 12 + 1
+            assert cell["strength"]["sav_points"] == sav[sign - 1]
+            assert cell["context"]["is_dasha_lord"] == (name == "Jupiter")
+        signs = {p: c["coordinates"]["sign_id"] for p, c in day["planets"].items()}
+        assert day["global_yogas"] == _per_day_transit_yogas(signs)